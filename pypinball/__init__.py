@@ -1,15 +1,21 @@
 from . import (
+    asset_loader,
     audio,
+    benchmark,
     display,
     domain,
     events,
+    frame_profiler,
     inputs,
     lives,
     log,
     main,
     physics,
+    profiling,
+    replay,
     resources,
     scoring,
+    simulation,
     utils,
 )
 from .audio import AudioInterface
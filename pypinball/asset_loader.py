@@ -0,0 +1,200 @@
+"""Module containing the AssetLoader class, which loads (i.e. reads and decodes) the game
+assets concurrently in a thread pool so that startup is not spent loading one file after
+another on the main thread.
+
+Loading is started with ``AssetLoader.submit()``, which returns a
+``concurrent.futures.Future``. The caches that use an asset are given the future rather
+than the loaded asset, and only wait on its result when they first need it.
+"""
+
+import concurrent.futures
+import dataclasses
+import threading
+import time
+import typing
+
+from . import log
+
+logger = log.get_logger(name=__name__)
+
+T = typing.TypeVar("T")
+
+
+@dataclasses.dataclass(frozen=True)
+class AssetTiming:
+    """
+    Timing information for loading a single asset.
+
+    - name: Name of the asset (e.g. its path).
+    - start: Time the asset started loading, relative to the creation of the loader (in seconds).
+    - duration: Time taken to load the asset (in seconds).
+    - thread: Name of the thread the asset was loaded in.
+    """
+
+    name: str
+    start: float
+    duration: float
+    thread: str
+
+    @property
+    def end(self) -> float:
+        """Get the time the asset finished loading, relative to the creation of the
+        loader.
+
+        Returns:
+            float: Time in seconds.
+        """
+        return self.start + self.duration
+
+
+def format_timing_report(timings: typing.List[AssetTiming]) -> str:
+    """Format a breakdown of the time taken to load each asset, slowest first, along with
+    the total time spent loading and the wall time until the last asset was loaded.
+
+    Args:
+        timings (list): List of asset timings.
+
+    Returns:
+        str: Multi-line report.
+    """
+    lines = [f"Loaded {len(timings)} assets:"]
+    for timing in sorted(timings, key=lambda t: t.duration, reverse=True):
+        lines.append(
+            f"  {timing.duration * 1000.0:8.1f} ms "
+            f"(done at {timing.end * 1000.0:8.1f} ms, {timing.thread}): {timing.name}"
+        )
+    total = sum(t.duration for t in timings)
+    wall = max((t.end for t in timings), default=0.0)
+    lines.append(
+        f"Total load time: {total * 1000.0:.1f} ms, wall time: {wall * 1000.0:.1f} ms"
+    )
+    return "\n".join(lines)
+
+
+class AssetLoader:
+    """The AssetLoader class loads assets in a pool of worker threads and records how
+    long each one took. Decoding images and audio is mostly done in C extensions, so
+    loading them in threads runs them concurrently.
+
+    Args:
+        max_workers (int, optional): Number of worker threads. If ``None`` the default
+            of ``concurrent.futures.ThreadPoolExecutor`` is used.
+    """
+
+    def __init__(self, max_workers: typing.Optional[int] = None) -> None:
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="AssetLoader"
+        )
+        self._created = time.perf_counter()
+        self._lock = threading.Lock()
+        self._futures: typing.List[concurrent.futures.Future] = list()
+        self._timings: typing.List[AssetTiming] = list()
+
+    def submit(
+        self,
+        name: str,
+        fn: typing.Callable[..., T],
+        *args: typing.Any,
+        **kwargs: typing.Any,
+    ) -> "concurrent.futures.Future[T]":
+        """Start loading an asset in the thread pool.
+
+        Args:
+            name (str): Name of the asset, used in the timing report.
+            fn (Callable): Method that loads the asset.
+            *args: Positional arguments for ``fn``.
+            **kwargs: Keyword arguments for ``fn``.
+
+        Returns:
+            concurrent.futures.Future: Future for the loaded asset.
+        """
+
+        def _load() -> T:
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                timing = AssetTiming(
+                    name=name,
+                    start=start - self._created,
+                    duration=end - start,
+                    thread=threading.current_thread().name,
+                )
+                with self._lock:
+                    self._timings.append(timing)
+                logger.debug(
+                    "Loaded asset: %s, time: %.1f ms", name, timing.duration * 1000.0
+                )
+
+        future = self._executor.submit(_load)
+        with self._lock:
+            self._futures.append(future)
+        return future
+
+    def get_timings(self) -> typing.List[AssetTiming]:
+        """Get the timings of the assets that have finished loading, in the order they
+        finished.
+
+        Returns:
+            List[AssetTiming]: Asset timings.
+        """
+        with self._lock:
+            return list(self._timings)
+
+    def format_report(self) -> str:
+        """Get a breakdown of the time taken to load each asset that has finished
+        loading (see ``format_timing_report()``).
+
+        Returns:
+            str: Multi-line report.
+        """
+        return format_timing_report(timings=self.get_timings())
+
+    def wait(self, timeout: typing.Optional[float] = None) -> bool:
+        """Wait for all of the submitted assets to finish loading.
+
+        Args:
+            timeout (float, optional): Maximum time to wait (in seconds).
+
+        Returns:
+            bool: ``True`` if all the assets have finished loading, else ``False``.
+        """
+        with self._lock:
+            futures = list(self._futures)
+        _, not_done = concurrent.futures.wait(futures, timeout=timeout)
+        return len(not_done) == 0
+
+    def on_all_done(self, callback: typing.Callable[[], None]) -> None:
+        """Call a method once all of the assets submitted so far have finished loading.
+        The method is called from the thread that loaded the last asset, or straight
+        away if there is nothing left to load.
+
+        Args:
+            callback (Callable): Method to call.
+        """
+        with self._lock:
+            pending = [f for f in self._futures if not f.done()]
+            remaining = [len(pending)]
+
+        if not pending:
+            callback()
+            return
+
+        def _on_done(_: concurrent.futures.Future) -> None:
+            with self._lock:
+                remaining[0] -= 1
+                finished = remaining[0] == 0
+            if finished:
+                callback()
+
+        for future in pending:
+            future.add_done_callback(_on_done)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the thread pool. No more assets can be submitted afterwards.
+
+        Args:
+            wait (bool): Whether to wait for the assets being loaded to finish.
+        """
+        self._executor.shutdown(wait=wait)
@@ -1,4 +1,6 @@
+from .audio_dispatcher import AudioDispatcher, AudioDispatcherStats
 from .audio_event_handler import AudioGameEventHandler
 from .audio_interface import AudioInterface
 from .looped_audio_player import LoopedAudioPlayer
 from .simpleaudio_interface import SimpleAudio
+from .streaming_audio_player import PcmFormat, PcmRingBuffer, StreamingAudioPlayer
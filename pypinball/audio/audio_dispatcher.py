@@ -0,0 +1,190 @@
+"""Module containing the AudioDispatcher class, which plays sounds on a dedicated thread
+so that requesting a sound never blocks the caller (e.g. the physics step)."""
+
+import dataclasses
+import queue
+import threading
+import time
+import typing
+
+import simpleaudio
+
+from .. import log
+from .audio_interface import AudioInterface
+
+logger = log.get_logger(name=__name__)
+
+
+class SoundPlayer(typing.Protocol):  # pylint: disable=too-few-public-methods
+    """
+    Protocol for the object that an ``AudioDispatcher`` uses to start playing sounds
+    (e.g. the ``SimpleAudio`` class).
+    """
+
+    def start_sound_file(
+        self, file_path: str
+    ) -> typing.Optional[simpleaudio.PlayObject]:
+        """
+        Start playing a sound file, without waiting for it to finish.
+
+        Args:
+            file_path (str): Full system path to the audio file.
+
+        Returns:
+            simpleaudio.PlayObject: Handle to the playing sound, or ``None`` if the
+                sound could not be played.
+        """
+
+
+@dataclasses.dataclass
+class AudioDispatcherStats:
+    """
+    Statistics for monitoring an ``AudioDispatcher``.
+
+    - requested: Number of sounds requested.
+    - played: Number of sounds started.
+    - coalesced: Number of sounds skipped as the same sound was started within the window.
+    - dropped: Number of sounds skipped as the queue was full.
+    - stolen: Number of playing sounds stopped to stay within the voice limit.
+    - failed: Number of sounds that failed to play.
+    """
+
+    requested: int = 0
+    played: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+    stolen: int = 0
+    failed: int = 0
+
+
+class AudioDispatcher(AudioInterface):
+    """Implementation of the ``AudioInterface`` protocol that queues each request and
+    returns straight away, with the sounds being started on a dedicated thread.
+
+    On the dispatcher thread, a request for a sound that was already requested within
+    the coalescing window is skipped, so a burst of identical events (e.g. several
+    collisions in one physics step) only plays the sound once. If starting a sound would
+    exceed the maximum number of concurrent voices, the oldest playing sound is stopped.
+
+    Args:
+        player (SoundPlayer): Player used to start the sounds (e.g. ``SimpleAudio``).
+        coalesce_window (float): Window (in seconds) within which requests for the same
+            sound are coalesced.
+        max_voices (int): Maximum number of sounds playing at once.
+        max_queue_size (int): Maximum number of queued requests. Requests are dropped
+            while the queue is full.
+        clock (Callable): Method that returns the current time (in seconds).
+    """
+
+    def __init__(
+        self,
+        player: SoundPlayer,
+        coalesce_window: float = 0.05,
+        max_voices: int = 8,
+        max_queue_size: int = 64,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_voices < 1:
+            raise ValueError(f"max_voices must be at least 1, got: {max_voices}")
+        self._player = player
+        self._coalesce_window = coalesce_window
+        self._max_voices = max_voices
+        self._clock = clock
+        self._queue: "queue.Queue[typing.Optional[typing.Tuple[str, float]]]" = (
+            queue.Queue(maxsize=max_queue_size)
+        )
+        self._stats = AudioDispatcherStats()
+        self._last_requested: typing.Dict[str, float] = dict()
+        self._voices: typing.List[simpleaudio.PlayObject] = list()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def stats(self) -> AudioDispatcherStats:
+        """Get the dispatcher statistics.
+
+        Returns:
+            AudioDispatcherStats: Statistics.
+        """
+        return self._stats
+
+    def play_sound_file(self, file_path: str) -> bool:
+        """Queue a sound file to be played. This does not block.
+
+        Args:
+            file_path (str): Full system path to the audio file.
+
+        Returns:
+            bool: ``True`` if the sound was queued, or ``False`` if it was dropped
+                because the queue is full.
+        """
+        self._stats.requested += 1
+        try:
+            self._queue.put_nowait((file_path, self._clock()))
+        except queue.Full:
+            self._stats.dropped += 1
+            logger.warning(f"Audio queue is full, dropping sound: {file_path}")
+            return False
+        return True
+
+    def get_num_voices(self) -> int:
+        """Get the number of sounds currently playing.
+
+        Returns:
+            int: Number of voices.
+        """
+        return sum(1 for voice in list(self._voices) if voice.is_playing())
+
+    def wait(self) -> None:
+        """Wait until all of the queued requests have been handled."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Stop the dispatcher thread, after handling the queued requests, and stop all
+        of the playing sounds."""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join()
+        for voice in self._voices:
+            voice.stop()
+        self._voices.clear()
+
+    def _run(self) -> None:
+        """Target method of the dispatcher thread, which handles requests until
+        ``close()`` is called."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._handle(file_path=item[0], timestamp=item[1])
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error(f"Failed to handle audio request: {item}, {exc}")
+            finally:
+                self._queue.task_done()
+
+    def _handle(self, file_path: str, timestamp: float) -> None:
+        """Start a requested sound, unless it is coalesced with an earlier request.
+
+        Args:
+            file_path (str): Full system path to the audio file.
+            timestamp (float): Time the sound was requested.
+        """
+        last = self._last_requested.get(file_path)
+        if last is not None and timestamp - last < self._coalesce_window:
+            self._stats.coalesced += 1
+            return
+        self._last_requested[file_path] = timestamp
+
+        self._voices = [voice for voice in self._voices if voice.is_playing()]
+        while len(self._voices) >= self._max_voices:
+            self._voices.pop(0).stop()
+            self._stats.stolen += 1
+
+        voice = self._player.start_sound_file(file_path=file_path)
+        if voice is None:
+            self._stats.failed += 1
+            return
+        self._voices.append(voice)
+        self._stats.played += 1
@@ -1,5 +1,7 @@
 """Module that provides functionality for playing audio on a loop in the background."""
 
+import concurrent.futures
+import os
 import threading
 import time
 import typing
@@ -8,6 +10,8 @@ import simpleaudio
 from pydub import AudioSegment
 
 from .. import log
+from ..asset_loader import AssetLoader
+from ..resources import AssetBundle
 
 LOGGER = log.get_logger(name="Looped Audio Player")
 
@@ -18,14 +22,46 @@ class LoopedAudioPlayer:
 
     The playing of the audio itself is done in a separate thread, and starting/stopping
     the class is thread safe.
+
+    Decoding an MP3 file is slow, so if an ``AssetLoader`` is given the file is decoded
+    in it and the playback thread waits for it to finish, rather than blocking here. If
+    the file (matched by file name) is in an ``AssetBundle``, the pre-decoded audio is
+    taken from the bundle instead.
+
+    Args:
+        filename (str): Path to the audio file.
+        asset_loader (AssetLoader, optional): Loader to decode the file in.
+        bundle (AssetBundle, optional): Bundle of pre-decoded audio.
+
+    Raises:
+        FileNotFoundError: If the audio file does not exist.
     """
 
-    def __init__(self, filename: str) -> None:
+    def __init__(
+        self,
+        filename: str,
+        asset_loader: typing.Optional[AssetLoader] = None,
+        bundle: typing.Optional[AssetBundle] = None,
+    ) -> None:
         self._filename = filename
         self._is_playing = False
         self._thread: typing.Optional[threading.Thread] = None
         self._thread_lock = threading.Lock()
-        self._audio = AudioSegment.from_mp3(file=filename)
+        self._audio_future: typing.Optional[concurrent.futures.Future[AudioSegment]] = (
+            None
+        )
+        self._audio: typing.Optional[AudioSegment] = None
+        name = os.path.basename(filename)
+        if bundle is not None and name in bundle:
+            self._audio = bundle.get_audio_segment(name=name)
+        elif asset_loader is None:
+            self._audio = AudioSegment.from_mp3(file=filename)
+        else:
+            if not os.path.isfile(filename):
+                raise FileNotFoundError(f"Unable to find file: {filename}")
+            self._audio_future = asset_loader.submit(
+                filename, AudioSegment.from_mp3, file=filename
+            )
         self._obj: simpleaudio.PlayObject = None
 
     ##################
@@ -53,7 +89,7 @@ class LoopedAudioPlayer:
         Returns:
             bool: ``True`` if not audio is played, else ``False``.
         """
-        LOGGER.debug(f"Playing audio file: {self.get_filename()}")
+        LOGGER.debug("Playing audio file: %s", self._filename)
         with self._thread_lock:
             if self._is_playing:
                 return False
@@ -69,13 +105,14 @@ class LoopedAudioPlayer:
         Returns:
             bool: ``True`` if audio was playing, else ``False``.
         """
-        LOGGER.debug(f"Stopping audio file: {self.get_filename()}")
+        LOGGER.debug("Stopping audio file: %s", self._filename)
         with self._thread_lock:
             if not self.is_playing():
                 return False
 
             self._is_playing = False
-            self._obj.stop()
+            if self._obj is not None:
+                self._obj.stop()
 
             if self._thread is not None:
                 self._thread.join()
@@ -88,7 +125,16 @@ class LoopedAudioPlayer:
     ###################
     def _play_method(self) -> None:
         """This method running the playback and looping and is the target method which
-        is run in a separate thread."""
+        is run in a separate thread.
+
+        Raises:
+            RuntimeError: If there is neither decoded audio nor a pending decode.
+        """
+        if self._audio is None:
+            if self._audio_future is None:
+                raise RuntimeError(f"No audio was loaded for file: {self._filename}")
+            self._audio = self._audio_future.result()
+
         while True:
             if not self.is_playing():
                 return
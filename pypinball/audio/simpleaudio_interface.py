@@ -1,9 +1,12 @@
+import concurrent.futures
 import os
 import typing
 
 import simpleaudio
 
 from .. import log
+from ..asset_loader import AssetLoader
+from ..resources import AssetBundle
 from .audio_interface import AudioInterface
 
 logger = log.get_logger(name=__name__)
@@ -18,6 +21,9 @@ class SimpleAudio(AudioInterface):  # pylint: disable=too-few-public-methods
     def __init__(self, blocking=False) -> None:
         self._blocking = blocking
         self._cache: typing.Dict[str, simpleaudio.WaveObject] = dict()
+        self._pending: typing.Dict[
+            str, concurrent.futures.Future[simpleaudio.WaveObject]
+        ] = dict()
 
     def cached_files(self) -> typing.Set[str]:
         """Get a set of the cached files paths.
@@ -27,29 +33,75 @@ class SimpleAudio(AudioInterface):  # pylint: disable=too-few-public-methods
         """
         return set(list(self._cache.keys()))
 
+    def preload(
+        self,
+        file_paths: typing.Iterable[str],
+        asset_loader: typing.Optional[AssetLoader] = None,
+        bundle: typing.Optional[AssetBundle] = None,
+    ) -> None:
+        """Load a number of WAV files so that they are cached before they are first
+        played. Files in the asset bundle (matched by file name) are taken from it,
+        otherwise they start loading in the asset loader (or are loaded straight away if
+        there is no loader). Files that are already cached (or loading) are skipped.
+
+        Args:
+            file_paths (Iterable[str]): Paths to the WAV files.
+            asset_loader (AssetLoader, optional): Loader to load the files in.
+            bundle (AssetBundle, optional): Bundle of pre-decoded audio.
+        """
+        for file_path in file_paths:
+            if file_path in self._cache or file_path in self._pending:
+                continue
+            name = os.path.basename(file_path)
+            if bundle is not None and name in bundle:
+                self._cache[file_path] = bundle.get_wave_object(name=name)
+                continue
+            if asset_loader is None:
+                self.get_wav_sound(file_path=file_path)
+                continue
+            self._pending[file_path] = asset_loader.submit(
+                file_path, simpleaudio.WaveObject.from_wave_file, file_path
+            )
+
     def play_sound_file(self, file_path: str) -> bool:
-        logger.debug(f"Playing sound file: {file_path}")
+        play_obj = self.start_sound_file(file_path=file_path)
+        if play_obj is None:
+            return False
+
+        if self._blocking:
+            play_obj.wait_done()
+
+        return True
+
+    def start_sound_file(
+        self, file_path: str
+    ) -> typing.Optional[simpleaudio.PlayObject]:
+        """Start playing a sound file, without waiting for it to finish.
 
-        if not os.path.isfile(file_path):
+        Args:
+            file_path (str): Full system path to the audio file.
+
+        Returns:
+            simpleaudio.PlayObject: Handle to the playing sound, or ``None`` if the
+                sound could not be played.
+        """
+        logger.debug("Playing sound file: %s", file_path)
+
+        if file_path not in self._cache and not os.path.isfile(file_path):
             logger.error(
                 f"Unknown find sound file: {file_path}, skipping playing audio"
             )
-            return False
+            return None
 
         wave_obj = self.get_wav_sound(file_path=file_path)
 
         try:
-            play_obj = wave_obj.play()
+            return wave_obj.play()
         except (
             simpleaudio._simpleaudio.SimpleaudioError  # pylint: disable=protected-access, c-extension-no-member
         ) as exep:
             logger.error(f"Failed to play audio file: {file_path}, exception: {exep}")
-            return False
-
-        if self._blocking:
-            play_obj.wait_done()
-
-        return True
+            return None
 
     def get_wav_sound(self, file_path: str) -> simpleaudio.WaveObject:
         """Load a WAV object either from file or from an internal cache.
@@ -62,11 +114,15 @@ class SimpleAudio(AudioInterface):  # pylint: disable=too-few-public-methods
         """
         try:
             ret = self._cache[file_path]
-            logger.debug(f"Loaded audio file from cache: {file_path}")
+            logger.debug("Loaded audio file from cache: %s", file_path)
             return ret
 
         except KeyError:
-            wave_obj = simpleaudio.WaveObject.from_wave_file(file_path)
+            future = self._pending.pop(file_path, None)
+            if future is not None:
+                wave_obj = future.result()
+            else:
+                wave_obj = simpleaudio.WaveObject.from_wave_file(file_path)
             self._cache[file_path] = wave_obj
-            logger.debug(f"Added audio file to cache: {file_path}")
+            logger.debug("Added audio file to cache: %s", file_path)
             return wave_obj
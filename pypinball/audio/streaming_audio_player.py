@@ -0,0 +1,602 @@
+"""Module that provides functionality for streaming audio on a loop in the background.
+
+Unlike the ``LoopedAudioPlayer``, which decodes the whole file into memory up front,
+the ``StreamingAudioPlayer`` decodes the file in chunks on one thread into a bounded
+ring buffer, while another thread feeds the buffered audio to the output. When the end
+of the file is reached, decoding restarts from the beginning, and as the output is fed
+from the buffer the loop is seamless.
+"""
+
+import dataclasses
+import os
+import subprocess
+import threading
+import time
+import typing
+import wave
+
+import pygame
+from pydub import AudioSegment
+
+from .. import log
+from ..resources import AssetBundle
+
+logger = log.get_logger(name=__name__)
+
+# Default size of the chunks that audio is decoded in (in bytes).
+DEFAULT_CHUNK_SIZE = 16 * 1024
+
+# Default duration of audio that is buffered ahead of the output (in seconds).
+DEFAULT_BUFFER_SECONDS = 2.0
+
+# Default duration of each block of audio that is passed to the output (in seconds).
+DEFAULT_BLOCK_SECONDS = 0.1
+
+# Time (in seconds) to wait past the expected end of the playing block before queueing
+# the next block, which allows for the latency of the mixer.
+MIXER_LATENCY_SECONDS = 0.02
+
+# PCM format that compressed files (e.g. MP3) are decoded to.
+DECODE_SAMPLE_RATE = 44100
+DECODE_NUM_CHANNELS = 2
+
+
+@dataclasses.dataclass(frozen=True)
+class PcmFormat:
+    """
+    Format of a stream of raw PCM audio.
+
+    - num_channels: Number of channels.
+    - bytes_per_sample: Number of bytes per sample (per channel).
+    - sample_rate: Number of frames per second.
+    """
+
+    num_channels: int
+    bytes_per_sample: int
+    sample_rate: int
+
+    @property
+    def bytes_per_frame(self) -> int:
+        """Get the number of bytes for one frame (i.e. one sample of every channel).
+
+        Returns:
+            int: Number of bytes.
+        """
+        return self.num_channels * self.bytes_per_sample
+
+    def get_duration(self, num_bytes: int) -> float:
+        """Get the duration of a number of bytes of audio.
+
+        Args:
+            num_bytes (int): Number of bytes.
+
+        Returns:
+            float: Duration in seconds.
+        """
+        return num_bytes / (self.bytes_per_frame * self.sample_rate)
+
+    def get_num_bytes(self, duration: float) -> int:
+        """Get the number of bytes (rounded down to a whole frame) for a duration of
+        audio.
+
+        Args:
+            duration (float): Duration in seconds.
+
+        Returns:
+            int: Number of bytes.
+        """
+        num_frames = max(int(duration * self.sample_rate), 1)
+        return num_frames * self.bytes_per_frame
+
+
+class PcmRingBuffer:
+    """The PcmRingBuffer class is a fixed capacity, thread safe ring buffer of bytes.
+    Writers wait while the buffer is full and readers wait while it is empty, with both
+    waiting on a condition variable rather than polling.
+
+    Args:
+        capacity (int): Capacity of the buffer (in bytes).
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got: {capacity}")
+        self._buffer = bytearray(capacity)
+        self._capacity = capacity
+        self._start = 0
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def __len__(self) -> int:
+        with self._condition:
+            return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Get the capacity of the buffer.
+
+        Returns:
+            int: Capacity in bytes.
+        """
+        return self._capacity
+
+    def write(self, data: bytes) -> bool:
+        """Write data into the buffer, waiting for space to become free as needed.
+
+        Args:
+            data (bytes): Data to write.
+
+        Returns:
+            bool: ``True`` if all the data was written, or ``False`` if the buffer was
+                closed first.
+        """
+        view = memoryview(data)
+        while len(view) > 0:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._closed or self._size < self._capacity
+                )
+                if self._closed:
+                    return False
+                end = (self._start + self._size) % self._capacity
+                count = min(
+                    len(view), self._capacity - self._size, self._capacity - end
+                )
+                self._buffer[end : end + count] = view[:count]
+                self._size += count
+                self._condition.notify_all()
+            view = view[count:]
+        return True
+
+    def read(self, num_bytes: int) -> bytes:
+        """Read data from the buffer, waiting until the requested number of bytes is
+        available (or the buffer is closed).
+
+        Args:
+            num_bytes (int): Number of bytes to read. Must not exceed the capacity.
+
+        Returns:
+            bytes: Data, which is only shorter than requested if the buffer was closed.
+        """
+        num_bytes = min(num_bytes, self._capacity)
+        with self._condition:
+            self._condition.wait_for(lambda: self._closed or self._size >= num_bytes)
+            count = min(num_bytes, self._size)
+            first = min(count, self._capacity - self._start)
+            data = bytes(self._buffer[self._start : self._start + first]) + bytes(
+                self._buffer[: count - first]
+            )
+            self._start = (self._start + count) % self._capacity
+            self._size -= count
+            self._condition.notify_all()
+            return data
+
+    def close(self) -> None:
+        """Close the buffer, waking up any waiting readers and writers."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def is_closed(self) -> bool:
+        """Check whether the buffer has been closed.
+
+        Returns:
+            bool: ``True`` if the buffer is closed, else ``False``.
+        """
+        with self._condition:
+            return self._closed
+
+
+class PcmSource(typing.Protocol):
+    """
+    Protocol for a source of raw PCM audio which can be read from the start any number
+    of times.
+    """
+
+    @property
+    def format(self) -> PcmFormat:
+        """
+        Get the format of the audio.
+
+        Returns:
+            PcmFormat: Format.
+        """
+
+    def iter_chunks(self, chunk_size: int) -> typing.Iterator[bytes]:
+        """
+        Iterate over the audio from the start, in chunks.
+
+        Args:
+            chunk_size (int): Size of each chunk (in bytes).
+
+        Returns:
+            Iterator[bytes]: Chunks of audio.
+        """
+
+
+class WavSource(PcmSource):
+    """PCM source that reads a WAV file with the ``wave`` module.
+
+    Args:
+        filename (str): Path to the WAV file.
+    """
+
+    def __init__(self, filename: str) -> None:
+        self._filename = filename
+        with wave.open(filename, "rb") as wav:
+            self._format = PcmFormat(
+                num_channels=wav.getnchannels(),
+                bytes_per_sample=wav.getsampwidth(),
+                sample_rate=wav.getframerate(),
+            )
+
+    @property
+    def format(self) -> PcmFormat:
+        return self._format
+
+    def iter_chunks(self, chunk_size: int) -> typing.Iterator[bytes]:
+        with wave.open(self._filename, "rb") as wav:
+            num_frames = max(chunk_size // self._format.bytes_per_frame, 1)
+            while True:
+                data = wav.readframes(num_frames)
+                if not data:
+                    return
+                yield data
+
+
+class FfmpegSource(PcmSource):
+    """PCM source that decodes a compressed audio file (e.g. MP3) by streaming the
+    output of ``ffmpeg`` (the converter used by pydub).
+
+    Args:
+        filename (str): Path to the audio file.
+    """
+
+    def __init__(self, filename: str) -> None:
+        self._filename = filename
+        self._format = PcmFormat(
+            num_channels=DECODE_NUM_CHANNELS,
+            bytes_per_sample=2,
+            sample_rate=DECODE_SAMPLE_RATE,
+        )
+
+    @property
+    def format(self) -> PcmFormat:
+        return self._format
+
+    def iter_chunks(self, chunk_size: int) -> typing.Iterator[bytes]:
+        command = [
+            AudioSegment.converter,
+            "-loglevel",
+            "error",
+            "-i",
+            self._filename,
+            "-f",
+            "s16le",
+            "-ac",
+            str(self._format.num_channels),
+            "-ar",
+            str(self._format.sample_rate),
+            "-",
+        ]
+        with subprocess.Popen(
+            command, stdout=subprocess.PIPE, stdin=subprocess.DEVNULL
+        ) as process:
+            stdout = process.stdout
+            if stdout is None:
+                raise RuntimeError(f"Unable to read the output of: {command[0]}")
+            try:
+                while True:
+                    data = stdout.read(chunk_size)
+                    if not data:
+                        return
+                    yield data
+            finally:
+                process.kill()
+
+
+class BundleSource(PcmSource):
+    """PCM source that reads pre-decoded audio from an ``AssetBundle``, without copying
+    the whole sound.
+
+    Args:
+        bundle (AssetBundle): Asset bundle.
+        name (str): Name of the sound in the bundle.
+    """
+
+    def __init__(self, bundle: AssetBundle, name: str) -> None:
+        self._bundle = bundle
+        self._name = name
+        params = bundle.get_entry(name=name).params
+        self._format = PcmFormat(
+            num_channels=params["num_channels"],
+            bytes_per_sample=params["bytes_per_sample"],
+            sample_rate=params["sample_rate"],
+        )
+
+    @property
+    def format(self) -> PcmFormat:
+        return self._format
+
+    def iter_chunks(self, chunk_size: int) -> typing.Iterator[bytes]:
+        data = self._bundle.get_pcm_data(name=self._name)
+        for start in range(0, len(data), chunk_size):
+            yield bytes(data[start : start + chunk_size])
+
+
+def open_pcm_source(
+    filename: str, bundle: typing.Optional[AssetBundle] = None
+) -> PcmSource:
+    """Open a source of PCM audio for a file, using the pre-decoded audio from a bundle
+    if it is in it (matched by file name).
+
+    Args:
+        filename (str): Path to the audio file.
+        bundle (AssetBundle, optional): Bundle of pre-decoded audio.
+
+    Raises:
+        FileNotFoundError: If the audio is not in the bundle and the file does not exist.
+
+    Returns:
+        PcmSource: Audio source.
+    """
+    name = os.path.basename(filename)
+    if bundle is not None and name in bundle:
+        return BundleSource(bundle=bundle, name=name)
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(f"Unable to find file: {filename}")
+    if filename.lower().endswith(".wav"):
+        return WavSource(filename=filename)
+    return FfmpegSource(filename=filename)
+
+
+class AudioOutput(typing.Protocol):
+    """
+    Protocol for the output that a ``StreamingAudioPlayer`` feeds blocks of audio to.
+    """
+
+    def queue(self, data: bytes, stop_event: threading.Event) -> None:
+        """
+        Queue a block of audio to be played straight after the audio already queued.
+        This waits (on ``stop_event``) while enough audio is queued ahead of it.
+
+        Args:
+            data (bytes): Block of audio.
+            stop_event (threading.Event): Event that is set when playback is stopped.
+        """
+
+    def stop(self) -> None:
+        """
+        Stop playing, discarding any queued audio.
+        """
+
+
+class PygameMixerOutput(AudioOutput):
+    """Audio output that plays blocks of audio gaplessly on a ``pygame.mixer.Channel``,
+    using its one-deep queue. While a block is playing and another is queued, this waits
+    until the playing block has finished before queueing the next. The mixer does not
+    signal this without an event loop, so the end of the playing block is calculated
+    from the durations of the blocks, and the wait is a single timed wait on the stop
+    event until then (plus ``MIXER_LATENCY_SECONDS``). The channel is only checked again
+    if the mixer is running behind the calculated time.
+
+    Args:
+        pcm_format (PcmFormat): Format of the audio.
+    """
+
+    def __init__(self, pcm_format: PcmFormat) -> None:
+        self._format = pcm_format
+        mixer_format = (
+            pcm_format.sample_rate,
+            -8 * pcm_format.bytes_per_sample,
+            pcm_format.num_channels,
+        )
+        if pygame.mixer.get_init() != mixer_format:
+            if pygame.mixer.get_init() is not None:
+                logger.warning(
+                    f"Re-initialising the mixer, from {pygame.mixer.get_init()} to {mixer_format}"
+                )
+                pygame.mixer.quit()
+            pygame.mixer.init(
+                frequency=mixer_format[0],
+                size=mixer_format[1],
+                channels=mixer_format[2],
+            )
+        # Reserve a channel so that it is not used by any other sounds.
+        pygame.mixer.set_reserved(1)
+        self._channel = pygame.mixer.Channel(0)
+        self._ends_at = 0.0
+        self._playing_ends_at = 0.0
+
+    def queue(self, data: bytes, stop_event: threading.Event) -> None:
+        # Queueing a sound replaces any sound already queued, so wait for the playing
+        # block to finish, which moves the queued block to playing.
+        deadline = self._playing_ends_at + MIXER_LATENCY_SECONDS
+        while self._channel.get_queue() is not None:
+            if stop_event.wait(timeout=max(deadline - time.monotonic(), 0.0)):
+                return
+            deadline = time.monotonic() + MIXER_LATENCY_SECONDS
+
+        duration = self._format.get_duration(num_bytes=len(data))
+        sound = pygame.mixer.Sound(buffer=data)
+        if self._channel.get_busy():
+            self._channel.queue(sound)
+            self._playing_ends_at = max(self._ends_at, time.monotonic())
+            self._ends_at = self._playing_ends_at + duration
+        else:
+            self._channel.play(sound)
+            self._playing_ends_at = time.monotonic() + duration
+            self._ends_at = self._playing_ends_at
+
+    def stop(self) -> None:
+        self._channel.stop()
+        self._ends_at = 0.0
+        self._playing_ends_at = 0.0
+
+
+class StreamingAudioPlayer:
+    """The StreamingAudioPlayer class is used to play audio on a loop while only
+    holding a few seconds of decoded audio in memory. This is useful for playing
+    background music in the game.
+
+    Playing is done with two threads: a decoder thread which decodes the audio (looping
+    back to the start when it reaches the end) into a ring buffer, and an output thread
+    which reads blocks from the buffer and queues them to the output. The decoder thread
+    waits on the buffer, and the output thread waits on the buffer and then the output
+    (see ``AudioOutput.queue()``). Starting/stopping the class is thread safe.
+
+    Args:
+        filename (str): Path to the audio file.
+        bundle (AssetBundle, optional): Bundle of pre-decoded audio to stream from.
+        buffer_seconds (float): Duration of audio that is buffered ahead of the output.
+        block_seconds (float): Duration of each block of audio passed to the output.
+        output_factory (Callable, optional): Method that creates the output for a given
+            PCM format. If ``None`` a ``PygameMixerOutput`` is used.
+
+    Raises:
+        FileNotFoundError: If the audio file does not exist.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        bundle: typing.Optional[AssetBundle] = None,
+        buffer_seconds: float = DEFAULT_BUFFER_SECONDS,
+        block_seconds: float = DEFAULT_BLOCK_SECONDS,
+        output_factory: typing.Optional[
+            typing.Callable[[PcmFormat], AudioOutput]
+        ] = None,
+    ) -> None:
+        self._filename = filename
+        self._source = open_pcm_source(filename=filename, bundle=bundle)
+        pcm_format = self._source.format
+        self._block_size = pcm_format.get_num_bytes(duration=block_seconds)
+        self._buffer_size = max(
+            pcm_format.get_num_bytes(duration=buffer_seconds), self._block_size
+        )
+        self._output_factory = (
+            PygameMixerOutput if output_factory is None else output_factory
+        )
+        self._output: typing.Optional[AudioOutput] = None
+        self._buffer: typing.Optional[PcmRingBuffer] = None
+        self._stop_event = threading.Event()
+        self._threads: typing.List[threading.Thread] = list()
+        self._thread_lock = threading.Lock()
+        self._is_playing = False
+
+    ##################
+    # Public Methods #
+    ##################
+    def get_filename(self) -> str:
+        """Get the filename / path of the audio file being played.
+
+        Returns:
+            str: Full path of the file.
+        """
+        return self._filename
+
+    def get_format(self) -> PcmFormat:
+        """Get the format of the decoded audio.
+
+        Returns:
+            PcmFormat: Format.
+        """
+        return self._source.format
+
+    def get_buffer_size(self) -> int:
+        """Get the capacity of the ring buffer, which bounds the memory used for the
+        decoded audio.
+
+        Returns:
+            int: Capacity in bytes.
+        """
+        return self._buffer_size
+
+    def is_playing(self) -> bool:
+        """Check whether this player is running/playing audio.
+
+        Returns:
+            bool: ``True`` if audio is playing, else ``False``.
+        """
+        return self._is_playing
+
+    def play(self) -> bool:
+        """Play the audio file on loop.
+
+        Returns:
+            bool: ``True`` if playing was started, or ``False`` if it was already playing.
+        """
+        logger.debug("Streaming audio file: %s", self._filename)
+        with self._thread_lock:
+            if self._is_playing:
+                return False
+
+            if self._output is None:
+                self._output = self._output_factory(self._source.format)
+            self._buffer = PcmRingBuffer(capacity=self._buffer_size)
+            self._stop_event.clear()
+            self._threads = [
+                threading.Thread(target=self._decode_method, daemon=True),
+                threading.Thread(target=self._output_method, daemon=True),
+            ]
+            self._is_playing = True
+            for thread in self._threads:
+                thread.start()
+            return True
+
+    def stop(self) -> bool:
+        """Stop playing the loop.
+
+        Returns:
+            bool: ``True`` if audio was playing, else ``False``.
+        """
+        logger.debug("Stopping streaming audio file: %s", self._filename)
+        with self._thread_lock:
+            if not self._is_playing:
+                return False
+
+            self._is_playing = False
+            self._stop_event.set()
+            if self._buffer is not None:
+                self._buffer.close()
+            for thread in self._threads:
+                thread.join()
+            self._threads = list()
+            if self._output is not None:
+                self._output.stop()
+            return True
+
+    ###################
+    # Private Methods #
+    ###################
+    def _decode_method(self) -> None:
+        """Target method of the decoder thread, which decodes the audio on a loop into
+        the ring buffer until the buffer is closed."""
+        buffer = self._buffer
+        if buffer is None:
+            return
+        chunk_size = min(DEFAULT_CHUNK_SIZE, self._buffer_size)
+        while not self._stop_event.is_set():
+            num_bytes = 0
+            for chunk in self._source.iter_chunks(chunk_size=chunk_size):
+                num_bytes += len(chunk)
+                if not buffer.write(chunk):
+                    return
+            if num_bytes == 0:
+                logger.error(f"No audio decoded from file: {self.get_filename()}")
+                buffer.close()
+                return
+
+    def _output_method(self) -> None:
+        """Target method of the output thread, which feeds blocks of audio from the ring
+        buffer to the output until the buffer is closed."""
+        buffer = self._buffer
+        output = self._output
+        if buffer is None or output is None:
+            return
+        while not self._stop_event.is_set():
+            block = buffer.read(num_bytes=self._block_size)
+            if not block:
+                return
+            output.queue(data=block, stop_event=self._stop_event)
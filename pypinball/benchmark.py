@@ -0,0 +1,680 @@
+"""Module containing a headless benchmark suite for the hot paths of the game: the
+physics update, collision dispatch, rendering, event dispatch and the display caches.
+
+Each benchmark creates its own state (see ``Benchmark``) and is timed over several
+repeats (see ``run_benchmark()``). The results of a run are saved as JSON along with a
+header describing the environment (see ``create_report()``), so that runs from
+different commits can be compared with ``compare_reports()`` to catch regressions. The
+suite is run with ``scripts/run_benchmarks.py``.
+
+The rendering and cache benchmarks use generated images rather than the image assets,
+so that changing an asset does not show up as a change in performance of the code, and
+open the display with the SDL ``dummy`` video driver unless another driver is set.
+"""
+
+import atexit
+import dataclasses
+import datetime
+import functools
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+import types
+import typing
+
+import numpy
+import pygame
+import pymunk
+
+from . import domain, events, log, scoring, utils
+from .config import DEFAULT_GAME_CONFIG, DisplayConfig, GameConfig
+from .display import PyGameDisplay
+from .display.ball_cache import BumperCache
+from .display.flipper_atlas import FlipperAtlas
+from .display.pygame_score import DigitScoreRenderer
+from .display.surface_cache import SurfaceCache
+from .physics import CollisionEntity, PymunkPhysics
+from .physics.pymunk_physics import CollisionHandler
+from .simulation import create_headless_physics
+
+logger = log.get_logger(name=__name__)
+
+# Version of the format of the JSON report.
+REPORT_VERSION = 1
+
+# Default fraction by which a benchmark must be slower than the baseline to regress.
+DEFAULT_REGRESSION_THRESHOLD = 0.1
+
+# Type alias for a method that creates the state of a benchmark and returns the method
+# to time.
+BenchmarkSetup = typing.Callable[[], typing.Callable[[], None]]
+
+
+@dataclasses.dataclass(frozen=True)
+class Benchmark:
+    """
+    Definition of a benchmark.
+
+    - name: Unique name of the benchmark, including any parameters (e.g.
+        ``physics_update[balls=10]``).
+    - setup: Method that creates fresh state for the benchmark and returns the method to
+        time. This is called before each repeat, and is not timed.
+    - iterations: Number of times the method is called in each repeat.
+    """
+
+    name: str
+    setup: BenchmarkSetup
+    iterations: int
+
+
+@dataclasses.dataclass(frozen=True)
+class BenchmarkResult:
+    """
+    Result of running a benchmark. All of the times are the time per call of the
+    benchmarked method (in seconds), across the repeats.
+
+    - name: Name of the benchmark.
+    - iterations: Number of calls in each repeat.
+    - repeats: Number of timed repeats.
+    - min: Minimum time.
+    - median: Median time.
+    - mean: Mean time.
+    - stdev: Standard deviation of the time.
+    """
+
+    name: str
+    iterations: int
+    repeats: int
+    min: float
+    median: float
+    mean: float
+    stdev: float
+
+
+@dataclasses.dataclass(frozen=True)
+class Comparison:
+    """
+    Comparison of a benchmark between a baseline and the current run.
+
+    - name: Name of the benchmark.
+    - baseline: Median time of the baseline (in seconds).
+    - current: Median time of the current run (in seconds).
+    - ratio: Current time divided by the baseline time.
+    - regressed: Whether the current run is slower than the baseline by more than the
+        threshold.
+    """
+
+    name: str
+    baseline: float
+    current: float
+    ratio: float
+    regressed: bool
+
+
+def run_benchmark(
+    benchmark: Benchmark,
+    repeats: int = 5,
+    warmup: int = 1,
+    clock: typing.Callable[[], int] = time.perf_counter_ns,
+) -> BenchmarkResult:
+    """Run a benchmark, creating fresh state before each repeat.
+
+    Args:
+        benchmark (Benchmark): Benchmark to run.
+        repeats (int): Number of timed repeats.
+        warmup (int): Number of repeats to run before timing (e.g. to fill caches).
+        clock (Callable): Method that returns a monotonic time in nanoseconds.
+
+    Raises:
+        ValueError: If ``repeats`` is less than 1.
+
+    Returns:
+        BenchmarkResult: Result.
+    """
+    if repeats < 1:
+        raise ValueError(f"repeats must be at least 1, got: {repeats}")
+
+    times = list()
+    for i in range(warmup + repeats):
+        fn = benchmark.setup()
+        start = clock()
+        for _ in range(benchmark.iterations):
+            fn()
+        elapsed = clock() - start
+        if i >= warmup:
+            times.append(elapsed / 1e9 / benchmark.iterations)
+
+    return BenchmarkResult(
+        name=benchmark.name,
+        iterations=benchmark.iterations,
+        repeats=repeats,
+        min=min(times),
+        median=statistics.median(times),
+        mean=statistics.mean(times),
+        stdev=statistics.stdev(times) if len(times) > 1 else 0.0,
+    )
+
+
+def run_benchmarks(
+    benchmarks: typing.List[Benchmark],
+    repeats: int = 5,
+    name_filter: typing.Optional[str] = None,
+) -> typing.List[BenchmarkResult]:
+    """Run a list of benchmarks.
+
+    Args:
+        benchmarks (list): Benchmarks to run.
+        repeats (int): Number of timed repeats of each benchmark.
+        name_filter (str, optional): Only run the benchmarks whose name contains this.
+
+    Returns:
+        List[BenchmarkResult]: Result of each benchmark that was run.
+    """
+    results = list()
+    for benchmark in benchmarks:
+        if name_filter is not None and name_filter not in benchmark.name:
+            continue
+        result = run_benchmark(benchmark=benchmark, repeats=repeats)
+        logger.info(
+            f"Benchmark {result.name}: median {result.median * 1e6:.2f} us, "
+            f"min {result.min * 1e6:.2f} us"
+        )
+        results.append(result)
+    return results
+
+
+def get_git_commit() -> typing.Optional[str]:
+    """Get the commit that the source tree of the package is at.
+
+    Returns:
+        str: Commit hash, or ``None`` if it could not be found.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def create_report(
+    results: typing.List[BenchmarkResult],
+) -> typing.Dict[str, typing.Any]:
+    """Create a report of the results of a run, with a header describing the commit and
+    the environment the run was on.
+
+    Args:
+        results (list): Benchmark results.
+
+    Returns:
+        dict: Report, which can be saved as JSON.
+    """
+    header = {
+        "version": REPORT_VERSION,
+        "commit": get_git_commit(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pygame": pygame.version.ver,
+        "pymunk": pymunk.version,
+        "numpy": numpy.__version__,
+    }
+    return {
+        "header": header,
+        "results": [dataclasses.asdict(result) for result in results],
+    }
+
+
+def save_report(report: typing.Dict[str, typing.Any], path: str) -> None:
+    """Save a report as JSON.
+
+    Args:
+        report (dict): Report (see ``create_report()``).
+        path (str): Path of the file to write.
+    """
+    with open(path, mode="w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    logger.info(f"Saved benchmark report to: {path}")
+
+
+def load_report(path: str) -> typing.Dict[str, typing.Any]:
+    """Load a report saved with ``save_report()``.
+
+    Args:
+        path (str): Path of the file to read.
+
+    Raises:
+        ValueError: If the report is of an unsupported version.
+
+    Returns:
+        dict: Report.
+    """
+    with open(path, mode="r", encoding="utf-8") as file:
+        report = json.load(file)
+    version = report.get("header", dict()).get("version")
+    if version != REPORT_VERSION:
+        raise ValueError(f"Unsupported benchmark report version: {version}")
+    return report
+
+
+def compare_reports(
+    baseline: typing.Dict[str, typing.Any],
+    current: typing.Dict[str, typing.Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> typing.List[Comparison]:
+    """Compare the median times of the benchmarks that are in both reports.
+
+    Args:
+        baseline (dict): Report to compare against.
+        current (dict): Report of the current run.
+        threshold (float): Fraction by which a benchmark must be slower than the
+            baseline to count as a regression (e.g. ``0.1`` for 10%).
+
+    Returns:
+        List[Comparison]: Comparison of each benchmark, in the order of the current run.
+    """
+    baseline_times = {r["name"]: r["median"] for r in baseline["results"]}
+    comparisons = list()
+    for result in current["results"]:
+        base = baseline_times.get(result["name"])
+        if base is None:
+            continue
+        ratio = result["median"] / base if base > 0.0 else float("inf")
+        comparisons.append(
+            Comparison(
+                name=result["name"],
+                baseline=base,
+                current=result["median"],
+                ratio=ratio,
+                regressed=ratio > 1.0 + threshold,
+            )
+        )
+    return comparisons
+
+
+def format_results(results: typing.List[BenchmarkResult]) -> str:
+    """Format benchmark results as a table.
+
+    Args:
+        results (list): Benchmark results.
+
+    Returns:
+        str: Multi-line table.
+    """
+    width = max((len(r.name) for r in results), default=0)
+    lines = [f"{'benchmark':<{width}}  {'median':>12}  {'min':>12}  {'stdev':>12}"]
+    for r in results:
+        lines.append(
+            f"{r.name:<{width}}  {r.median * 1e6:9.2f} us  {r.min * 1e6:9.2f} us  "
+            f"{r.stdev * 1e6:9.2f} us"
+        )
+    return "\n".join(lines)
+
+
+def format_comparisons(comparisons: typing.List[Comparison]) -> str:
+    """Format benchmark comparisons as a table.
+
+    Args:
+        comparisons (list): Benchmark comparisons.
+
+    Returns:
+        str: Multi-line table.
+    """
+    width = max((len(c.name) for c in comparisons), default=0)
+    lines = [f"{'benchmark':<{width}}  {'baseline':>12}  {'current':>12}  {'ratio':>6}"]
+    for c in comparisons:
+        lines.append(
+            f"{c.name:<{width}}  {c.baseline * 1e6:9.2f} us  {c.current * 1e6:9.2f} us  "
+            f"{c.ratio:6.2f}{'  REGRESSED' if c.regressed else ''}"
+        )
+    return "\n".join(lines)
+
+
+############################
+# Benchmark Setup Methods  #
+############################
+def _create_physics(
+    config: GameConfig,
+    num_balls: int,
+    event_pub: typing.Optional[events.GameEventPublisher] = None,
+    bumpers: typing.Optional[typing.List[domain.Bumper]] = None,
+) -> PymunkPhysics:
+    """Create the physics for a table with balls spread over a grid in the upper part of
+    the playing area.
+
+    Args:
+        config (GameConfig): Game configuration for the walls, flippers and bumpers.
+        num_balls (int): Number of balls.
+        event_pub (GameEventPublisher, optional): Event publisher to use. If ``None`` a
+            new one is created.
+        bumpers (list, optional): Bumpers to use instead of those in the config.
+
+    Returns:
+        PymunkPhysics: Physics implementation.
+    """
+    if event_pub is None:
+        event_pub = events.GameEventPublisher()
+    physics = create_headless_physics(config=config, event_pub=event_pub, seed=0)
+    for bumper in config.bumpers if bumpers is None else bumpers:
+        physics.add_bumper(bumper)
+    for flipper in config.flippers:
+        physics.add_flipper(flipper)
+    for wall in config.walls:
+        physics.add_wall(wall)
+
+    columns = 10
+    for i in range(num_balls):
+        row, column = divmod(i, columns)
+        physics.add_ball(
+            domain.Ball(
+                uid=i,
+                position=(80.0 + 30.0 * column, 60.0 + 30.0 * (row % 12)),
+                radius=config.ball_radius,
+            )
+        )
+    return physics
+
+
+def _create_dense_bumpers(config: GameConfig) -> typing.List[domain.Bumper]:
+    """Create a grid of round bumpers covering the upper part of the playing area.
+
+    Args:
+        config (GameConfig): Game configuration, for the size of the playing area.
+
+    Returns:
+        List[Bumper]: Bumpers.
+    """
+    rows, columns = 8, 10
+    width, height = config.playing_area
+    bumpers: typing.List[domain.Bumper] = list()
+    for row in range(rows):
+        for column in range(columns):
+            bumpers.append(
+                domain.RoundBumper(
+                    uid=2000 + len(bumpers),
+                    position=(
+                        width * (0.1 + 0.8 * (column + 0.5 * (row % 2)) / columns),
+                        height * (0.1 + 0.5 * row / rows),
+                    ),
+                    radius=8,
+                )
+            )
+    return bumpers
+
+
+def _setup_physics_update(num_balls: int, dense: bool = False) -> BenchmarkSetup:
+    config = DEFAULT_GAME_CONFIG
+
+    def _setup() -> typing.Callable[[], None]:
+        # Subscribe the scoring as in the game, so that collisions are dispatched.
+        event_pub = events.GameEventPublisher()
+        event_pub.subscribe(callback=scoring.Scoring().event_callback)
+        physics = _create_physics(
+            config=config,
+            num_balls=num_balls,
+            event_pub=event_pub,
+            bumpers=_create_dense_bumpers(config=config) if dense else None,
+        )
+        return physics.update
+
+    return _setup
+
+
+def _setup_collision_dispatch(num_shapes: int) -> BenchmarkSetup:
+    def _setup() -> typing.Callable[[], None]:
+        event_pub = events.GameEventPublisher()
+        event_pub.subscribe(callback=scoring.Scoring().event_callback)
+        space = pymunk.Space()
+        entities = [CollisionEntity.BUMPER, CollisionEntity.WALL, CollisionEntity.BALL]
+        shapes: typing.Dict[pymunk.Shape, typing.Tuple[CollisionEntity, int]] = dict()
+        ball = pymunk.Circle(None, 1.0)
+        shapes[ball] = (CollisionEntity.BALL, 0)
+        others = list()
+        for i in range(num_shapes):
+            shape = pymunk.Circle(None, 1.0)
+            shapes[shape] = (entities[i % len(entities)], i + 1)
+            others.append(shape)
+        handler = CollisionHandler(event_pub=event_pub, space=space, shapes=shapes)
+        handler.collision_events.subscribe(callback=lambda _: None)
+        # The handler only uses the shapes of the arbiter.
+        arbiters = [
+            typing.cast(pymunk.Arbiter, types.SimpleNamespace(shapes=(ball, other)))
+            for other in others
+        ]
+
+        def _dispatch() -> None:
+            for arbiter in arbiters:
+                handler.handle_collision(arbiter=arbiter, space=space, data=dict())
+
+        return _dispatch
+
+    return _setup
+
+
+def _setup_event_emit(num_subscribers: int) -> BenchmarkSetup:
+    def _setup() -> typing.Callable[[], None]:
+        event_pub = events.GameEventPublisher()
+        for _ in range(num_subscribers):
+            event_pub.subscribe(callback=lambda _: None)
+        return lambda: event_pub.emit(event=events.GameEvents.COLLISION_BALL_BUMPER)
+
+    return _setup
+
+
+def _init_display() -> None:
+    """Open a display if there is not one already, as this is needed to convert
+    surfaces."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    if pygame.display.get_surface() is None:
+        pygame.display.init()
+        pygame.display.set_mode(size=(1, 1))
+
+
+def _create_image(size: typing.Tuple[int, int], seed: int) -> pygame.Surface:
+    """Create a semi-transparent image.
+
+    Args:
+        size (tuple): Size in (width, height) format.
+        seed (int): Seed for the color of the image.
+
+    Returns:
+        pygame.Surface: Image.
+    """
+    surface = pygame.Surface(size=size, flags=pygame.SRCALPHA)
+    surface.fill(pygame.Color(40 * seed % 256, 255 - 40 * seed % 256, 100, 200))
+    pygame.draw.circle(surface, (0, 0, 0, 255), surface.get_rect().center, size[0] // 3)
+    return surface
+
+
+def _create_display_config(directory: str) -> DisplayConfig:
+    """Save generated images to a directory and create a display configuration that
+    uses them.
+
+    Args:
+        directory (str): Directory to save the images to.
+
+    Returns:
+        DisplayConfig: Display configuration.
+    """
+    sizes = {
+        "background": (450, 650),
+        "ball": (64, 64),
+        "round_bumper": (64, 64),
+        "rect_bumper": (128, 32),
+        "flipper": (128, 32),
+        "life": (32, 32),
+    }
+    paths = dict()
+    for i, (name, size) in enumerate(sizes.items()):
+        paths[name] = os.path.join(directory, f"{name}.png")
+        pygame.image.save(_create_image(size=size, seed=i), paths[name])
+    return DisplayConfig(
+        background_image_path=paths["background"],
+        ball_image_path=paths["ball"],
+        round_bumper_image_path=paths["round_bumper"],
+        rectangle_bumper_image_path=paths["rect_bumper"],
+        flipper_image_path=paths["flipper"],
+        life_icon_path=paths["life"],
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_display_config() -> DisplayConfig:
+    """Get a display configuration that uses generated images. The images are generated
+    once, into a temporary directory that is deleted when the interpreter exits (some
+    images are only loaded when they are first drawn).
+
+    Returns:
+        DisplayConfig: Display configuration.
+    """
+    directory = tempfile.mkdtemp(prefix="pypinball_benchmark_")
+    atexit.register(shutil.rmtree, directory, ignore_errors=True)
+    return _create_display_config(directory=directory)
+
+
+def _setup_render(num_balls: int, dirty_rects: bool) -> BenchmarkSetup:
+    config = DEFAULT_GAME_CONFIG
+
+    def _setup() -> typing.Callable[[], None]:
+        _init_display()
+        pygame_display = PyGameDisplay(
+            width=int(config.playing_area[0]),
+            height=int(config.playing_area[1]),
+            game_events=events.GameEventPublisher(),
+            config=_get_display_config(),
+            # A frame rate of zero doesn't limit the frame rate (see Clock.tick()).
+            fps=0.0,
+            dirty_rects=dirty_rects,
+        )
+        physics = _create_physics(config=config, num_balls=num_balls)
+        utils.preload_flippers(flippers=config.flippers, display=pygame_display)
+
+        def _render() -> None:
+            # Step the physics so that the balls move, and the dirty regions change,
+            # between frames. Drawing is only composited to the screen by update().
+            physics.update()
+            pygame_display.clear()
+            utils.render_physics_state(physics=physics, display=pygame_display)
+            pygame_display.update()
+
+        return _render
+
+    return _setup
+
+
+def _setup_bumper_cache_get() -> BenchmarkSetup:
+    def _setup() -> typing.Callable[[], None]:
+        _init_display()
+        cache = BumperCache(
+            icon_path=_create_image(size=(64, 64), seed=0),
+            cache=SurfaceCache(max_bytes=None),
+        )
+        cache.get(uid=0, size=(40, 40), angle=0.0)
+
+        def _get() -> None:
+            cache.get(uid=0, size=(40, 40), angle=0.0)
+
+        return _get
+
+    return _setup
+
+
+def _setup_flipper_atlas_get() -> BenchmarkSetup:
+    def _setup() -> typing.Callable[[], None]:
+        _init_display()
+        atlas = FlipperAtlas(
+            icon_path=_create_image(size=(128, 32), seed=0), angle_step=5
+        )
+        atlas.build(uid=0, size=(140, 28), min_angle=-1.0, max_angle=0.0)
+        angles = numpy.linspace(-1.0, 0.0, num=64).tolist()
+        index = [0]
+
+        def _get() -> None:
+            index[0] = (index[0] + 1) % len(angles)
+            atlas.get(uid=0, angle=angles[index[0]])
+
+        return _get
+
+    return _setup
+
+
+def _setup_score_render() -> BenchmarkSetup:
+    def _setup() -> typing.Callable[[], None]:
+        _init_display()
+        renderer = DigitScoreRenderer()
+        score = [0]
+
+        def _get() -> None:
+            # Change the score every call, as the last score is cached.
+            score[0] += 1
+            renderer.get(score=score[0])
+
+        return _get
+
+    return _setup
+
+
+def get_benchmarks() -> typing.List[Benchmark]:
+    """Get the benchmark suite.
+
+    Returns:
+        List[Benchmark]: Benchmarks.
+    """
+    benchmarks = list()
+    for num_balls in [1, 10, 100]:
+        benchmarks.append(
+            Benchmark(
+                name=f"physics_update[balls={num_balls}]",
+                setup=_setup_physics_update(num_balls=num_balls),
+                iterations=60,
+            )
+        )
+    benchmarks.append(
+        Benchmark(
+            name="physics_update[dense_table,balls=50]",
+            setup=_setup_physics_update(num_balls=50, dense=True),
+            iterations=60,
+        )
+    )
+    benchmarks.append(
+        Benchmark(
+            name="collision_dispatch[shapes=500]",
+            setup=_setup_collision_dispatch(num_shapes=500),
+            iterations=20,
+        )
+    )
+    for num_balls, dirty_rects in [(1, False), (100, False), (100, True)]:
+        benchmarks.append(
+            Benchmark(
+                name=f"render_frame[balls={num_balls},dirty_rects={dirty_rects}]",
+                setup=_setup_render(num_balls=num_balls, dirty_rects=dirty_rects),
+                iterations=60,
+            )
+        )
+    for num_subscribers in [1, 10, 100]:
+        benchmarks.append(
+            Benchmark(
+                name=f"event_emit[subscribers={num_subscribers}]",
+                setup=_setup_event_emit(num_subscribers=num_subscribers),
+                iterations=2000,
+            )
+        )
+    benchmarks += [
+        Benchmark(
+            name="bumper_cache_get", setup=_setup_bumper_cache_get(), iterations=5000
+        ),
+        Benchmark(
+            name="flipper_atlas_get", setup=_setup_flipper_atlas_get(), iterations=5000
+        ),
+        Benchmark(name="score_render", setup=_setup_score_render(), iterations=500),
+    ]
+    return benchmarks
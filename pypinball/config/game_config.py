@@ -31,6 +31,12 @@ class GameConfig:
     - walls: Specification of all walls to create in the ``PhysicsInterface``.
     - background_music: Name of the background music file to play.
     - events_to_sounds: Mapping from ``GameEvents`` types to file paths for audio files.
+    - fames_per_second: Target frame rate of the display.
+    - physics_hz: Rate of the fixed physics timestep, independent of the frame rate.
+    - max_physics_steps_per_update: Maximum number of physics steps to catch up on per frame.
+    - min_physics_sub_steps: Minimum number of sub-steps each physics step is split into.
+    - max_physics_sub_steps: Maximum number of sub-steps each physics step is split into.
+    - seed: Seed for the physics random number generator. If ``None`` a random seed is used.
     """
 
     playing_area: typing.Tuple[float, float]
@@ -50,3 +56,13 @@ class GameConfig:
     ball_radius: int = 15
 
     fames_per_second: float = 60.0
+
+    physics_hz: float = 300.0
+
+    max_physics_steps_per_update: int = 25
+
+    min_physics_sub_steps: int = 1
+
+    max_physics_sub_steps: int = 8
+
+    seed: typing.Optional[int] = None
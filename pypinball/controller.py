@@ -1,13 +1,35 @@
+import typing
+
 from . import display, events, inputs, log, physics, utils
 from .config import GameConfig
+from .frame_profiler import FrameProfiler, format_frame_stats
 from .lives import Lives
 from .scoring import Scoring
 
 logger = log.get_logger(__name__)
 
+# Number of ticks between updates of the text of the profiler overlay.
+OVERLAY_REFRESH_TICKS = 30
+
 
 class Controller:
-    """Controller class"""
+    """Controller class
+
+    Each stage of ``tick()`` is timed by a ``FrameProfiler``: ``clear``, ``physics``,
+    ``render``, ``hud`` (the score, lives and profiler overlay), ``display`` (which
+    includes waiting on the frame rate clock of the display, if it has one) and
+    ``lost_balls``.
+
+    Args:
+        display_interface (DisplayInterface): Display to render to.
+        config (GameConfig): Game configuration.
+        physics_interface (PhysicsInterface): Physics engine.
+        event_publisher (GameEventPublisher): Publisher of the game events.
+        profiler (FrameProfiler, optional): Profiler used to time each tick. If
+            ``None`` a profiler with the default frame budget is created.
+        show_profiler_overlay (bool): Whether to draw the profiler statistics over the
+            display.
+    """
 
     def __init__(
         self,
@@ -15,6 +37,8 @@ class Controller:
         config: GameConfig,
         physics_interface: physics.PhysicsInterface,
         event_publisher: events.GameEventPublisher,
+        profiler: typing.Optional[FrameProfiler] = None,
+        show_profiler_overlay: bool = False,
     ) -> None:
         self._display = display_interface
         self._config = config
@@ -26,6 +50,29 @@ class Controller:
         self._lives = Lives(lives=5, event_pub=self._event_publisher)
 
         self._should_quit = False
+        self._tick_count = 0
+
+        self._profiler = FrameProfiler() if profiler is None else profiler
+        self._show_profiler_overlay = show_profiler_overlay
+        self._overlay_lines: typing.List[str] = list()
+
+    @property
+    def tick_count(self) -> int:
+        """Get the number of times the controller has been ticked.
+
+        Returns:
+            int: Number of ticks.
+        """
+        return self._tick_count
+
+    @property
+    def profiler(self) -> FrameProfiler:
+        """Get the profiler that times each tick.
+
+        Returns:
+            FrameProfiler: Frame profiler.
+        """
+        return self._profiler
 
     ##################
     # Public Methods #
@@ -38,7 +85,7 @@ class Controller:
         Args:
             event (InputEvents): Input device event.
         """
-        logger.debug(f"Handling input event: {event}")
+        logger.debug("Handling input event: %s", event)
 
         if event in [
             inputs.InputEvents.LEFT_BUTTON_PRESSED,
@@ -73,8 +120,9 @@ class Controller:
         ret += [self._physics.add_bumper(f) for f in self._config.bumpers]
         ret += [self._physics.add_flipper(f) for f in self._config.flippers]
         ret += [self._physics.add_wall(w) for w in self._config.walls]
+        utils.preload_flippers(flippers=self._config.flippers, display=self._display)
 
-        self._event_publisher.subscribe(callback=self._scoring.event_callback)
+        self._event_publisher.subscribe_batch(callback=self._scoring.batch_callback)
         self._event_publisher.subscribe(callback=self._lives.event_callback)
         return all(ret)
 
@@ -85,46 +133,86 @@ class Controller:
         logger.info("Stopping the controller main loop")
         self._should_quit = True
 
-    def run(self) -> None:
+    def run(
+        self,
+        max_ticks: typing.Optional[int] = None,
+        on_tick: typing.Optional[typing.Callable[[int], None]] = None,
+    ) -> int:
         """
         Start running the controller main loop. This calls the ``tick()`` method in the background.
+
+        Args:
+            max_ticks (int, optional): Maximum number of ticks to run for. If set to ``None``
+                the loop runs until the controller is stopped.
+            on_tick (Callable, optional): Method called with the current ``tick_count``
+                before each tick. This can be used to inject scripted input events.
+
+        Returns:
+            int: Number of ticks that were run.
         """
         logger.info("Starting main loop")
+        count = 0
         while not self._should_quit:
+            if max_ticks is not None and count >= max_ticks:
+                break
+            if on_tick is not None:
+                on_tick(self._tick_count)
             self.tick()
+            count += 1
+        return count
 
     def tick(self) -> None:
         """
         Tick the controller one iteration. This will update the ``PhysicsInterface`` as well as the ``DisplayInterface``
         implementations based upon the input values received.
         """
+        profiler = self._profiler
+        profiler.begin_frame()
+
         self._display.clear()
-        self._physics.update()
+        profiler.mark("clear")
+        # Collision events are delivered to the batch subscribers (e.g. the scoring) as
+        # one list for the whole physics update.
+        with self._event_publisher.batch():
+            self._physics.update()
+        profiler.mark("physics")
         utils.render_physics_state(physics=self._physics, display=self._display)
+        profiler.mark("render")
         utils.render_score_and_lives(
             scoring=self._scoring, lives=self._lives, display=self._display
         )
+        if self._show_profiler_overlay:
+            self._draw_profiler_overlay()
+        profiler.mark("hud")
         self._display.update()
+        profiler.mark("display")
 
         self._handle_lost_balls()
+        profiler.mark("lost_balls")
+        profiler.end_frame()
+        self._tick_count += 1
 
     ###################
     # Private Methods #
     ###################
-    def _handle_lost_balls(self) -> None:
-        states = self._physics.get_ball_states()
-        for state in states:
-            ball_in_area = utils.check_ball_is_within_area(
-                ball_position=state.position,
-                width=self._config.playing_area[0],
-                height=self._config.playing_area[1],
-            )
+    def _draw_profiler_overlay(self) -> None:
+        # Calculating the statistics is relatively expensive, so only refresh the text
+        # every few ticks.
+        if self._tick_count % OVERLAY_REFRESH_TICKS == 0:
+            self._overlay_lines = format_frame_stats(stats=self._profiler.get_stats())
+        self._display.draw_overlay(lines=self._overlay_lines)
 
-            if ball_in_area:
-                continue
+    def _handle_lost_balls(self) -> None:
+        states = self._physics.get_ball_state_arrays()
+        lost_uids = utils.find_balls_outside_area(
+            balls=states,
+            width=self._config.playing_area[0],
+            height=self._config.playing_area[1],
+        )
 
+        for uid in lost_uids.tolist():
             logger.info("Ball lost")
-            self._physics.remove_ball(uid=state.uid)
+            self._physics.remove_ball(uid=uid)
             self._event_publisher.emit(event=events.GameEvents.BALL_LOST)
 
     def _handle_game_events(self, event: events.GameEvents) -> None:
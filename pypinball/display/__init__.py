@@ -1,3 +1,4 @@
 from . import pygame_score, utils
 from .display_interface import DisplayInterface
+from .null_display import NullDisplay
 from .pygame_display import PyGameDisplay
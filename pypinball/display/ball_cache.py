@@ -7,6 +7,8 @@ import typing
 import pygame
 
 from .. import log
+from .image_source import ImageSource, LazyImage
+from .surface_cache import NamespacedCache, SurfaceCache
 
 logger = log.get_logger(name=__name__)
 
@@ -16,8 +18,8 @@ class BallCache:
     which can be used to quickly render the ball at runtime. This provides a significant
     real-time speedup of the rendering process."""
 
-    def __init__(self, icon_path: str, diameter: int) -> None:
-        self._img = pygame.image.load(icon_path).convert_alpha()
+    def __init__(self, icon_path: ImageSource, diameter: int) -> None:
+        self._img = LazyImage(source=icon_path).get()
         self._img = pygame.transform.scale(self._img, size=(diameter, diameter))
         self._img = pygame.transform.rotate(self._img, angle=0.0)
         self._img.set_alpha(255)
@@ -31,22 +33,21 @@ class BallCache:
         return self._img
 
 
-class BumperCache:
+class BumperCache(NamespacedCache):
     """The BumperCache class is used to maintain a cache of the bumper states that have
     been render previously. The aim of this is to increase by rendering efficiency
     during runtime.
-    """
-
-    def __init__(self, icon_path: str) -> None:
-        self._icon_img = pygame.image.load(icon_path).convert_alpha()
-        self._cache: typing.Dict[int, pygame.Surface] = dict()
 
-    def __len__(self) -> int:
-        return len(self._cache.keys())
+    Args:
+        icon_path (ImageSource): Path to the bumper icon, or a future for the loaded icon.
+        cache (SurfaceCache, optional): Surface cache to store the bumpers in.
+    """
 
-    def clear(self) -> None:
-        """Clear the cache."""
-        self._cache.clear()
+    def __init__(
+        self, icon_path: ImageSource, cache: typing.Optional[SurfaceCache] = None
+    ) -> None:
+        super().__init__(cache=cache)
+        self._icon_img = LazyImage(source=icon_path)
 
     def get(
         self, uid: int, size: typing.Tuple[int, int], angle: float
@@ -61,16 +62,18 @@ class BumperCache:
         Returns:
             pygame.Surface: PyGame surface.
         """
-        if uid not in self._cache.keys():
-            logger.debug(f"Loading bumper into cache, uid: {uid}")
-            img = pygame.transform.scale(self._icon_img, size=size)
+
+        def _create() -> pygame.Surface:
+            logger.debug("Loading bumper into cache, uid: %s", uid)
+            img = pygame.transform.scale(self._icon_img.get(), size=size)
             img = pygame.transform.rotate(img, angle=math.degrees(-angle))
             img.set_alpha(255)
-            self._cache[uid] = img
-        return self._cache[uid]
+            return img
+
+        return self._cache.get_or_create(key=(self._namespace, uid), factory=_create)
 
 
-class FlipperCache:
+class FlipperCache(NamespacedCache):
     """The FlipperCache class is used to cache the various states of the flippers
     during the game at runtime. This is done to be able to speed up the rendering
     process during runtime and make things more efficient.
@@ -81,20 +84,23 @@ class FlipperCache:
 
     Given that the flippers have a limited range of motion, the benefits of this caching
     quickly become apparent!
+
+    Args:
+        icon_path (ImageSource): Path to the flipper icon, or a future for the loaded icon.
+        angle_rounding (int): Angle (in degrees) that the flipper angle is rounded to.
+        cache (SurfaceCache, optional): Surface cache to store the flippers in.
     """
 
-    def __init__(self, icon_path: str, angle_rounding: int) -> None:
-        self._icon_img = pygame.image.load(icon_path).convert_alpha()
-        self._cache: typing.Dict[typing.Tuple[int, int], pygame.Surface] = dict()
+    def __init__(
+        self,
+        icon_path: ImageSource,
+        angle_rounding: int,
+        cache: typing.Optional[SurfaceCache] = None,
+    ) -> None:
+        super().__init__(cache=cache)
+        self._icon_img = LazyImage(source=icon_path)
         self._rounding_angle = int(angle_rounding)
 
-    def __len__(self) -> int:
-        return len(self._cache.keys())
-
-    def clear(self) -> None:
-        """Clear the cache."""
-        self._cache.clear()
-
     def get(
         self, uid: int, size: typing.Tuple[int, int], angle: float
     ) -> pygame.Surface:
@@ -115,13 +121,13 @@ class FlipperCache:
             pygame.Surface: PyGame surface to that can be used for rendering.
         """
         _angle = int(math.degrees(-angle) / self._rounding_angle) * self._rounding_angle
-        _key = (uid, _angle)
+        _key = (self._namespace, uid, _angle)
 
-        if _key not in self._cache.keys():
-            logger.debug(f"Loading flipper into cache, uid: {uid}, angle: {_angle}")
-            img = pygame.transform.scale(self._icon_img, size=size)
-            img = pygame.transform.rotate(img, angle=math.degrees(-angle))
+        def _create() -> pygame.Surface:
+            logger.debug("Loading flipper into cache, uid: %s, angle: %s", uid, _angle)
+            img = pygame.transform.scale(self._icon_img.get(), size=size)
+            img = pygame.transform.rotate(img, angle=_angle)
             img.set_alpha(255)
-            self._cache[_key] = img
+            return img
 
-        return self._cache[_key]
+        return self._cache.get_or_create(key=_key, factory=_create)
@@ -6,6 +6,31 @@ class DisplayInterface(typing.Protocol):
     of what class methods an implementation of an abstracted display
     is expected to have"""
 
+    def begin_static_layer(self, revision: int) -> bool:
+        """
+        Start rendering the static layer (the background and everything that does not
+        move, such as bumpers). If the layer has already been rendered for the given
+        revision then ``False`` is returned and nothing needs to be drawn. Otherwise
+        ``True`` is returned, and all draw calls until ``end_static_layer()`` are
+        rendered into the static layer rather than the current frame.
+
+        Args:
+            revision (int): Revision of the static content (e.g. the bumper revision).
+
+        Returns:
+            bool: Whether the static layer needs to be drawn.
+        """
+
+    def end_static_layer(self) -> None:
+        """
+        Finish rendering the static layer started with ``begin_static_layer()``.
+        """
+
+    def draw_static_layer(self) -> None:
+        """
+        Draw the pre-rendered static layer in the display.
+        """
+
     def clear(self) -> None:
         """
         Clear the display window.
@@ -101,6 +126,32 @@ class DisplayInterface(typing.Protocol):
             score (str): Score value as a string.
         """
 
+    def draw_overlay(self, lines: typing.List[str]) -> None:
+        """
+        Draw lines of text over everything else in the frame (e.g. debug statistics).
+
+        Args:
+            lines (list): Lines of text.
+        """
+
+    def preload_flipper(
+        self,
+        uid: int,
+        size: typing.Tuple[float, float],
+        min_angle: float,
+        max_angle: float,
+    ) -> None:
+        """
+        Prepare anything needed to draw a flipper over its full range of motion ahead
+        of time (e.g. pre-rendered rotations), so that no work is done when it is drawn.
+
+        Args:
+            uid (int): Unique ID of the flipper.
+            size (tuple): Size of the flipper in (width, height) format in pixel coordinates.
+            min_angle (float): Minimum angle of the flipper (in radians).
+            max_angle (float): Maximum angle of the flipper (in radians).
+        """
+
     def update(self) -> None:
         """
         Update the display. This is something that should be called on each loop of the game.
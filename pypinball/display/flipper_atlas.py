@@ -0,0 +1,199 @@
+"""Module containing the FlipperAtlas class, which pre-renders every (quantised) rotation
+of the flippers at startup so that no rotation work is done during the render loop."""
+
+import dataclasses
+import math
+import threading
+import typing
+
+import pygame
+
+from .. import log
+from .image_source import ImageSource, LazyImage
+
+logger = log.get_logger(name=__name__)
+
+
+@dataclasses.dataclass
+class FlipperSprites:
+    """
+    Pre-rendered rotations of a single flipper, packed into one atlas surface.
+
+    - atlas: Surface containing all of the rotated sprites side by side.
+    - sprites: Sub-surfaces of the atlas for each rotation, in order of angle.
+    - offsets: Offset from the centre of the flipper to the top-left of each sprite.
+    - start_angle: Rotation angle (in degrees) of the first sprite.
+    - angle_step: Difference in rotation angle (in degrees) between the sprites.
+    """
+
+    atlas: pygame.Surface
+    sprites: typing.List[pygame.Surface]
+    offsets: typing.List[typing.Tuple[float, float]]
+    start_angle: float
+    angle_step: float
+
+    def get_index(self, angle: float) -> int:
+        """Get the index of the sprite closest to a given flipper angle.
+
+        Args:
+            angle (float): Angle of the flipper in the global frame (in radians).
+
+        Returns:
+            int: Sprite index, clamped to the range of the atlas.
+        """
+        index = round((math.degrees(-angle) - self.start_angle) / self.angle_step)
+        return min(max(index, 0), len(self.sprites) - 1)
+
+
+def get_quantised_angles(
+    min_angle: float, max_angle: float, angle_step: float
+) -> typing.List[float]:
+    """Get the rotation angles (in degrees) to pre-render for a flipper that moves
+    between two angles. Rotations are in the pygame convention, i.e. ``-angle``.
+
+    Args:
+        min_angle (float): Minimum flipper angle in the global frame (in radians).
+        max_angle (float): Maximum flipper angle in the global frame (in radians).
+        angle_step (float): Quantisation step (in degrees).
+
+    Returns:
+        List[float]: Rotation angles in degrees, in ascending order.
+    """
+    low = math.degrees(-max_angle)
+    high = math.degrees(-min_angle)
+    start = math.floor(low / angle_step)
+    stop = math.ceil(high / angle_step)
+    return [i * angle_step for i in range(start, stop + 1)]
+
+
+def build_flipper_sprites(
+    icon: pygame.Surface,
+    size: typing.Tuple[int, int],
+    min_angle: float,
+    max_angle: float,
+    angle_step: float,
+) -> FlipperSprites:
+    """Render all the quantised rotations of a flipper into a single atlas surface.
+
+    Args:
+        icon (pygame.Surface): Flipper icon.
+        size (typing.Tuple[int, int]): Size of the flipper icon to render (in pixels).
+        min_angle (float): Minimum flipper angle in the global frame (in radians).
+        max_angle (float): Maximum flipper angle in the global frame (in radians).
+        angle_step (float): Quantisation step (in degrees).
+
+    Returns:
+        FlipperSprites: Atlas and sprite metadata.
+    """
+    angles = get_quantised_angles(
+        min_angle=min_angle, max_angle=max_angle, angle_step=angle_step
+    )
+    scaled = pygame.transform.scale(icon, size=size)
+    rotated = [pygame.transform.rotate(scaled, angle=angle) for angle in angles]
+
+    width = sum(img.get_width() for img in rotated)
+    height = max(img.get_height() for img in rotated)
+    atlas = pygame.Surface(size=(width, height), flags=pygame.SRCALPHA)
+
+    rects = list()
+    x = 0
+    for img in rotated:
+        rects.append(atlas.blit(img, (x, 0)))
+        x += img.get_width()
+
+    return FlipperSprites(
+        atlas=atlas,
+        sprites=[atlas.subsurface(rect) for rect in rects],
+        offsets=[(-rect.width * 0.5, -rect.height * 0.5) for rect in rects],
+        start_angle=angles[0],
+        angle_step=angle_step,
+    )
+
+
+class FlipperAtlas:
+    """The FlipperAtlas class holds the pre-rendered rotations of each flipper. Atlases
+    are built with ``build()``, either straight away or in a worker thread, after which
+    ``get()`` is a lookup by index that does not allocate or rotate anything.
+
+    Args:
+        icon_path (ImageSource): Path to the flipper icon, or a future for the loaded icon.
+        angle_step (float): Quantisation step (in degrees) between the rotations.
+    """
+
+    def __init__(self, icon_path: ImageSource, angle_step: float) -> None:
+        self._icon_img = LazyImage(source=icon_path)
+        self._angle_step = angle_step
+        self._sprites: typing.Dict[int, FlipperSprites] = dict()
+        self._threads: typing.List[threading.Thread] = list()
+
+    def __contains__(self, uid: int) -> bool:
+        return uid in self._sprites
+
+    def build(
+        self,
+        uid: int,
+        size: typing.Tuple[int, int],
+        min_angle: float,
+        max_angle: float,
+        background: bool = False,
+    ) -> None:
+        """Build the atlas for a flipper. Until it has been built, the flipper is not
+        in the atlas (i.e. ``uid in atlas`` is ``False``).
+
+        Args:
+            uid (int): Unique ID of the flipper.
+            size (typing.Tuple[int, int]): Size of the flipper icon (in pixels).
+            min_angle (float): Minimum flipper angle in the global frame (in radians).
+            max_angle (float): Maximum flipper angle in the global frame (in radians).
+            background (bool): Whether to build the atlas in a worker thread.
+        """
+        # Resolve the icon on the calling thread, as it is converted to the pixel format
+        # of the display.
+        icon = self._icon_img.get()
+
+        def _build() -> None:
+            sprites = build_flipper_sprites(
+                icon=icon,
+                size=size,
+                min_angle=min_angle,
+                max_angle=max_angle,
+                angle_step=self._angle_step,
+            )
+            logger.debug(
+                "Built flipper atlas, uid: %s, sprites: %d", uid, len(sprites.sprites)
+            )
+            self._sprites[uid] = sprites
+
+        if not background:
+            _build()
+            return
+
+        thread = threading.Thread(target=_build, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def get(
+        self, uid: int, angle: float
+    ) -> typing.Tuple[pygame.Surface, typing.Tuple[float, float]]:
+        """Get the pre-rendered sprite for a flipper at a given angle.
+
+        Args:
+            uid (int): Unique ID of the flipper.
+            angle (float): Angle of the flipper in the global frame (in radians).
+
+        Raises:
+            KeyError: If the atlas for the flipper has not been built.
+
+        Returns:
+            Tuple[pygame.Surface, Tuple[float, float]]: Sprite, and the offset from the
+                centre of the flipper to the top-left corner of the sprite.
+        """
+        sprites = self._sprites[uid]
+        index = sprites.get_index(angle=angle)
+        return sprites.sprites[index], sprites.offsets[index]
+
+    def wait(self) -> None:
+        """Wait for any atlases being built in worker threads to finish."""
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
@@ -0,0 +1,58 @@
+"""Module containing the LazyImage class, which lets the display caches be given either
+the path of an image or a future for an image that is being loaded by an
+``AssetLoader``."""
+
+import concurrent.futures
+import typing
+
+import pygame
+
+# Type alias for the source of an image, either a file path, a future for a surface that
+# is being loaded, or an (unconverted) surface.
+ImageSource = typing.Union[
+    str, "concurrent.futures.Future[pygame.Surface]", pygame.Surface
+]
+
+
+def load_image(path: str) -> pygame.Surface:
+    """Load (i.e. read and decode) an image file. This does not convert the surface to
+    the pixel format of the display, so it is safe to call from a worker thread.
+
+    Args:
+        path (str): Path to the image file.
+
+    Returns:
+        pygame.Surface: Loaded image.
+    """
+    return pygame.image.load(path)
+
+
+class LazyImage:
+    """The LazyImage class resolves an ``ImageSource`` into a surface (converted to the
+    pixel format of the display, with alpha) the first time it is needed. If the source
+    is a future this waits for it to finish loading.
+
+    Args:
+        source (ImageSource): Path to the image, a future for the loaded image or the
+            image itself.
+    """
+
+    def __init__(self, source: ImageSource) -> None:
+        self._source = source
+        self._surface: typing.Optional[pygame.Surface] = None
+
+    def get(self) -> pygame.Surface:
+        """Get the surface, loading (or waiting for) it if this is the first call.
+
+        Returns:
+            pygame.Surface: Image surface.
+        """
+        if self._surface is None:
+            if isinstance(self._source, concurrent.futures.Future):
+                surface = self._source.result()
+            elif isinstance(self._source, pygame.Surface):
+                surface = self._source
+            else:
+                surface = load_image(path=self._source)
+            self._surface = surface.convert_alpha()
+        return self._surface
@@ -0,0 +1,83 @@
+import typing
+
+from .display_interface import DisplayInterface
+
+
+class NullDisplay(DisplayInterface):
+    """Implementation of a DisplayInterface class that does not draw anything. This is
+    intended for running the game headless (e.g. batch simulations), where the
+    ``update()`` method must not block on a frame rate clock so that the physics can be
+    stepped as fast as the CPU allows."""
+
+    def begin_static_layer(self, revision: int) -> bool:
+        return False
+
+    def end_static_layer(self) -> None:
+        pass
+
+    def draw_static_layer(self) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def draw_background(self) -> None:
+        pass
+
+    def draw_ball(
+        self, pos: typing.Tuple[float, float], diameter: float, alpha: float
+    ) -> None:
+        pass
+
+    def draw_flipper(
+        self,
+        uid: int,
+        pos: typing.Tuple[float, float],
+        angle: float,
+        size: typing.Tuple[float, float],
+        alpha: float,
+    ) -> None:
+        pass
+
+    def draw_round_bumper(
+        self,
+        uid: int,
+        pos: typing.Tuple[float, float],
+        diameter: float,
+        alpha: float,
+    ) -> None:
+        pass
+
+    def draw_rectangle_bumper(
+        self,
+        uid: int,
+        pos: typing.Tuple[float, float],
+        size: typing.Tuple[float, float],
+        angle: float,
+        alpha: float,
+    ) -> None:
+        pass
+
+    def draw_lives(self, lives: int) -> None:
+        pass
+
+    def draw_score(self, score: str) -> None:
+        pass
+
+    def draw_overlay(self, lines: typing.List[str]) -> None:
+        pass
+
+    def preload_flipper(
+        self,
+        uid: int,
+        size: typing.Tuple[float, float],
+        min_angle: float,
+        max_angle: float,
+    ) -> None:
+        pass
+
+    def update(self) -> None:
+        pass
@@ -1,19 +1,105 @@
+import os
 import typing
 
 import pygame
 
 from .. import config, events, log
+from ..asset_loader import AssetLoader
+from ..resources import AssetBundle
 from .ball_cache import BallCache, BumperCache, FlipperCache
 from .display_interface import DisplayInterface
+from .flipper_atlas import FlipperAtlas
+from .image_source import ImageSource, LazyImage, load_image
 from .pygame_lives import LivesCache
-from .pygame_score import ScoringCache
+from .pygame_score import DigitScoreRenderer
+from .surface_cache import SurfaceCache, SurfaceCacheStats
 from .utils import calculate_rectangle_bounding_box_image_coordinates
 
 logger = log.get_logger(name=__name__)
 
 
+# Default memory budget of the surface cache shared by the bumpers and flippers.
+DEFAULT_SURFACE_CACHE_BYTES = 16 * 1024 * 1024
+
+# Font and size of the text drawn by ``draw_overlay()``.
+OVERLAY_FONT = "monospace"
+OVERLAY_FONT_SIZE = 14
+
+# Type alias for an item drawn in a frame, in the format (surface, destination rect).
+DrawItem = typing.Tuple[pygame.Surface, pygame.Rect]
+
+
+def get_image_sources(
+    config: config.DisplayConfig,
+    asset_loader: typing.Optional[AssetLoader] = None,
+    bundle: typing.Optional[AssetBundle] = None,
+) -> typing.Dict[str, ImageSource]:
+    """Get the source of each image in a display configuration. Images in the asset
+    bundle (matched by file name) are taken from it. Otherwise, if an asset loader is
+    given, then each (unique) image starts loading in it and the source is a future,
+    else the source is the path of the image.
+
+    Args:
+        config (DisplayConfig): Display configuration with the image asset paths.
+        asset_loader (AssetLoader, optional): Loader used to load the images.
+        bundle (AssetBundle, optional): Bundle of pre-decoded images.
+
+    Returns:
+        Dict[str, ImageSource]: Image sources, keyed by path.
+    """
+    paths = [
+        config.background_image_path,
+        config.ball_image_path,
+        config.round_bumper_image_path,
+        config.rectangle_bumper_image_path,
+        config.flipper_image_path,
+        config.life_icon_path,
+    ]
+    sources: typing.Dict[str, ImageSource] = dict()
+    for path in paths:
+        if path in sources:
+            continue
+        name = os.path.basename(path)
+        if bundle is not None and name in bundle:
+            sources[path] = bundle.get_image(name=name)
+        elif asset_loader is None:
+            sources[path] = path
+        else:
+            sources[path] = asset_loader.submit(path, load_image, path=path)
+    return sources
+
+
 class PyGameDisplay(DisplayInterface):
-    """Implementation of a DisplayInterface class that uses PyGame as the underling Graphics engine/manager."""
+    """Implementation of a DisplayInterface class that uses PyGame as the underling Graphics engine/manager.
+
+    When ``dirty_rects`` is enabled the draw calls are recorded rather than blitted
+    straight to the screen. In ``update()`` the recorded frame is compared with the
+    previous one, and only the regions covered by sprites that have moved, changed or
+    disappeared are recomposed (background first, then every sprite overlapping the
+    region in draw order) and pushed to the display with ``pygame.display.update()``.
+    The full screen is only redrawn on the first frame or after ``invalidate()``.
+
+    The background and bumpers are rendered once into a static layer surface (see
+    ``begin_static_layer()``), which is re-used every frame until the revision of the
+    static content changes. When using dirty rectangles the static layer is the base
+    that regions are recomposed from.
+
+    Args:
+        width (int): Width of the display window in pixels.
+        height (int): Height of the display window in pixels.
+        game_events (GameEventPublisher): Publisher used to emit the ``QUIT`` event.
+        config (DisplayConfig): Display configuration with the image asset paths.
+        fps (float): Target frame rate.
+        dirty_rects (bool): Whether to only redraw the regions of the screen that change.
+        build_atlas_in_background (bool): Whether to build the flipper atlases (see
+            ``preload_flipper()``) in a worker thread rather than blocking.
+        surface_cache_bytes (int, optional): Memory budget of the cache shared by the
+            bumper and flipper surfaces. If ``None`` the cache is unbounded.
+        asset_loader (AssetLoader, optional): Loader used to load the images
+            concurrently. If ``None`` the images are loaded on the calling thread.
+        asset_bundle (AssetBundle, optional): Bundle of pre-decoded images, which are
+            used instead of loading the image files.
+    """
 
     def __init__(
         self,
@@ -22,9 +108,18 @@ class PyGameDisplay(DisplayInterface):
         game_events: events.GameEventPublisher,
         config: config.DisplayConfig,
         fps: float,
+        dirty_rects: bool = False,
+        build_atlas_in_background: bool = False,
+        surface_cache_bytes: typing.Optional[int] = DEFAULT_SURFACE_CACHE_BYTES,
+        asset_loader: typing.Optional[AssetLoader] = None,
+        asset_bundle: typing.Optional[AssetBundle] = None,
     ) -> None:
         self._width = width
         self._game_events = game_events
+        # Start loading the images before creating the window, so that these overlap.
+        self._images = get_image_sources(
+            config=config, asset_loader=asset_loader, bundle=asset_bundle
+        )
         pygame.init()
         pygame.font.init()
         self._screen = pygame.display.set_mode(size=(width, height))
@@ -34,40 +129,103 @@ class PyGameDisplay(DisplayInterface):
 
         self._background_surface = pygame.Surface(size=(width, height))
         self._background_surface.blit(
-            source=pygame.image.load(config.background_image_path).convert_alpha(),
+            source=LazyImage(source=self._images[config.background_image_path]).get(),
             dest=(0, 0),
         )
 
+        self._surface_cache = SurfaceCache(max_bytes=surface_cache_bytes)
+
         self._lives_cache = LivesCache(
             max_lives=5,
-            icon_path=config.life_icon_path,
+            icon_path=self._images[config.life_icon_path],
             icon_width=25,
             icon_spacing=3,
         )
-        self._score_cache = ScoringCache(max_score=500)
+        self._score_renderer = DigitScoreRenderer()
+        self._overlay_font: typing.Optional[pygame.font.Font] = None
+        self._overlay_lines: typing.Tuple[str, ...] = tuple()
+        self._overlay_surface: typing.Optional[pygame.Surface] = None
 
         self._ball_cache: typing.Union[BallCache, None] = None
 
         self._round_bumper_cache = BumperCache(
-            icon_path=config.round_bumper_image_path,
+            icon_path=self._images[config.round_bumper_image_path],
+            cache=self._surface_cache,
         )
 
         self._rect_bumper_cache = BumperCache(
-            icon_path=config.rectangle_bumper_image_path,
+            icon_path=self._images[config.rectangle_bumper_image_path],
+            cache=self._surface_cache,
         )
 
         self._flipper_cache = FlipperCache(
-            icon_path=config.flipper_image_path,
+            icon_path=self._images[config.flipper_image_path],
             angle_rounding=5,
+            cache=self._surface_cache,
         )
 
+        self._flipper_atlas = FlipperAtlas(
+            icon_path=self._images[config.flipper_image_path],
+            angle_step=5,
+        )
+        self._build_atlas_in_background = build_atlas_in_background
+
+        self._static_surface = pygame.Surface(size=(width, height))
+        self._static_surface.fill(pygame.Color("white"))
+        self._static_surface.blit(self._background_surface, (0, 0))
+        self._static_revision: typing.Optional[int] = None
+        self._static_target: typing.Optional[pygame.Surface] = None
+
+        self._dirty_rects = dirty_rects
+        self._full_redraw = True
+        self._frame: typing.List[DrawItem] = list()
+        self._previous_frame: typing.List[DrawItem] = list()
+
+    @property
+    def surface_cache_stats(self) -> SurfaceCacheStats:
+        """Get the statistics of the cache shared by the bumper and flipper surfaces.
+
+        Returns:
+            SurfaceCacheStats: Cache statistics.
+        """
+        return self._surface_cache.stats
+
+    def begin_static_layer(self, revision: int) -> bool:
+        if revision == self._static_revision:
+            return False
+        logger.debug("Rendering the static layer, revision: %s", revision)
+        self._static_surface.fill(pygame.Color("white"))
+        self._static_target = self._static_surface
+        self._static_revision = revision
+        return True
+
+    def end_static_layer(self) -> None:
+        self._static_target = None
+        self.invalidate()
+
+    def draw_static_layer(self) -> None:
+        if self._dirty_rects:
+            # The static layer is always the bottom layer when a region is recomposed.
+            return
+        self._screen.blit(self._static_surface, (0, 0))
+
     def clear(self) -> None:
+        if self._dirty_rects:
+            self._frame = list()
+            return
         self._screen.fill(pygame.Color("white"))
 
     def close(self) -> None:
         pygame.quit()
 
     def draw_background(self) -> None:
+        if self._static_target is not None:
+            self._static_target.blit(self._background_surface, (0, 0))
+            return
+        if self._dirty_rects:
+            # The background is part of the static layer, which is always the bottom
+            # layer when a region is recomposed.
+            return
         self._screen.blit(self._background_surface, (0, 0))
 
     def draw_ball(
@@ -75,7 +233,7 @@ class PyGameDisplay(DisplayInterface):
     ) -> None:
         if self._ball_cache is None:
             self._ball_cache = BallCache(
-                icon_path=self._config.ball_image_path,
+                icon_path=self._images[self._config.ball_image_path],
                 diameter=int(diameter),
             )
 
@@ -83,7 +241,7 @@ class PyGameDisplay(DisplayInterface):
             pos=pos, size=(diameter, diameter), angle=0.0
         )
 
-        self._screen.blit(self._ball_cache.get(), (x, y))
+        self._blit(surface=self._ball_cache.get(), dest=(x, y))
 
     def draw_round_bumper(
         self, uid: int, pos: typing.Tuple[float, float], diameter: float, alpha: float
@@ -95,7 +253,7 @@ class PyGameDisplay(DisplayInterface):
             pos=pos, size=(diameter, diameter), angle=0.0
         )
 
-        self._screen.blit(img, (x, y))
+        self._blit(surface=img, dest=(x, y))
 
     def draw_rectangle_bumper(
         self,
@@ -117,7 +275,7 @@ class PyGameDisplay(DisplayInterface):
             pos=pos, size=(width, height), angle=angle
         )
 
-        self._screen.blit(img, (x, y))
+        self._blit(surface=img, dest=(x, y))
 
     def draw_flipper(
         self,
@@ -127,6 +285,12 @@ class PyGameDisplay(DisplayInterface):
         size: typing.Tuple[float, float],
         alpha: float,
     ) -> None:
+        if uid in self._flipper_atlas:
+            img, offset = self._flipper_atlas.get(uid=uid, angle=angle)
+            self._blit(surface=img, dest=(pos[0] + offset[0], pos[1] + offset[1]))
+            return
+
+        # Fall back to rotating on demand until the atlas has been built.
         width = size[0]
         height = size[1]
 
@@ -142,17 +306,50 @@ class PyGameDisplay(DisplayInterface):
             angle=angle,
         )
 
-        self._screen.blit(img, (x, y))
+        self._blit(surface=img, dest=(x, y))
 
     def draw_lives(self, lives: int) -> None:
         surface = self._lives_cache[lives]
-        self._screen.blit(surface, (self._width - surface.get_rect().width, 0))
+        self._blit(surface=surface, dest=(self._width - surface.get_rect().width, 0))
 
     def draw_score(self, score: str) -> None:
-        self._screen.blit(self._score_cache[int(score)], (0, 0))
+        self._blit(surface=self._score_renderer.get(score=int(score)), dest=(0, 0))
+
+    def draw_overlay(self, lines: typing.List[str]) -> None:
+        # Only re-render the text when it changes.
+        if self._overlay_surface is None or tuple(lines) != self._overlay_lines:
+            self._overlay_lines = tuple(lines)
+            self._overlay_surface = self._render_overlay(lines=lines)
+        height = self._overlay_surface.get_height()
+        self._blit(
+            surface=self._overlay_surface, dest=(0, self._screen.get_height() - height)
+        )
+
+    def preload_flipper(
+        self,
+        uid: int,
+        size: typing.Tuple[float, float],
+        min_angle: float,
+        max_angle: float,
+    ) -> None:
+        self._flipper_atlas.build(
+            uid=uid,
+            size=(int(size[0]), int(size[1])),
+            min_angle=min_angle,
+            max_angle=max_angle,
+            background=self._build_atlas_in_background,
+        )
+
+    def invalidate(self) -> None:
+        """Force the whole screen to be redrawn on the next ``update()`` when using
+        dirty rectangle rendering."""
+        self._full_redraw = True
 
     def update(self) -> None:
-        pygame.display.flip()
+        if self._dirty_rects:
+            self._present_dirty_rects()
+        else:
+            pygame.display.flip()
         self._clock.tick(self._fps)
         pygame.display.set_caption("fps: " + str(self._clock.get_fps()))
 
@@ -161,3 +358,99 @@ class PyGameDisplay(DisplayInterface):
                 logger.info("Closing display window")
                 self._game_events.emit(event=events.GameEvents.QUIT)
                 break
+            if event.type == pygame.WINDOWEXPOSED:
+                self.invalidate()
+
+    def _blit(self, surface: pygame.Surface, dest: typing.Tuple[float, float]) -> None:
+        """Blit a surface to the screen (or the static layer if it is being rendered),
+        or record it for the frame when using dirty rectangle rendering.
+
+        Args:
+            surface (pygame.Surface): Surface to draw.
+            dest (tuple): Top-left coordinate to draw the surface at, in (x, y) format.
+        """
+        if self._static_target is not None:
+            self._static_target.blit(surface, dest)
+            return
+        if not self._dirty_rects:
+            self._screen.blit(surface, dest)
+            return
+        # Note: ``pygame.Rect`` truncates the coordinates in the same way as ``blit()``,
+        # whereas ``Surface.get_rect(topleft=...)`` rounds them.
+        self._frame.append((surface, pygame.Rect(dest, surface.get_size())))
+
+    def _render_overlay(self, lines: typing.List[str]) -> pygame.Surface:
+        """Render lines of text onto a translucent background.
+
+        Args:
+            lines (list): Lines of text.
+
+        Returns:
+            pygame.Surface: Rendered text.
+        """
+        if self._overlay_font is None:
+            self._overlay_font = pygame.font.SysFont(
+                name=OVERLAY_FONT, size=OVERLAY_FONT_SIZE
+            )
+        rendered = [
+            self._overlay_font.render(line, True, pygame.Color("white"))
+            for line in lines
+        ]
+        width = max((r.get_width() for r in rendered), default=0)
+        line_height = self._overlay_font.get_linesize()
+        surface = pygame.Surface(
+            size=(width, line_height * len(rendered)), flags=pygame.SRCALPHA
+        )
+        surface.fill((0, 0, 0, 160))
+        for i, line in enumerate(rendered):
+            surface.blit(line, (0, i * line_height))
+        return surface
+
+    def _get_dirty_rects(self) -> typing.List[pygame.Rect]:
+        """Get the regions of the screen that differ between the previous and current
+        frame, i.e. the rects of sprites that have been added, moved, changed surface
+        or removed.
+
+        Returns:
+            List[pygame.Rect]: Dirty regions, clipped to the screen.
+        """
+
+        def _keys(frame: typing.List[DrawItem]) -> typing.Set[typing.Tuple]:
+            return {(id(surface), tuple(rect)) for surface, rect in frame}
+
+        current = _keys(self._frame)
+        previous = _keys(self._previous_frame)
+        screen_rect = self._screen.get_rect()
+
+        dirty = list()
+        for frame, other in [(self._previous_frame, current), (self._frame, previous)]:
+            for surface, rect in frame:
+                if (id(surface), tuple(rect)) in other:
+                    continue
+                rect = rect.clip(screen_rect)
+                if rect.width > 0 and rect.height > 0:
+                    dirty.append(rect)
+        return dirty
+
+    def _present_dirty_rects(self) -> None:
+        """Compose the recorded frame and push the changed regions to the display."""
+        if self._full_redraw:
+            self._screen.blit(self._static_surface, (0, 0))
+            for surface, rect in self._frame:
+                self._screen.blit(surface, rect)
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            dirty = self._get_dirty_rects()
+            for region in dirty:
+                self._screen.set_clip(region)
+                self._screen.blit(self._static_surface, region, area=region)
+                for surface, rect in self._frame:
+                    if rect.colliderect(region):
+                        self._screen.blit(surface, rect)
+            self._screen.set_clip(None)
+            if dirty:
+                pygame.display.update(dirty)
+
+        self._previous_frame = self._frame
+        self._frame = list()
@@ -3,6 +3,7 @@ import typing
 import pygame
 
 from .. import log
+from .image_source import ImageSource, LazyImage
 
 logger = log.get_logger(name=__name__)
 
@@ -46,12 +47,14 @@ class LivesCache:
     to represent the number of remaining lives. This class should be liked like a
     dictionary where the key is the number of lives to be remaining, and the value is
     the ``pygame.Surface`` that can be used to render the visual representation of this.
+
+    The ``icon_path`` can also be a future for an icon being loaded by an ``AssetLoader``.
     """
 
     def __init__(
-        self, max_lives: int, icon_path: str, icon_width: int, icon_spacing: int
+        self, max_lives: int, icon_path: ImageSource, icon_width: int, icon_spacing: int
     ) -> None:
-        icon = pygame.image.load(icon_path).convert_alpha()
+        icon = LazyImage(source=icon_path).get()
         icon = pygame.transform.scale(icon, (icon_width, icon_width))
 
         self._cache = dict()
@@ -6,6 +6,7 @@ import typing
 import pygame
 
 from .. import log
+from .surface_cache import NamespacedCache, SurfaceCache
 
 logger = log.get_logger(name=__name__)
 
@@ -36,25 +37,108 @@ def generate_scoring_cache(
     return ret
 
 
-class ScoringCache:
+class ScoringCache(NamespacedCache):
     """The ScoringCache class contains an internal mapping between a score and the
     pygame.Surface that can be used to render the score to the main pygame.Surface.
 
     This can be used as if it were a dictionary via index accessing, though the index
     should be an ``int``. If another type is used to access then an ``TypeError`` is
-    thrown and if the score value is not in the cache (e.g., a score higher than the
+    thrown and if the score value is out of range (e.g., a score higher than the
     maximum score has been requested) then a default Surface with '---' is returned.
+
+    Scores are rendered the first time they are requested and stored in a
+    ``SurfaceCache``, so the memory used is bounded by the budget of that cache rather
+    than by ``max_score``.
+
+    Args:
+        max_score (int): Maximum score value that can be rendered.
+        cache (SurfaceCache, optional): Surface cache to store the rendered scores in.
+        font (str, optional): Font to use. Defaults to "Comic Sans MS".
+        size (int, optional): Size of the font. Defaults to 35.
+        color (typing.Tuple[int, int, int], optional): Font RGB color. Defaults to (255, 255, 255).
     """
 
-    def __init__(self, max_score: int) -> None:
-        self._cache = generate_scoring_cache(max_score=max_score)
+    def __init__(
+        self,
+        max_score: int,
+        cache: typing.Optional[SurfaceCache] = None,
+        font: str = "Comic Sans MS",
+        size: int = 35,
+        color: typing.Tuple[int, int, int] = (255, 255, 255),
+    ) -> None:
+        super().__init__(cache=cache)
+        pygame.font.init()
+        self._font = pygame.font.SysFont(name=font, size=size)
+        self._color = color
+        self._max_score = max_score
+        self._unknown_score = self._font.render("---", False, color)
 
     def __getitem__(self, index: int) -> pygame.Surface:
         if not isinstance(index, int):
             raise TypeError(f"Type of index must be an int, got: {type(index)}")
 
-        if index not in self._cache.keys():
+        if index < 0 or index > self._max_score:
             logger.warning(f"ScoreCache value not in the cache, index: {index}")
-            return self._cache[-1]
+            return self._unknown_score
+
+        return self._cache.get_or_create(
+            key=(self._namespace, index),
+            factory=lambda: self._font.render(str(index), False, self._color),
+        )
+
+
+class DigitScoreRenderer:
+    """The DigitScoreRenderer class renders a score of any size by composing pre-rendered
+    glyphs for the digits 0-9 (and a minus sign), rather than rendering the text with the
+    font each time. Only the surface for the most recently requested score is kept, so
+    the memory used is constant and there is no maximum score.
+
+    Args:
+        font (str, optional): Font to use. Defaults to "Comic Sans MS".
+        size (int, optional): Size of the font. Defaults to 35.
+        color (typing.Tuple[int, int, int], optional): Font RGB color. Defaults to (255, 255, 255).
+    """
+
+    def __init__(
+        self,
+        font: str = "Comic Sans MS",
+        size: int = 35,
+        color: typing.Tuple[int, int, int] = (255, 255, 255),
+    ) -> None:
+        pygame.font.init()
+        _font = pygame.font.SysFont(name=font, size=size)
+        self._glyphs = {c: _font.render(c, False, color) for c in "0123456789-"}
+        self._height = max(g.get_height() for g in self._glyphs.values())
+        self._last_score: typing.Optional[int] = None
+        self._last_surface: typing.Optional[pygame.Surface] = None
+
+    def get(self, score: int) -> pygame.Surface:
+        """Get a surface with a score rendered on it. If the score is the same as the
+        previous call, then the same surface is returned.
+
+        Args:
+            score (int): Score value.
+
+        Raises:
+            TypeError: If the score is not an ``int``.
+
+        Returns:
+            pygame.Surface: Surface with the score rendered on it.
+        """
+        if not isinstance(score, int):
+            raise TypeError(f"Type of score must be an int, got: {type(score)}")
+
+        if score == self._last_score and self._last_surface is not None:
+            return self._last_surface
+
+        glyphs = [self._glyphs[c] for c in str(score)]
+        width = sum(g.get_width() for g in glyphs)
+        surface = pygame.Surface(size=(width, self._height), flags=pygame.SRCALPHA)
+        x = 0
+        for glyph in glyphs:
+            surface.blit(glyph, (x, 0))
+            x += glyph.get_width()
 
-        return self._cache[index]
+        self._last_score = score
+        self._last_surface = surface
+        return surface
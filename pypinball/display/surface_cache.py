@@ -0,0 +1,222 @@
+"""Module containing the SurfaceCache class, a least-recently-used cache of
+``pygame.Surface`` instances with a memory budget, which is shared between the various
+display caches."""
+
+import collections
+import dataclasses
+import typing
+
+import pygame
+
+from .. import log
+
+logger = log.get_logger(name=__name__)
+
+# Type alias for the key of a cached surface.
+CacheKey = typing.Hashable
+
+
+@dataclasses.dataclass
+class SurfaceCacheStats:
+    """
+    Statistics for monitoring a ``SurfaceCache``.
+
+    - hits: Number of lookups that found a cached surface.
+    - misses: Number of lookups that did not find a cached surface.
+    - evictions: Number of surfaces evicted to stay within the memory budget.
+    - entries: Number of surfaces currently cached.
+    - num_bytes: Estimated memory used by the cached surfaces.
+    - max_bytes: Memory budget (``None`` if unbounded).
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    num_bytes: int = 0
+    max_bytes: typing.Optional[int] = None
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of lookups that found a cached surface.
+
+        Returns:
+            float: Hit rate in the range [0, 1].
+        """
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+
+def get_surface_num_bytes(surface: pygame.Surface) -> int:
+    """Estimate the memory used by the pixels of a surface, from its size and bit depth.
+
+    Args:
+        surface (pygame.Surface): Surface.
+
+    Returns:
+        int: Number of bytes.
+    """
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+class SurfaceCache:
+    """The SurfaceCache class stores surfaces against a key, evicting the least recently
+    used surfaces when the estimated memory of the cached surfaces exceeds the budget.
+    A surface larger than the whole budget is returned to the caller but not cached.
+
+    Several caches can share a single instance by using distinct keys (e.g. prefixing
+    them with a namespace), which means they share the one budget.
+
+    Args:
+        max_bytes (int, optional): Memory budget in bytes. If ``None`` the cache is
+            unbounded.
+    """
+
+    def __init__(self, max_bytes: typing.Optional[int] = None) -> None:
+        self._cache: typing.OrderedDict[CacheKey, typing.Tuple[pygame.Surface, int]] = (
+            collections.OrderedDict()
+        )
+        self._stats = SurfaceCacheStats(max_bytes=max_bytes)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self._cache
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def stats(self) -> SurfaceCacheStats:
+        """Get the cache statistics.
+
+        Returns:
+            SurfaceCacheStats: Statistics.
+        """
+        return self._stats
+
+    def keys(self) -> typing.List[CacheKey]:
+        """Get the keys of the cached surfaces, from least to most recently used.
+
+        Returns:
+            List[CacheKey]: Keys.
+        """
+        return list(self._cache.keys())
+
+    def get(self, key: CacheKey) -> typing.Optional[pygame.Surface]:
+        """Get a cached surface, marking it as the most recently used.
+
+        Args:
+            key (CacheKey): Key of the surface.
+
+        Returns:
+            pygame.Surface: Surface, or ``None`` if it is not cached.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self._stats.hits += 1
+        return entry[0]
+
+    def get_or_create(
+        self, key: CacheKey, factory: typing.Callable[[], pygame.Surface]
+    ) -> pygame.Surface:
+        """Get a cached surface, creating (and caching) it if it is not cached.
+
+        Args:
+            key (CacheKey): Key of the surface.
+            factory (Callable): Method that creates the surface.
+
+        Returns:
+            pygame.Surface: Surface.
+        """
+        surface = self.get(key=key)
+        if surface is None:
+            surface = factory()
+            self.put(key=key, surface=surface)
+        return surface
+
+    def put(self, key: CacheKey, surface: pygame.Surface) -> None:
+        """Add a surface to the cache, evicting the least recently used surfaces if
+        needed to stay within the budget.
+
+        Args:
+            key (CacheKey): Key of the surface.
+            surface (pygame.Surface): Surface to cache.
+        """
+        self.discard(key=key)
+
+        num_bytes = get_surface_num_bytes(surface=surface)
+        max_bytes = self._stats.max_bytes
+        if max_bytes is not None and num_bytes > max_bytes:
+            logger.warning(
+                f"Surface is larger than the cache budget, not caching: {key}"
+            )
+            return
+
+        self._cache[key] = (surface, num_bytes)
+        self._stats.num_bytes += num_bytes
+
+        if max_bytes is not None:
+            while self._stats.num_bytes > max_bytes:
+                evicted_key, (_, evicted_bytes) = self._cache.popitem(last=False)
+                self._stats.num_bytes -= evicted_bytes
+                self._stats.evictions += 1
+                logger.debug("Evicted surface from cache: %s", evicted_key)
+
+        self._stats.entries = len(self._cache)
+
+    def discard(self, key: CacheKey) -> None:
+        """Remove a surface from the cache, if it is cached.
+
+        Args:
+            key (CacheKey): Key of the surface.
+        """
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._stats.num_bytes -= entry[1]
+            self._stats.entries = len(self._cache)
+
+    def clear(self) -> None:
+        """Remove all the surfaces from the cache. The statistics are kept."""
+        self._cache.clear()
+        self._stats.num_bytes = 0
+        self._stats.entries = 0
+
+
+class NamespacedCache:
+    """Base class for caches that store their surfaces in a (possibly shared)
+    ``SurfaceCache``. Keys are prefixed with a namespace unique to the instance so that
+    several caches can share one ``SurfaceCache`` and its memory budget.
+
+    Args:
+        cache (SurfaceCache, optional): Surface cache to use. If ``None`` an unbounded
+            cache is created for this instance.
+    """
+
+    def __init__(self, cache: typing.Optional[SurfaceCache] = None) -> None:
+        self._cache = SurfaceCache() if cache is None else cache
+        self._namespace = (type(self).__name__, id(self))
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        for key in self._keys():
+            self._cache.discard(key=key)
+
+    def _keys(self) -> typing.List[typing.Tuple]:
+        """Get the keys in the surface cache that belong to this instance.
+
+        Returns:
+            List[Tuple]: Keys.
+        """
+        return [
+            key
+            for key in self._cache.keys()
+            if isinstance(key, tuple) and key and key[0] == self._namespace
+        ]
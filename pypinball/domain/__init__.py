@@ -1,4 +1,4 @@
-from .ball import Ball, BallState
+from .ball import Ball, BallState, BallStateArrays
 from .bumper import Bumper, BumperType, RectangleBumper, RoundBumper
 from .flipper import Flipper, FlipperConfig, FlipperState
 from .wall import Wall
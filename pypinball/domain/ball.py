@@ -1,6 +1,8 @@
 import dataclasses
 import typing
 
+import numpy
+
 
 class Ball:
     """
@@ -85,3 +87,27 @@ class BallState:
     uid: int
     position: typing.Tuple[float, float]
     radius: float
+
+
+@dataclasses.dataclass
+class BallStateArrays:
+    """
+    Dataclass to capture the state of all the Balls in the Physics environment as
+    contiguous NumPy arrays, where each row corresponds to a single ball.
+
+    - uids: Unique IDs of the balls, with shape (N,).
+    - positions: Positions in the format (x, y), with shape (N, 2).
+    - velocities: Velocities in the format (x, y), with shape (N, 2).
+    - radii: Radius of each ball, with shape (N,).
+    - previous_positions: Positions before the last physics step, with shape (N, 2).
+      This is optional and is used to interpolate positions when rendering.
+    """
+
+    uids: numpy.ndarray
+    positions: numpy.ndarray
+    velocities: numpy.ndarray
+    radii: numpy.ndarray
+    previous_positions: typing.Optional[numpy.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.uids)
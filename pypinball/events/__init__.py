@@ -1,3 +1,4 @@
+from .async_subscriber import AsyncSubscriber, OverflowPolicy, SubscriberStats
 from .event_publisher import EventPublisher
 from .game_event_publisher import GameEventPublisher
 from .game_events import GameEvents
@@ -0,0 +1,150 @@
+"""Module containing the AsyncSubscriber class, which delivers events to a subscriber
+callback on a worker thread via a bounded queue."""
+
+import collections
+import dataclasses
+import enum
+import typing
+
+from .. import log
+from ..worker_queue import WorkerQueue
+
+logger = log.get_logger(name=__name__)
+
+
+class OverflowPolicy(enum.Enum):
+    """
+    What to do with an event when the queue of an asynchronous subscriber is full.
+
+    - DROP_NEWEST: Drop the new event.
+    - DROP_OLDEST: Drop the oldest queued event to make room for the new event.
+    - COALESCE: Drop the new event if an equal event is already queued (even if the
+        queue is not full), otherwise drop the oldest queued event to make room.
+    """
+
+    DROP_NEWEST = enum.auto()
+    DROP_OLDEST = enum.auto()
+    COALESCE = enum.auto()
+
+
+@dataclasses.dataclass
+class SubscriberStats:
+    """
+    Statistics for monitoring an asynchronous subscriber.
+
+    - delivered: Number of events delivered to the callback.
+    - dropped: Number of events dropped as the queue was full.
+    - coalesced: Number of events dropped as an equal event was already queued.
+    - failed: Number of deliveries where the callback raised an exception.
+    - depth: Number of events currently queued.
+    - max_depth: Largest number of events that have been queued at once.
+    """
+
+    delivered: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    failed: int = 0
+    depth: int = 0
+    max_depth: int = 0
+
+
+class AsyncSubscriber(WorkerQueue):
+    """The AsyncSubscriber class queues the events for a subscriber callback and calls
+    the callback with each event on a dedicated worker thread, so that putting an event
+    never waits on the callback. When the queue is full, events are dropped according to
+    the overflow policy.
+
+    Args:
+        callback (Callable): Subscriber callback method.
+        max_queue_size (int): Maximum number of queued events.
+        policy (OverflowPolicy): What to do with an event when the queue is full.
+    """
+
+    def __init__(
+        self,
+        callback: typing.Callable,
+        max_queue_size: int = 256,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        super().__init__(
+            max_size=max_queue_size,
+            name=f"AsyncSubscriber({callback})",
+            drain_on_close=False,
+        )
+        self._callback = callback
+        self._policy = policy
+        self._queued_counts: typing.Counter[typing.Any] = collections.Counter()
+        self._stats = SubscriberStats()
+        self.start()
+
+    @property
+    def callback(self) -> typing.Callable:
+        """Get the subscriber callback method.
+
+        Returns:
+            Callable: Callback method.
+        """
+        return self._callback
+
+    @property
+    def stats(self) -> SubscriberStats:
+        """Get a copy of the subscriber statistics.
+
+        Returns:
+            SubscriberStats: Statistics.
+        """
+        with self._condition:
+            return dataclasses.replace(self._stats)
+
+    def put(self, event: typing.Any) -> bool:
+        """Queue an event to be delivered. This does not block.
+
+        Args:
+            event (Any): Event to deliver.
+
+        Returns:
+            bool: ``True`` if the event was queued, or ``False`` if it was dropped or
+                coalesced.
+        """
+        with self._condition:
+            if self._closed:
+                return False
+
+            if self._policy == OverflowPolicy.COALESCE and self._queued_counts[event]:
+                self._stats.coalesced += 1
+                return False
+
+            if len(self._queue) >= self._max_size:
+                self._stats.dropped += 1
+                if self._policy == OverflowPolicy.DROP_NEWEST:
+                    return False
+                self._pop()
+
+            self._queue.append(event)
+            self._queued_counts[event] += 1
+            self._stats.depth = len(self._queue)
+            self._stats.max_depth = max(self._stats.max_depth, self._stats.depth)
+            self._condition.notify_all()
+            return True
+
+    def _pop(self) -> typing.Any:
+        event = super()._pop()
+        self._queued_counts[event] -= 1
+        if not self._queued_counts[event]:
+            del self._queued_counts[event]
+        self._stats.depth = len(self._queue)
+        return event
+
+    def _process(self, item: typing.Any) -> None:
+        try:
+            self._callback(item)
+            delivered = True
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error(f"Subscriber {self._callback} failed on {item}: {exc}")
+            delivered = False
+
+        with self._condition:
+            if delivered:
+                self._stats.delivered += 1
+            else:
+                self._stats.failed += 1
@@ -1,6 +1,9 @@
+import contextlib
+import threading
 import typing
 
 from .. import log
+from .async_subscriber import AsyncSubscriber, OverflowPolicy, SubscriberStats
 
 logger = log.get_logger(name=__name__)
 
@@ -9,11 +12,30 @@ class EventPublisher:
     """
     The ``EventPublisher`` class is a generic mechanism that allows you to emit events
     and connect callback methods to those events.
+
+    Subscribers added with ``subscribe()`` are called synchronously within ``emit()``,
+    which is needed by subscribers that must act on an event straight away (e.g. within
+    the same frame). Subscribers added with ``subscribe_async()`` instead have the event
+    put on their own bounded queue and are called on a worker thread, so that a slow
+    subscriber does not slow down the code emitting the event.
+
+    Subscribers added with ``subscribe_batch()`` are called with a list of events. While
+    a batch is open (see ``batch()``) events for these are buffered, and the list of
+    events is delivered when the batch is closed. Outside of a batch, each event is
+    delivered straight away as a list of one event.
     """
 
     def __init__(self, event_type) -> None:
         self._event_type = event_type
         self._callbacks: typing.Set[typing.Callable] = set()
+        self._async_subscribers: typing.Dict[typing.Callable, AsyncSubscriber] = dict()
+        # Snapshot of the asynchronous subscribers, so that emit() is not affected by
+        # subscribers being added or removed by another thread.
+        self._async_snapshot: typing.Tuple[AsyncSubscriber, ...] = tuple()
+        self._batch_callbacks: typing.Set[typing.Callable] = set()
+        self._batch_lock = threading.Lock()
+        self._batch_depth = 0
+        self._batch: typing.List[typing.Any] = list()
 
     @property
     def num_subscribers(self) -> int:
@@ -22,7 +44,11 @@ class EventPublisher:
         Returns:
             int: Subscriber count.
         """
-        return len(self._callbacks)
+        return (
+            len(self._callbacks)
+            + len(self._async_subscribers)
+            + len(self._batch_callbacks)
+        )
 
     def emit(self, event: typing.Any) -> None:
         """Emit an event. The ``event`` is expected to be an enum and should match
@@ -34,13 +60,57 @@ class EventPublisher:
         Raises:
             TypeError: If the ``event`` does not match the registered ``event_type``.
         """
-        logger.debug(f"Emitting event: {event}")
+        logger.debug("Emitting event: %s", event)
         if not isinstance(event, self._event_type):
             raise TypeError(
                 f"Incorrect event type. Expecting {self._event_type}, got {type(event)}"
             )
         for callback in self._callbacks:
             callback(event)
+        for subscriber in self._async_snapshot:
+            subscriber.put(event)
+        if self._batch_callbacks:
+            with self._batch_lock:
+                if self._batch_depth > 0:
+                    self._batch.append(event)
+                    return
+            self._deliver_batch(events=[event])
+
+    @contextlib.contextmanager
+    def batch(self) -> typing.Iterator[None]:
+        """Context manager that opens a batch, during which the events for the batch
+        subscribers are buffered. The buffered events are delivered when the outermost
+        batch is closed.
+
+        Example:
+            >>> with publisher.batch():
+            ...     physics.update()
+        """
+        self.begin_batch()
+        try:
+            yield
+        finally:
+            self.end_batch()
+
+    def begin_batch(self) -> None:
+        """Open a batch (see ``batch()``). Batches can be nested."""
+        with self._batch_lock:
+            self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        """Close a batch (see ``batch()``), delivering the buffered events to the batch
+        subscribers if this is the outermost batch and any events were emitted."""
+        with self._batch_lock:
+            if self._batch_depth == 0:
+                raise RuntimeError(
+                    "end_batch() called without a matching begin_batch()"
+                )
+            self._batch_depth -= 1
+            if self._batch_depth > 0 or not self._batch:
+                return
+            batch = self._batch
+            self._batch = list()
+        self._deliver_batch(events=batch)
 
     def subscribe(self, callback: typing.Callable) -> bool:
         """Subscribe to events with a callback method.
@@ -51,12 +121,54 @@ class EventPublisher:
         Returns:
             bool: ``True`` if the callback was added successfully else ``False``.
         """
-        if callback in self._callbacks:
+        if self._is_subscribed(callback=callback):
             return False
         logger.info(f"Added event callback: {callback}")
         self._callbacks.add(callback)
         return True
 
+    def subscribe_batch(self, callback: typing.Callable) -> bool:
+        """Subscribe to events with a callback method that is called with a list of
+        events (see ``batch()``).
+
+        Args:
+            callback (typing.Callable): Callback method.
+
+        Returns:
+            bool: ``True`` if the callback was added successfully else ``False``.
+        """
+        if self._is_subscribed(callback=callback):
+            return False
+        logger.info(f"Added batch event callback: {callback}")
+        self._batch_callbacks.add(callback)
+        return True
+
+    def subscribe_async(
+        self,
+        callback: typing.Callable,
+        max_queue_size: int = 256,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> bool:
+        """Subscribe to events with a callback method that is called asynchronously on
+        a worker thread (see ``AsyncSubscriber``).
+
+        Args:
+            callback (typing.Callable): Callback method.
+            max_queue_size (int): Maximum number of events queued for the callback.
+            policy (OverflowPolicy): What to do with an event when the queue is full.
+
+        Returns:
+            bool: ``True`` if the callback was added successfully else ``False``.
+        """
+        if self._is_subscribed(callback=callback):
+            return False
+        logger.info(f"Added asynchronous event callback: {callback}")
+        self._async_subscribers[callback] = AsyncSubscriber(
+            callback=callback, max_queue_size=max_queue_size, policy=policy
+        )
+        self._async_snapshot = tuple(self._async_subscribers.values())
+        return True
+
     def unsubscribe(self, callback: typing.Callable) -> bool:
         """Unsubscribe a callback method form events.
 
@@ -66,8 +178,73 @@ class EventPublisher:
         Returns:
             bool: ``True`` if the callback was removed successfully else ``False``.
         """
+        if callback in self._async_subscribers:
+            logger.info(f"Removing asynchronous event callback: {callback}")
+            subscriber = self._async_subscribers.pop(callback)
+            self._async_snapshot = tuple(self._async_subscribers.values())
+            subscriber.close()
+            return True
+        if callback in self._batch_callbacks:
+            logger.info(f"Removing batch event callback: {callback}")
+            self._batch_callbacks.remove(callback)
+            return True
         if callback not in self._callbacks:
             return False
         logger.info(f"Removing event callback: {callback}")
         self._callbacks.remove(callback)
         return True
+
+    def get_subscriber_stats(self) -> typing.Dict[typing.Callable, SubscriberStats]:
+        """Get the statistics (including the queue depth) of each asynchronous
+        subscriber.
+
+        Returns:
+            Dict[Callable, SubscriberStats]: Statistics, keyed by callback method.
+        """
+        return {
+            callback: subscriber.stats
+            for callback, subscriber in self._async_subscribers.items()
+        }
+
+    def flush(self, timeout: typing.Optional[float] = None) -> bool:
+        """Wait until the events queued for every asynchronous subscriber have been
+        delivered.
+
+        Args:
+            timeout (float, optional): Maximum time to wait for each subscriber (in
+                seconds).
+
+        Returns:
+            bool: ``True`` if all the queues were flushed, else ``False``.
+        """
+        return all([s.flush(timeout=timeout) for s in self._async_snapshot])
+
+    def close(self) -> None:
+        """Stop the worker threads of all the asynchronous subscribers, which are then
+        unsubscribed."""
+        for callback in list(self._async_subscribers.keys()):
+            self.unsubscribe(callback=callback)
+
+    def _is_subscribed(self, callback: typing.Callable) -> bool:
+        """Check whether a callback method is subscribed in any way.
+
+        Args:
+            callback (typing.Callable): Callback method.
+
+        Returns:
+            bool: ``True`` if the callback is subscribed, else ``False``.
+        """
+        return (
+            callback in self._callbacks
+            or callback in self._async_subscribers
+            or callback in self._batch_callbacks
+        )
+
+    def _deliver_batch(self, events: typing.List[typing.Any]) -> None:
+        """Deliver a list of events to the batch subscribers.
+
+        Args:
+            events (list): Events, in the order they were emitted.
+        """
+        for callback in list(self._batch_callbacks):
+            callback(events)
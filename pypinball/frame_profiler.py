@@ -0,0 +1,255 @@
+"""Module containing the FrameProfiler class, which times each stage of a frame so that
+stalls can be seen while the game is running, without attaching a profiler.
+
+Each frame is started with ``FrameProfiler.begin_frame()``. ``mark()`` is called at
+the end of each stage with the stage name, which records the time since the previous
+mark, and ``end_frame()`` records the total. Only the most recent frames are kept, from
+which the percentiles are calculated on demand (see ``get_stats()``).
+"""
+
+import collections
+import dataclasses
+import time
+import typing
+
+import numpy
+
+from . import log
+
+logger = log.get_logger(name=__name__)
+
+# Default frame budget (in seconds), i.e. one frame at 60 fps.
+DEFAULT_FRAME_BUDGET = 1.0 / 60.0
+
+# Default number of recent frames that the statistics are calculated over.
+DEFAULT_WINDOW = 300
+
+# Name of the statistics for the whole frame.
+FRAME = "frame"
+
+
+@dataclasses.dataclass(frozen=True)
+class StageStats:
+    """
+    Timing statistics of a stage of the frame (or the whole frame) over the recent
+    frames. All times are in milliseconds.
+
+    - name: Name of the stage.
+    - count: Number of recent frames the statistics are calculated over.
+    - last: Time of the most recent frame.
+    - mean: Mean time.
+    - p50: Median time.
+    - p95: 95th percentile time.
+    - p99: 99th percentile time.
+    - max: Maximum time.
+    """
+
+    name: str
+    count: int
+    last: float
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+@dataclasses.dataclass(frozen=True)
+class FrameStats:
+    """
+    Timing statistics of the recent frames.
+
+    - frames: Total number of frames profiled.
+    - overruns: Total number of frames that took longer than the budget.
+    - budget: Frame budget (in milliseconds).
+    - frame: Statistics of the whole frame.
+    - stages: Statistics of each stage, in the order the stages were first marked.
+    """
+
+    frames: int
+    overruns: int
+    budget: float
+    frame: StageStats
+    stages: typing.List[StageStats]
+
+
+def calculate_stage_stats(name: str, times_ns: typing.Sequence[int]) -> StageStats:
+    """Calculate the statistics of a set of times.
+
+    Args:
+        name (str): Name of the stage.
+        times_ns (Sequence[int]): Times in nanoseconds, oldest first.
+
+    Returns:
+        StageStats: Statistics.
+    """
+    if len(times_ns) == 0:
+        return StageStats(
+            name=name, count=0, last=0.0, mean=0.0, p50=0.0, p95=0.0, p99=0.0, max=0.0
+        )
+    times = numpy.asarray(times_ns, dtype=numpy.float64) / 1e6
+    p50, p95, p99 = numpy.percentile(times, [50.0, 95.0, 99.0])
+    return StageStats(
+        name=name,
+        count=len(times),
+        last=float(times[-1]),
+        mean=float(times.mean()),
+        p50=float(p50),
+        p95=float(p95),
+        p99=float(p99),
+        max=float(times.max()),
+    )
+
+
+def format_frame_stats(stats: FrameStats) -> typing.List[str]:
+    """Format frame statistics as lines of text, one for the whole frame and then one
+    per stage.
+
+    Args:
+        stats (FrameStats): Frame statistics.
+
+    Returns:
+        List[str]: Lines of text.
+    """
+    lines = [
+        f"frames: {stats.frames}, overruns: {stats.overruns} "
+        f"(budget: {stats.budget:.1f} ms)"
+    ]
+    for stage in [stats.frame] + stats.stages:
+        lines.append(
+            f"{stage.name:>10}: p50 {stage.p50:6.2f}  p95 {stage.p95:6.2f}  "
+            f"p99 {stage.p99:6.2f}  max {stage.max:6.2f} ms"
+        )
+    return lines
+
+
+class FrameProfiler:
+    """The FrameProfiler class records the time taken by each stage of a frame and of
+    the whole frame over a rolling window of recent frames, and counts the frames that
+    take longer than the frame budget. Times are measured in integer nanoseconds from a
+    monotonic clock.
+
+    Args:
+        budget (float): Frame budget (in seconds). Frames that take longer than this
+            are counted as overruns.
+        window (int): Number of recent frames to keep the times of.
+        clock (Callable): Method that returns a monotonic time in nanoseconds.
+    """
+
+    def __init__(
+        self,
+        budget: float = DEFAULT_FRAME_BUDGET,
+        window: int = DEFAULT_WINDOW,
+        clock: typing.Callable[[], int] = time.perf_counter_ns,
+    ) -> None:
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got: {window}")
+        self._budget_ns = int(budget * 1e9)
+        self._window = window
+        self._clock = clock
+        self._frame_times: typing.Deque[int] = collections.deque(maxlen=window)
+        self._stage_times: typing.Dict[str, typing.Deque[int]] = dict()
+        self._frame_start: typing.Optional[int] = None
+        self._last_mark = 0
+        self._num_frames = 0
+        self._num_overruns = 0
+
+    @property
+    def budget(self) -> float:
+        """Get the frame budget.
+
+        Returns:
+            float: Frame budget in seconds.
+        """
+        return self._budget_ns / 1e9
+
+    @property
+    def num_frames(self) -> int:
+        """Get the total number of frames profiled.
+
+        Returns:
+            int: Number of frames.
+        """
+        return self._num_frames
+
+    @property
+    def num_overruns(self) -> int:
+        """Get the total number of frames that took longer than the frame budget.
+
+        Returns:
+            int: Number of overruns.
+        """
+        return self._num_overruns
+
+    def begin_frame(self) -> None:
+        """Start timing a frame."""
+        self._frame_start = self._last_mark = self._clock()
+
+    def mark(self, stage: str) -> None:
+        """Record the end of a stage of the current frame. The time of the stage is the
+        time since the previous mark (or the start of the frame).
+
+        Args:
+            stage (str): Name of the stage.
+        """
+        now = self._clock()
+        times = self._stage_times.get(stage)
+        if times is None:
+            times = self._stage_times[stage] = collections.deque(maxlen=self._window)
+        times.append(now - self._last_mark)
+        self._last_mark = now
+
+    def end_frame(self) -> None:
+        """Finish timing the current frame, counting it as an overrun if it took longer
+        than the frame budget.
+
+        Raises:
+            RuntimeError: If ``begin_frame()`` was not called first.
+        """
+        if self._frame_start is None:
+            raise RuntimeError("end_frame() called without calling begin_frame()")
+        frame_time = self._clock() - self._frame_start
+        self._frame_start = None
+        self._frame_times.append(frame_time)
+        self._num_frames += 1
+        if frame_time > self._budget_ns:
+            self._num_overruns += 1
+            logger.debug(
+                "Frame overran the budget: %.2f ms (budget: %.2f ms)",
+                frame_time / 1e6,
+                self._budget_ns / 1e6,
+            )
+
+    def get_stats(self) -> FrameStats:
+        """Calculate the statistics of the recent frames.
+
+        Returns:
+            FrameStats: Frame statistics.
+        """
+        return FrameStats(
+            frames=self._num_frames,
+            overruns=self._num_overruns,
+            budget=self._budget_ns / 1e6,
+            frame=calculate_stage_stats(name=FRAME, times_ns=self._frame_times),
+            stages=[
+                calculate_stage_stats(name=name, times_ns=times)
+                for name, times in self._stage_times.items()
+            ],
+        )
+
+    def format_report(self) -> str:
+        """Get the statistics of the recent frames as a multi-line report (see
+        ``format_frame_stats()``).
+
+        Returns:
+            str: Multi-line report.
+        """
+        return "\n".join(format_frame_stats(stats=self.get_stats()))
+
+    def reset(self) -> None:
+        """Clear all of the recorded times and counters."""
+        self._frame_times.clear()
+        self._stage_times.clear()
+        self._frame_start = None
+        self._num_frames = 0
+        self._num_overruns = 0
@@ -30,7 +30,7 @@ class KeyboardInput:  # pylint: disable=too-few-public-methods
         self._right_button_state = False
 
     def _on_press(self, key) -> None:
-        logger.debug(f"Key pressed: {type(key)}")
+        logger.debug("Key pressed: %s", type(key))
 
         key_bode = pynput.keyboard.KeyCode()
 
@@ -50,7 +50,7 @@ class KeyboardInput:  # pylint: disable=too-few-public-methods
             self._event_pub.emit(event=InputEvents.RIGHT_BUTTON_PRESSED)
 
     def _on_release(self, key) -> None:
-        logger.debug(f"Key released: {key}")
+        logger.debug("Key released: %s", key)
 
         key_bode = pynput.keyboard.KeyCode()
 
@@ -47,5 +47,5 @@ class Lives:
         Args:
             value (int): Value to set.
         """
-        LOGGER.debug(f"Setting lives value: {value}")
+        LOGGER.debug("Setting lives value: %s", value)
         self._lives = value
@@ -1,18 +1,35 @@
+import atexit
+import collections
 import logging
+import logging.handlers
 import os
 import sys
+import threading
 import typing
 
+from .worker_queue import WorkerQueue
+
 DEBUG = logging.DEBUG
 INFO = logging.INFO
 WARNING = logging.WARNING
 ERROR = logging.ERROR
 CRITICAL = logging.CRITICAL
 
+# Maximum number of log records waiting to be written before records are dropped.
+DEFAULT_QUEUE_SIZE = 10000
+
+# Size (in bytes) at which a log file is rotated, and the number of old files kept.
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+
 
 # Internal module variable to keep track of all created loggers.
 _LOGGERS: typing.Dict[str, logging.Logger] = dict()
 
+# Internal module variables for the shared queue that asynchronous handlers write to.
+_LOG_QUEUE: typing.Optional["LogQueue"] = None
+_LOG_QUEUE_LOCK = threading.Lock()
+
 
 class CustomFormatter(logging.Formatter):
     """
@@ -36,15 +53,172 @@ class CustomFormatter(logging.Formatter):
         logging.CRITICAL: BOLD_RED + FORMAT + RESET,
     }
 
+    def __init__(self) -> None:
+        super().__init__()
+        # Create the formatter for each level once, rather than for every record.
+        self._formatters = {
+            level: logging.Formatter(log_fmt) for level, log_fmt in self.FORMATS.items()
+        }
+        self._default_formatter = logging.Formatter()
+
     def format(self, record: logging.LogRecord) -> str:
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt)
+        formatter = self._formatters.get(record.levelno, self._default_formatter)
         return formatter.format(record)
 
 
 FORMATTER = CustomFormatter()
 
 
+class LogQueue(WorkerQueue):
+    """The LogQueue class writes log records to their handlers on a dedicated thread, so
+    that logging never waits on the console or a file. The queue is bounded, and when it
+    is full records are dropped (and counted) rather than blocking the caller. The
+    thread is started when the first record is queued.
+
+    Args:
+        max_size (int): Maximum number of queued records.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_QUEUE_SIZE) -> None:
+        super().__init__(max_size=max_size, name="LogQueue", drain_on_close=True)
+        self._num_dropped = 0
+
+    @property
+    def num_dropped(self) -> int:
+        """Get the number of records dropped because the queue was full.
+
+        Returns:
+            int: Number of dropped records.
+        """
+        with self._condition:
+            return self._num_dropped
+
+    def put(self, handler: logging.Handler, record: logging.LogRecord) -> bool:
+        """Queue a record to be written by a handler. This does not block. Once the
+        queue is closed the record is written straight away instead.
+
+        Args:
+            handler (logging.Handler): Handler to write the record.
+            record (logging.LogRecord): Log record.
+
+        Returns:
+            bool: ``True`` if the record was queued or written, or ``False`` if it was
+                dropped.
+        """
+        with self._condition:
+            if not self._closed:
+                if len(self._queue) >= self._max_size:
+                    self._num_dropped += 1
+                    return False
+                self._queue.append((handler, record))
+                self._condition.notify_all()
+                self.start()
+                return True
+
+        handler.handle(record)
+        return True
+
+    def reset_after_fork(self) -> None:
+        """Reset the queue in a forked child process, where the worker thread does not
+        exist. The queue is left closed, so the child writes its records straight away
+        (a child process may exit without running the ``atexit`` handlers)."""
+        self._queue = collections.deque()
+        self._busy = False
+        self._closed = True
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def _process(self, item: typing.Tuple[logging.Handler, logging.LogRecord]) -> None:
+        handler, record = item
+        try:
+            handler.handle(record)
+        except Exception:  # pylint: disable=broad-except
+            handler.handleError(record)
+
+
+class AsyncHandler(logging.Handler):
+    """
+    Handler that passes records to another handler via a ``LogQueue``, so that the
+    record is written on the queue's thread rather than the thread that logged it. The
+    message is formatted before it is queued, so that later changes to the arguments of
+    the message do not affect it.
+
+    Args:
+        handler (logging.Handler): Handler that writes the records.
+        log_queue (LogQueue, optional): Queue to use. If ``None`` the shared queue (see
+            ``get_log_queue()``) is used.
+    """
+
+    def __init__(
+        self, handler: logging.Handler, log_queue: typing.Optional[LogQueue] = None
+    ) -> None:
+        super().__init__(level=handler.level)
+        self._handler = handler
+        self._log_queue = get_log_queue() if log_queue is None else log_queue
+
+    @property
+    def handler(self) -> logging.Handler:
+        """Get the handler that writes the records.
+
+        Returns:
+            logging.Handler: Handler.
+        """
+        return self._handler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            record.msg = record.getMessage()
+            record.args = None
+            self._log_queue.put(handler=self._handler, record=record)
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+    def close(self) -> None:
+        self._handler.close()
+        super().close()
+
+
+def get_log_queue() -> LogQueue:
+    """
+    Get the log queue shared by all asynchronous handlers, creating it if needed. The
+    queue is closed (writing any queued records) when the interpreter exits, and
+    records are written synchronously in forked child processes.
+
+    Returns:
+        LogQueue: Shared log queue.
+    """
+    global _LOG_QUEUE  # pylint: disable=global-statement
+    with _LOG_QUEUE_LOCK:
+        if _LOG_QUEUE is None:
+            _LOG_QUEUE = LogQueue()
+            atexit.register(_LOG_QUEUE.close)
+            os.register_at_fork(after_in_child=_LOG_QUEUE.reset_after_fork)
+        return _LOG_QUEUE
+
+
+def flush(timeout: typing.Optional[float] = None) -> bool:
+    """
+    Wait until all of the records logged so far have been written by their handlers.
+
+    Args:
+        timeout (float, optional): Maximum time to wait (in seconds).
+
+    Returns:
+        bool: ``True`` if the records were written, else ``False``.
+    """
+    return get_log_queue().flush(timeout=timeout)
+
+
+def get_num_dropped() -> int:
+    """
+    Get the number of log records dropped because the shared log queue was full.
+
+    Returns:
+        int: Number of dropped records.
+    """
+    return get_log_queue().num_dropped
+
+
 def get_console_handler() -> logging.Handler:
     """
     Get a logging Handler for directing logs to the console.
@@ -57,17 +231,27 @@ def get_console_handler() -> logging.Handler:
     return handler
 
 
-def get_file_handler(filename: str) -> logging.Handler:
+def get_file_handler(
+    filename: str,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    backup_count: int = DEFAULT_BACKUP_COUNT,
+) -> logging.Handler:
     """
-    Get a logging Handler for directing logs to a file.
+    Get a logging Handler for directing logs to a file. The file is rotated once it
+    reaches ``max_bytes``, keeping ``backup_count`` old files (e.g. some.log.1).
 
     Args:
         filename (str): Full path to file (e.g. /tmp/logs/some.log).
+        max_bytes (int): Size (in bytes) at which to rotate the file. If ``0`` the file
+            is never rotated.
+        backup_count (int): Number of old files to keep.
 
     Returns:
         logging.Handler: Log handler.
     """
-    handler = logging.FileHandler(filename=filename)
+    handler = logging.handlers.RotatingFileHandler(
+        filename=filename, maxBytes=max_bytes, backupCount=backup_count
+    )
     handler.setFormatter(FORMATTER)
     return handler
 
@@ -85,7 +269,10 @@ def make_log_file_path(filename: str) -> None:
 
 
 def get_logger(
-    name: str, filename: typing.Optional[str] = None, level: int = logging.INFO
+    name: str,
+    filename: typing.Optional[str] = None,
+    level: int = logging.INFO,
+    asynchronous: bool = True,
 ) -> logging.Logger:
     """
     Get a logging.Logger instance.
@@ -94,24 +281,69 @@ def get_logger(
         name (str): Name for the logger.
         filename (str): Path to a file that logs will be written to. If set to ``None`` no file will be written.
         level (int): The ``logging`` level (e.g. DEBUG, INFO, etc).
+        asynchronous (bool): Whether to write the logs on the shared log queue thread
+            (see ``AsyncHandler``) rather than the thread that logs them.
 
     Returns:
         logging.Logger: Logger instance.
     """
+    handlers = [get_console_handler()]
+    if filename is not None:
+        make_log_file_path(filename=filename)
+        handlers.append(get_file_handler(filename=filename))
+
     logger = logging.getLogger(name=name)
     logger.handlers.clear()
     logger.setLevel(level=level)
-    logger.addHandler(get_console_handler())
-
-    if filename is not None:
-        make_log_file_path(filename=filename)
-        logger.addHandler(get_file_handler(filename=filename))
+    for handler in handlers:
+        logger.addHandler(AsyncHandler(handler=handler) if asynchronous else handler)
 
     logger.propagate = False
     _LOGGERS[name] = logger
     return logger
 
 
+def is_enabled(level: int, logger: typing.Optional[logging.Logger] = None) -> bool:
+    """
+    Check whether messages of a given level would be logged. This can be used to skip
+    building the arguments of a message on hot paths when the level is disabled.
+
+    Args:
+        level (int): The ``logging`` level (e.g. DEBUG, INFO, etc).
+        logger (logging.Logger, optional): Logger to check. If ``None``, check whether
+            any of the created loggers are enabled for the level.
+
+    Returns:
+        bool: ``True`` if the level is enabled, else ``False``.
+    """
+    if logger is not None:
+        return logger.isEnabledFor(level)
+    return any(l.isEnabledFor(level) for l in _LOGGERS.values())
+
+
+def set_global_log_file(
+    filename: str,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    backup_count: int = DEFAULT_BACKUP_COUNT,
+) -> None:
+    """Write the logs of all created loggers to a file, which is rotated by size (see
+    ``get_file_handler()``). The logs are written asynchronously.
+
+    Args:
+        filename (str): Path to the log file (e.g. /tmp/logs/some.log).
+        max_bytes (int): Size (in bytes) at which to rotate the file.
+        backup_count (int): Number of old files to keep.
+    """
+    make_log_file_path(filename=filename)
+    handler = AsyncHandler(
+        handler=get_file_handler(
+            filename=filename, max_bytes=max_bytes, backup_count=backup_count
+        )
+    )
+    for l in _LOGGERS.values():
+        l.addHandler(handler)
+
+
 def set_global_log_level(level: int) -> None:
     """Set the logging level for all created loggers
 
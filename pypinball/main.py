@@ -1,13 +1,43 @@
 import argparse
+import os
+import time
+import typing
 
-from .audio import AudioGameEventHandler, LoopedAudioPlayer, SimpleAudio
+from .asset_loader import AssetLoader
+from .audio import (
+    AudioDispatcher,
+    AudioGameEventHandler,
+    SimpleAudio,
+    StreamingAudioPlayer,
+)
 from .config import DEFAULT_DISPLAY_CONFIG, DEFAULT_GAME_CONFIG
 from .controller import Controller
 from .display import PyGameDisplay
-from .events import GameEventPublisher
+from .events import GameEventPublisher, OverflowPolicy
+from .frame_profiler import FrameProfiler
 from .inputs import InputEventPublisher, KeyboardInput
-from .log import DEBUG, set_global_log_level
+from .log import (
+    DEBUG,
+    get_logger,
+    get_num_dropped,
+    set_global_log_file,
+    set_global_log_level,
+)
 from .physics import PymunkPhysics
+from .replay import InputRecorder, load_recording, play_recording, save_recording
+from .resources import AssetBundle, get_default_bundle_path
+from .simulation import (
+    create_headless_controller,
+    create_headless_physics,
+    create_run_header,
+    enable_auto_launch,
+    make_flipper_script,
+    run_headless,
+    run_tables,
+    summarise_results,
+)
+
+logger = get_logger(name=__name__)
 
 
 def define_arguments(args=None) -> argparse.Namespace:
@@ -18,6 +48,69 @@ def define_arguments(args=None) -> argparse.Namespace:
     """
     parser = argparse.ArgumentParser()
     parser.add_argument("--debug", action="store_true", help="Run in debug mode")
+    parser.add_argument(
+        "--log-file",
+        type=str,
+        default=None,
+        help="Also write the logs to a file, which is rotated once it reaches 10 MB",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run a simulation without any display, audio or input as fast as possible",
+    )
+    parser.add_argument(
+        "--ticks",
+        type=int,
+        default=3600,
+        help="Number of ticks to simulate when running in headless mode",
+    )
+    parser.add_argument(
+        "--tables",
+        type=int,
+        default=1,
+        help="Number of independent tables to simulate in parallel in headless mode",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes for simulating multiple tables",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for the physics random number generator in headless mode (the seed of the first table when simulating multiple tables)",
+    )
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        help="Only redraw the regions of the screen that change each frame",
+    )
+    parser.add_argument(
+        "--profile-overlay",
+        action="store_true",
+        help="Show the frame time of each stage of the game loop over the display",
+    )
+    parser.add_argument(
+        "--record",
+        type=str,
+        default=None,
+        help="Record the input events of the session to a file",
+    )
+    parser.add_argument(
+        "--replay",
+        type=str,
+        default=None,
+        help="Play back a recorded session headless and as fast as possible",
+    )
+    parser.add_argument(
+        "--asset-bundle",
+        type=str,
+        default=None,
+        help="Asset bundle to load the images and audio from (defaults to the bundle in the package, if it has been built)",
+    )
     args = parser.parse_args(args)
     return args
 
@@ -29,14 +122,55 @@ def main(args=None) -> None:
 
     if args.debug:
         set_global_log_level(level=DEBUG)
+    if args.log_file is not None:
+        set_global_log_file(filename=args.log_file)
 
+    if args.replay is not None:
+        play_recording(
+            recording=load_recording(path=args.replay), config=DEFAULT_GAME_CONFIG
+        )
+        return
+
+    if args.headless and args.tables > 1:
+        main_tables(
+            num_tables=args.tables,
+            num_ticks=args.ticks,
+            base_seed=0 if args.seed is None else args.seed,
+            max_workers=args.workers,
+        )
+        return
+
+    if args.headless:
+        main_headless(num_ticks=args.ticks, seed=args.seed)
+        return
+
+    start_time = time.perf_counter()
+
+    asset_loader = AssetLoader()
+    asset_bundle = load_asset_bundle(path=args.asset_bundle)
+
+    audio_interface = SimpleAudio()
+    audio_interface.preload(
+        file_paths=set(DEFAULT_GAME_CONFIG.event_to_sounds.values()),
+        asset_loader=asset_loader,
+        bundle=asset_bundle,
+    )
+    audio_dispatcher = AudioDispatcher(player=audio_interface)
     audio_event_handler = AudioGameEventHandler(
-        interface=SimpleAudio(),
+        interface=audio_dispatcher,
         events_to_sound=DEFAULT_GAME_CONFIG.event_to_sounds,
     )
 
+    background_audio = StreamingAudioPlayer(
+        filename=DEFAULT_GAME_CONFIG.background_music, bundle=asset_bundle
+    )
+
     events_pub = GameEventPublisher()
-    events_pub.subscribe(audio_event_handler.update)
+    # Playing audio does not need to happen within the frame, so don't hold up the
+    # physics step with it. Repeats of a queued event are coalesced.
+    events_pub.subscribe_async(
+        audio_event_handler.update, policy=OverflowPolicy.COALESCE
+    )
 
     display_interface = PyGameDisplay(
         width=int(DEFAULT_GAME_CONFIG.playing_area[0]),
@@ -44,31 +178,150 @@ def main(args=None) -> None:
         game_events=events_pub,
         config=DEFAULT_DISPLAY_CONFIG,
         fps=DEFAULT_GAME_CONFIG.fames_per_second,
+        dirty_rects=args.dirty_rects,
+        build_atlas_in_background=True,
+        asset_loader=asset_loader,
+        asset_bundle=asset_bundle,
     )
 
     physics_interface = PymunkPhysics(
         event_pub=events_pub,
         fps=DEFAULT_GAME_CONFIG.fames_per_second,
+        physics_hz=DEFAULT_GAME_CONFIG.physics_hz,
+        max_steps_per_update=DEFAULT_GAME_CONFIG.max_physics_steps_per_update,
+        min_sub_steps=DEFAULT_GAME_CONFIG.min_physics_sub_steps,
+        max_sub_steps=DEFAULT_GAME_CONFIG.max_physics_sub_steps,
+        seed=DEFAULT_GAME_CONFIG.seed,
+        real_time=True,
+    )
+    logger.info(
+        f"Run header: {create_run_header(config=DEFAULT_GAME_CONFIG, physics=physics_interface)}"
     )
     # physics_interface.set_debug_display(screen=display_interface._screen)
 
+    # The display waits on a frame rate clock, so every frame takes about one frame
+    # interval. Only count frames that ran late enough to miss a display refresh.
+    profiler = FrameProfiler(budget=1.5 / DEFAULT_GAME_CONFIG.fames_per_second)
     controller = Controller(
         config=DEFAULT_GAME_CONFIG,
         display_interface=display_interface,
         physics_interface=physics_interface,
         event_publisher=events_pub,
+        profiler=profiler,
+        show_profiler_overlay=args.profile_overlay,
     )
 
     controller.setup()
+    logger.info(f"Startup took {time.perf_counter() - start_time:.3f} s")
+    asset_loader.on_all_done(callback=lambda: logger.info(asset_loader.format_report()))
+    asset_loader.shutdown(wait=False)
 
     input_pub = InputEventPublisher()
+    recorder = None
+    if args.record is not None:
+        recorder = InputRecorder(physics=physics_interface, config=DEFAULT_GAME_CONFIG)
+        input_pub.subscribe(callback=recorder.callback)
     input_pub.subscribe(callback=controller.handle_input_event)
     input_interface = KeyboardInput(event_pub=input_pub)
 
-    background_audio = LoopedAudioPlayer(filename=DEFAULT_GAME_CONFIG.background_music)
     background_audio.play()
 
-    controller.run()
+    controller.run(on_tick=None if recorder is None else recorder.on_tick)
 
     display_interface.close()
     background_audio.stop()
+    events_pub.close()
+    audio_dispatcher.close()
+    logger.info(f"Audio stats: {audio_dispatcher.stats}")
+    logger.info(f"Frame times:\n{profiler.format_report()}")
+    if get_num_dropped() > 0:
+        logger.warning(f"Dropped {get_num_dropped()} log records as the queue was full")
+
+    if recorder is not None:
+        save_recording(recording=recorder.finish(), path=args.record)
+
+
+def load_asset_bundle(
+    path: typing.Optional[str] = None,
+) -> typing.Optional[AssetBundle]:
+    """Open an asset bundle. If no path is given, the bundle in the package is opened if
+    it has been built (see ``scripts/build_asset_bundle.py``).
+
+    Args:
+        path (str, optional): Path to the bundle file.
+
+    Returns:
+        AssetBundle: Asset bundle, or ``None`` if no path was given and the bundle in
+            the package has not been built.
+    """
+    if path is None:
+        path = get_default_bundle_path()
+        if not os.path.isfile(path):
+            logger.info("No asset bundle found, loading the asset files")
+            return None
+    logger.info(f"Loading assets from bundle: {path}")
+    return AssetBundle(path=path)
+
+
+def main_headless(num_ticks: int, seed: typing.Optional[int] = None) -> None:
+    """Run the game without a display, audio or input devices. Balls are launched
+    automatically and the physics is stepped as fast as possible for a given number
+    of ticks.
+
+    Args:
+        num_ticks (int): Number of ticks to simulate.
+        seed (int, optional): Seed for the physics random number generator. If ``None``
+            the seed from the ``GameConfig`` is used.
+    """
+    events_pub = GameEventPublisher()
+    physics = create_headless_physics(
+        config=DEFAULT_GAME_CONFIG, event_pub=events_pub, seed=seed
+    )
+    logger.info(
+        f"Run header: {create_run_header(config=DEFAULT_GAME_CONFIG, physics=physics)}"
+    )
+    controller = create_headless_controller(
+        config=DEFAULT_GAME_CONFIG, event_pub=events_pub, physics=physics
+    )
+    enable_auto_launch(controller=controller, event_pub=events_pub)
+    run_headless(
+        controller=controller,
+        num_ticks=num_ticks,
+        fps=DEFAULT_GAME_CONFIG.fames_per_second,
+    )
+
+
+def main_tables(
+    num_tables: int, num_ticks: int, base_seed: int, max_workers: typing.Optional[int]
+) -> None:
+    """Simulate a number of independent headless tables in parallel, with the flippers
+    actuated by a simple script. Each result is logged as soon as its table finishes,
+    followed by a summary of the whole batch.
+
+    Args:
+        num_tables (int): Number of tables to simulate.
+        num_ticks (int): Number of ticks to simulate per table.
+        base_seed (int): Seed of the first table.
+        max_workers (int, optional): Number of worker processes.
+    """
+    results = list()
+    for result in run_tables(
+        config=DEFAULT_GAME_CONFIG,
+        num_tables=num_tables,
+        num_ticks=num_ticks,
+        base_seed=base_seed,
+        script=make_flipper_script(num_ticks=num_ticks),
+        max_workers=max_workers,
+    ):
+        logger.info(
+            f"Table {result.table_index} (seed: {result.seed}): score: {result.score}, "
+            f"lives lost: {result.lives_lost}, collisions: {result.collisions}"
+        )
+        results.append(result)
+
+    summary = summarise_results(results=results)
+    logger.info(
+        f"Simulated {summary.num_tables} tables: mean score: {summary.mean_score:.1f}, "
+        f"max score: {summary.max_score}, lives lost: {summary.lives_lost}, "
+        f"collisions: {summary.collisions}"
+    )
@@ -1,3 +1,5 @@
 from . import utils
 from .physics_interface import PhysicsInterface
-from .pymunk_physics import PymunkPhysics
+from .pymunk_physics import Collision, CollisionEntity, PymunkPhysics
+from .snapshot import PhysicsSnapshot
+from .sub_stepping import AdaptiveSubStepping, SubStepStats
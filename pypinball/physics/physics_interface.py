@@ -84,6 +84,16 @@ class PhysicsInterface(typing.Protocol):
             list: List of ``BallState`` instances.
         """
 
+    def get_ball_state_arrays(self) -> domain.BallStateArrays:
+        """
+        Get a snapshot of the state of all the balls as NumPy arrays. Implementations
+        may reuse the underlying buffers between calls, so the arrays should be copied
+        if they need to be kept.
+
+        Returns:
+            BallStateArrays: State of all the balls.
+        """
+
     def get_bumper_state(self, uid: int) -> domain.Bumper:
         """
         Get the state of a bumper.
@@ -106,6 +116,16 @@ class PhysicsInterface(typing.Protocol):
             list: List of ``Bumper`` instances.
         """
 
+    def get_bumper_revision(self) -> int:
+        """
+        Get a revision number for the set of bumpers, which changes each time a bumper
+        is added or removed. As bumpers are static this can be used to tell when
+        anything that depends on them (e.g. a pre-rendered layer) needs to be rebuilt.
+
+        Returns:
+            int: Revision number.
+        """
+
     def get_flipper_state(self, uid: int) -> domain.FlipperState:
         """
         Get the state of a flipper.
@@ -128,6 +148,16 @@ class PhysicsInterface(typing.Protocol):
             list: List of flipper states.
         """
 
+    def get_interpolation_alpha(self) -> float:
+        """
+        Get how far the simulation time is between the last two physics steps, which
+        can be used to interpolate the rendered state when the physics and rendering
+        run at different rates.
+
+        Returns:
+            float: Interpolation value in the range [0, 1].
+        """
+
     def get_num_balls(self) -> int:
         """Get the number of balls in the scene.
 
@@ -168,8 +198,12 @@ class PhysicsInterface(typing.Protocol):
             bool: ``True`` is the bumper was removed, else ``False``.
         """
 
-    def update(self) -> None:
+    def update(self, delta_time: typing.Optional[float] = None) -> None:
         """
         Perform an update/tick of the Physics engine. This method should be
         called on a regular basis.
+
+        Args:
+            delta_time (float, optional): Time to advance the simulation by (in seconds).
+                If ``None`` the implementation decides how much time has elapsed.
         """
@@ -1,14 +1,19 @@
 import dataclasses
 import enum
+import math
 import random
 import threading
+import time
 import typing
 
+import numpy
 import pymunk
 import pymunk.pygame_util
 
 from .. import domain, events, log
 from .physics_interface import PhysicsInterface
+from .snapshot import BALL_DTYPE, BUMPER_DTYPE, FLIPPER_DTYPE, PhysicsSnapshot
+from .sub_stepping import AdaptiveSubStepping, SubStepStats
 
 logger = log.get_logger(name=__name__)
 
@@ -25,6 +30,47 @@ class CollisionEntity(enum.IntEnum):
     WALL = enum.auto()
 
 
+@dataclasses.dataclass(frozen=True)
+class Collision:
+    """Data class describing a collision between a ball and another entity in the
+    Physics simulation, including the unique IDs of both objects involved.
+    """
+
+    ball_uid: int
+    entity: CollisionEntity
+    uid: int
+
+
+# Mapping between the type of object a ball has collided with and the event to emit.
+COLLISION_EVENTS = {
+    CollisionEntity.BALL: events.GameEvents.COLLISION_BALL_BALL,
+    CollisionEntity.BUMPER: events.GameEvents.COLLISION_BALL_BUMPER,
+    CollisionEntity.FLIPPER: events.GameEvents.COLLISION_BALL_FLIPPER,
+    CollisionEntity.WALL: events.GameEvents.COLLISION_BALL_WALL,
+}
+
+# The launch force used to be applied as a force over a single 300Hz physics step. It
+# is now applied as an impulse scaled by this duration so that the launch speed does not
+# depend on the physics step rate.
+LAUNCH_FORCE_DURATION = 1.0 / 300.0
+
+# Range (inclusive) that the launch force is randomly picked from.
+LAUNCH_FORCE_RANGE = (75_000, 120_000)
+
+# Radius of the segments that make up a wall (in pixels).
+WALL_SEGMENT_RADIUS = 1.0
+
+# Half of the thickness of the tip of a flipper (in pixels).
+FLIPPER_TIP_HALF_WIDTH = 10.0
+
+# Tolerance used when calculating how many whole physics steps fit in the accumulated
+# time, to avoid losing a step to floating point error.
+STEP_TOLERANCE = 1e-6
+
+# Type alias for the index mapping pymunk shapes to the owning entity type and UID.
+ShapeIndex = typing.Dict[pymunk.Shape, typing.Tuple[CollisionEntity, int]]
+
+
 @dataclasses.dataclass
 class PymunkEntity:
     """Data class to bring together all the Pymunk specific data and objects for a ball."""
@@ -59,16 +105,24 @@ class PymunkEntity:
         """
         space.add(self.body, self.shape)
 
-    def apply_impulse(self, direction: typing.Tuple[float, float]) -> None:
-        """Apply an impluse force to the ball in a given (unit vector) direction.
+    def apply_impulse(
+        self,
+        direction: typing.Tuple[float, float],
+        rng: random.Random,
+    ) -> None:
+        """Apply an impluse force to the ball in a given (unit vector) direction. The
+        size of the force is picked at random from ``LAUNCH_FORCE_RANGE``.
 
         Args:
             direction (typing.Tuple[float, float]): Direction unit vector.
+            rng (random.Random): Random number generator used to pick the force.
         """
-        force = random.randint(75_000, 120_000)
+        force = rng.randint(*LAUNCH_FORCE_RANGE)
         force_vec = pymunk.Vec2d(x=direction[0], y=direction[1]) * force
         position = self.body.position
-        self.body.apply_force_at_world_point(force=force_vec, point=position)
+        self.body.apply_impulse_at_world_point(
+            impulse=force_vec * LAUNCH_FORCE_DURATION, point=position
+        )
 
     def remove_from_space(self, space: pymunk.Space) -> None:
         """Remove the pymunk data/objects from a space.
@@ -271,6 +325,26 @@ def create_rectangle_bumper(bumper: domain.RectangleBumper) -> PymunkBumper:
     )
 
 
+def get_bumper_half_width(bumper: domain.Bumper) -> float:
+    """Get the half-width of the thinnest part of a bumper, which is used to work out
+    how far a ball can travel in a sub-step without passing through it.
+
+    Args:
+        bumper (domain.Bumper): Bumper configuration from the domain model.
+
+    Raises:
+        TypeError: If the bumper type is not supported.
+
+    Returns:
+        float: Half-width in pixels.
+    """
+    if isinstance(bumper, domain.RoundBumper):
+        return bumper.radius
+    if isinstance(bumper, domain.RectangleBumper):
+        return min(bumper.size) * 0.5
+    raise TypeError(f"Unsupported bumper type: {type(bumper)}")
+
+
 def create_pymunk_flipper(flipper: domain.Flipper) -> PymunkFlipper:
     """Create a PymunkBumper data structure for a flipper given a domain model configuration.
 
@@ -283,8 +357,8 @@ def create_pymunk_flipper(flipper: domain.Flipper) -> PymunkFlipper:
     vertices = [
         (-20, -20),
         (-20, 20),
-        (flipper.config.length, 10),
-        (flipper.config.length, -10),
+        (flipper.config.length, FLIPPER_TIP_HALF_WIDTH),
+        (flipper.config.length, -FLIPPER_TIP_HALF_WIDTH),
     ]
     # TODO: This seems to be a very carefully coded value! It can easily break tests!
     mass = 8
@@ -344,7 +418,7 @@ def create_pymunk_wall(wall: domain.Wall, space: pymunk.Space) -> PymunkWall:
         PymunkWall: Pymunk specific data/objects.
     """
     num_points = len(wall.points) - 1
-    segment_radius = 1
+    segment_radius = WALL_SEGMENT_RADIUS
     segments = list()
     for i in range(num_points):
         j = i + 1
@@ -360,24 +434,84 @@ def create_pymunk_wall(wall: domain.Wall, space: pymunk.Space) -> PymunkWall:
     return PymunkWall(id=wall.uid, segment_bodies=segments)
 
 
-class CollisionHandler:  # pylint: disable=too-few-public-methods
-    """Collision handler class for interactions between balls, bumpers, flippers and walls."""
+class BallStateBuffer:
+    """Preallocated NumPy buffers that are used to build ``BallStateArrays`` snapshots.
+    The buffers are only reallocated (doubling in size) when the number of balls grows
+    beyond the current capacity, so taking a snapshot each frame does not allocate
+    memory per ball.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        self._capacity = 0
+        self.uids = numpy.zeros(shape=(0,), dtype=numpy.int64)
+        self.positions = numpy.zeros(shape=(0, 2), dtype=numpy.float64)
+        self.previous_positions = numpy.zeros(shape=(0, 2), dtype=numpy.float64)
+        self.velocities = numpy.zeros(shape=(0, 2), dtype=numpy.float64)
+        self.radii = numpy.zeros(shape=(0,), dtype=numpy.float64)
+        self.reserve(size=capacity)
+
+    @property
+    def capacity(self) -> int:
+        """Get the number of balls the buffers can hold without being reallocated.
+
+        Returns:
+            int: Buffer capacity.
+        """
+        return self._capacity
+
+    def reserve(self, size: int) -> None:
+        """Make sure the buffers can hold at least ``size`` balls.
+
+        Args:
+            size (int): Number of balls.
+        """
+        if size <= self._capacity:
+            return
+        capacity = max(size, self._capacity * 2)
+        self.uids = numpy.zeros(shape=(capacity,), dtype=numpy.int64)
+        self.positions = numpy.zeros(shape=(capacity, 2), dtype=numpy.float64)
+        self.previous_positions = numpy.zeros(shape=(capacity, 2), dtype=numpy.float64)
+        self.velocities = numpy.zeros(shape=(capacity, 2), dtype=numpy.float64)
+        self.radii = numpy.zeros(shape=(capacity,), dtype=numpy.float64)
+        self._capacity = capacity
+
+    def view(self, size: int) -> domain.BallStateArrays:
+        """Get views of the first ``size`` rows of the buffers.
+
+        Args:
+            size (int): Number of balls.
+
+        Returns:
+            BallStateArrays: Views onto the buffers.
+        """
+        return domain.BallStateArrays(
+            uids=self.uids[:size],
+            positions=self.positions[:size],
+            velocities=self.velocities[:size],
+            radii=self.radii[:size],
+            previous_positions=self.previous_positions[:size],
+        )
+
+
+class CollisionHandler:
+    """Collision handler class for interactions between balls, bumpers, flippers and walls.
+
+    The ``shapes`` index maps each pymunk shape in the space to the type and UID of the
+    entity that owns it, which makes finding what a ball has collided with a constant
+    time lookup. The index is expected to be kept up to date by the owner as entities
+    are added and removed.
+    """
 
     def __init__(
         self,
         event_pub: events.GameEventPublisher,
         space: pymunk.Space,
-        balls: typing.Dict[int, PymunkEntity],
-        bumpers: typing.Dict[int, PymunkBumper],
-        flippers: typing.Dict[int, PymunkFlipper],
-        walls: typing.Dict[int, PymunkWall],
+        shapes: ShapeIndex,
     ) -> None:
-        self._balls = balls
-        self._bumpers = bumpers
-        self._flippers = flippers
-        self._walls = walls
+        self._shapes = shapes
 
         self._event_pub = event_pub
+        self._collision_pub = events.EventPublisher(event_type=Collision)
         self._space = space
 
         handler = self._space.add_wildcard_collision_handler(
@@ -385,6 +519,16 @@ class CollisionHandler:  # pylint: disable=too-few-public-methods
         )
         handler.begin = self.handle_collision
 
+    @property
+    def collision_events(self) -> events.EventPublisher:
+        """Get the publisher used to emit ``Collision`` events. These events contain
+        the UIDs of the objects that have collided.
+
+        Returns:
+            EventPublisher: Collision event publisher.
+        """
+        return self._collision_pub
+
     def handle_collision(
         self,
         arbiter: pymunk.Arbiter,
@@ -401,37 +545,20 @@ class CollisionHandler:  # pylint: disable=too-few-public-methods
         Returns:
             bool: If the collision was handled.
         """
-        other_shape = arbiter.shapes[1]
-
-        if other_shape.collision_type == CollisionEntity.WALL:
-            for _, wall in self._walls.items():
-                for segment in wall.segment_bodies:
-                    if segment == other_shape:
-                        self._event_pub.emit(
-                            event=events.GameEvents.COLLISION_BALL_WALL
-                        )
-                        return True
-
-        elif other_shape.collision_type == CollisionEntity.BALL:
-            for _, ball in self._balls.items():
-                if other_shape != ball.shape:
-                    continue
-                self._event_pub.emit(event=events.GameEvents.COLLISION_BALL_BALL)
-                return True
+        ball_shape, other_shape = arbiter.shapes
 
-        elif other_shape.collision_type == CollisionEntity.FLIPPER:
-            for _, flipper in self._flippers.items():
-                if other_shape != flipper.flipper_shape:
-                    continue
-                self._event_pub.emit(event=events.GameEvents.COLLISION_BALL_FLIPPER)
-                return True
+        try:
+            entity, uid = self._shapes[other_shape]
+        except KeyError:
+            return True
 
-        elif other_shape.collision_type == CollisionEntity.BUMPER:
-            for _, bumper in self._bumpers.items():
-                if other_shape != bumper.shape:
-                    continue
-                self._event_pub.emit(event=events.GameEvents.COLLISION_BALL_BUMPER)
-                return True
+        self._event_pub.emit(event=COLLISION_EVENTS[entity])
+
+        if self._collision_pub.num_subscribers > 0:
+            _, ball_uid = self._shapes.get(ball_shape, (CollisionEntity.BALL, -1))
+            self._collision_pub.emit(
+                event=Collision(ball_uid=ball_uid, entity=entity, uid=uid)
+            )
 
         return True
 
@@ -439,16 +566,71 @@ class CollisionHandler:  # pylint: disable=too-few-public-methods
 class PymunkPhysics(PhysicsInterface):
     """Implementation of the PhysicsInterface class that uses Pymunk as the underlying
     physics modelling solution.
+
+    The simulation is advanced with a fixed timestep of ``1 / physics_hz`` seconds. Each
+    call to ``update()`` adds the elapsed time to an accumulator and runs as many whole
+    physics steps as fit into it, up to ``max_steps_per_update`` (any time beyond this is
+    dropped, so a very slow frame cannot cause the physics to spiral). When
+    ``real_time`` is ``True`` the elapsed time is measured with a monotonic clock,
+    otherwise each ``update()`` advances the simulation by ``1 / fps`` seconds.
+
+    Each physics step is split into a number of sub-steps chosen by an
+    ``AdaptiveSubStepping`` policy from the speed of the fastest ball (or flipper tip),
+    so that balls cannot tunnel through thin walls when moving fast.
+
+    All randomness (e.g. the ball launch force) is drawn from a generator owned by the
+    instance, so two instances created with the same ``seed`` and given the same inputs
+    produce the same simulation.
+
+    Args:
+        event_pub (GameEventPublisher): Publisher used to emit game events.
+        fps (float): Nominal frame rate that ``update()`` is called at.
+        physics_hz (float): Rate of the fixed physics timestep.
+        max_steps_per_update (int): Maximum number of physics steps run per update.
+        real_time (bool): Whether to advance the simulation by the measured elapsed time.
+        min_sub_steps (int): Minimum number of sub-steps per physics step.
+        max_sub_steps (int): Maximum number of sub-steps per physics step.
+        seed (int, optional): Seed for the random number generator. If ``None`` a seed
+            is picked at random, which is available via the ``seed`` property.
     """
 
-    def __init__(self, event_pub: events.GameEventPublisher, fps: float) -> None:
+    def __init__(
+        self,
+        event_pub: events.GameEventPublisher,
+        fps: float,
+        physics_hz: float = 300.0,
+        max_steps_per_update: int = 25,
+        real_time: bool = False,
+        min_sub_steps: int = 1,
+        max_sub_steps: int = 8,
+        seed: typing.Optional[int] = None,
+    ) -> None:
+        if seed is None:
+            seed = random.SystemRandom().randrange(2**32)
+        self._seed = seed
+        self._rng = random.Random(seed)
         self._balls: typing.Dict[int, PymunkEntity] = dict()
         self._bumpers: typing.Dict[int, PymunkBumper] = dict()
+        self._bumper_revision = 0
         self._flippers: typing.Dict[int, PymunkFlipper] = dict()
         self._walls: typing.Dict[int, PymunkWall] = dict()
+        self._shapes: ShapeIndex = dict()
+        self._ball_buffer = BallStateBuffer()
+        self._ball_buffer_stale = True
         self._event_pub = event_pub
         self._threading_lock = threading.Lock()
         self._fps = fps
+        self._step_time = 1.0 / physics_hz
+        self._max_steps_per_update = max_steps_per_update
+        self._real_time = real_time
+        self._accumulator = 0.0
+        self._step_count = 0
+        self._last_update_time: typing.Optional[float] = None
+        self._sub_stepping = AdaptiveSubStepping(
+            min_sub_steps=min_sub_steps, max_sub_steps=max_sub_steps
+        )
+        self._min_collider_half_width = math.inf
+        self._min_ball_radius: typing.Optional[float] = None
 
         self._space = pymunk.Space()
         self._space.gravity = (0.0, 900.0)
@@ -458,12 +640,57 @@ class PymunkPhysics(PhysicsInterface):
         self._collision_handler = CollisionHandler(
             event_pub=event_pub,
             space=self._space,
-            balls=self._balls,
-            bumpers=self._bumpers,
-            flippers=self._flippers,
-            walls=self._walls,
+            shapes=self._shapes,
         )
 
+    @property
+    def collision_events(self) -> events.EventPublisher:
+        """Get the publisher used to emit ``Collision`` events, which identify the
+        ball and the bumper, flipper, wall or other ball involved in a collision.
+
+        Returns:
+            EventPublisher: Collision event publisher.
+        """
+        return self._collision_handler.collision_events
+
+    @property
+    def seed(self) -> int:
+        """Get the seed of the random number generator.
+
+        Returns:
+            int: Seed.
+        """
+        return self._seed
+
+    @property
+    def step_count(self) -> int:
+        """Get the total number of fixed physics steps that have been run. This waits
+        for an update that is in progress on another thread to finish.
+
+        Returns:
+            int: Number of physics steps.
+        """
+        with self._threading_lock:
+            return self._step_count
+
+    @property
+    def step_time(self) -> float:
+        """Get the duration of a single fixed physics step.
+
+        Returns:
+            float: Step duration in seconds.
+        """
+        return self._step_time
+
+    @property
+    def sub_step_stats(self) -> SubStepStats:
+        """Get the counters from the adaptive sub-stepping policy.
+
+        Returns:
+            SubStepStats: Sub-stepping counters.
+        """
+        return self._sub_stepping.stats
+
     def actuate_flipper(self, uid: int) -> bool:
         with self._threading_lock:
             try:
@@ -483,6 +710,9 @@ class PymunkPhysics(PhysicsInterface):
             entity = create_pymunk_ball(ball=ball)
             entity.add_to_space(space=self._space)
             self._balls[ball.uid] = entity
+            self._shapes[entity.shape] = (CollisionEntity.BALL, ball.uid)
+            self._ball_buffer_stale = True
+            self._min_ball_radius = None
             return True
 
     def add_bumper(self, bumper: domain.Bumper) -> bool:
@@ -502,6 +732,11 @@ class PymunkPhysics(PhysicsInterface):
 
             entity.add_to_space(space=self._space)
             self._bumpers[bumper.uid] = entity
+            self._shapes[entity.shape] = (CollisionEntity.BUMPER, bumper.uid)
+            self._bumper_revision += 1
+            self._min_collider_half_width = min(
+                self._min_collider_half_width, get_bumper_half_width(bumper=bumper)
+            )
             return True
 
     def add_flipper(self, flipper: domain.Flipper) -> bool:
@@ -514,6 +749,10 @@ class PymunkPhysics(PhysicsInterface):
             entity = create_pymunk_flipper(flipper=flipper)
             entity.add_to_space(space=self._space)
             self._flippers[flipper.uid] = entity
+            self._shapes[entity.flipper_shape] = (CollisionEntity.FLIPPER, flipper.uid)
+            self._min_collider_half_width = min(
+                self._min_collider_half_width, FLIPPER_TIP_HALF_WIDTH
+            )
             return True
 
     def add_wall(self, wall: domain.Wall) -> bool:
@@ -526,17 +765,42 @@ class PymunkPhysics(PhysicsInterface):
             entity = create_pymunk_wall(wall=wall, space=self._space)
             entity.add_to_space(space=self._space)
             self._walls[wall.uid] = entity
+            for segment in entity.segment_bodies:
+                self._shapes[segment] = (CollisionEntity.WALL, wall.uid)
+                self._min_collider_half_width = min(
+                    self._min_collider_half_width, segment.radius
+                )
             return True
 
     def get_ball_state(self, uid: int) -> domain.BallState:
-        if uid not in self._balls.keys():
-            raise KeyError(f"Unknown ball id: {uid}")
-        return domain.BallState(
-            uid=uid, position=self._balls[uid].position, radius=self._balls[uid].radius
-        )
+        try:
+            entity = self._balls[uid]
+        except KeyError as exc:
+            raise KeyError(f"Unknown ball id: {uid}") from exc
+        return domain.BallState(uid=uid, position=entity.position, radius=entity.radius)
 
     def get_ball_states(self) -> typing.List[domain.BallState]:
-        return [self.get_ball_state(uid=uid) for uid in self._balls.keys()]
+        return [
+            domain.BallState(uid=uid, position=entity.position, radius=entity.radius)
+            for uid, entity in self._balls.items()
+        ]
+
+    def get_ball_state_arrays(self) -> domain.BallStateArrays:
+        num_balls = len(self._balls)
+        buffer = self._ball_buffer
+
+        self._refresh_ball_buffer()
+
+        positions = buffer.positions
+        velocities = buffer.velocities
+        for i, entity in enumerate(self._balls.values()):
+            positions[i] = entity.body.position
+            velocities[i] = entity.body.velocity
+
+        return buffer.view(size=num_balls)
+
+    def get_interpolation_alpha(self) -> float:
+        return min(self._accumulator / self._step_time, 1.0)
 
     def get_bumper_state(self, uid: int) -> domain.Bumper:
         if uid not in self._bumpers.keys():
@@ -546,6 +810,9 @@ class PymunkPhysics(PhysicsInterface):
     def get_bumper_states(self) -> typing.List[domain.Bumper]:
         return [self.get_bumper_state(uid=uid) for uid in self._bumpers.keys()]
 
+    def get_bumper_revision(self) -> int:
+        return self._bumper_revision
+
     def get_flipper_state(self, uid: int) -> domain.FlipperState:
         if uid not in self._flippers.keys():
             raise KeyError(f"Unknown flipper id: {uid}")
@@ -568,7 +835,7 @@ class PymunkPhysics(PhysicsInterface):
                 msg = f"Failed to launch ball with UID {uid}. This ID is not registred in the Physics implementaion."
                 logger.warning(msg)
                 return False
-            self._balls[uid].apply_impulse(direction=(0.0, -1.0))
+            self._balls[uid].apply_impulse(direction=(0.0, -1.0), rng=self._rng)
             self._event_pub.emit(event=events.GameEvents.BALL_LAUNCHED)
             return True
 
@@ -576,16 +843,135 @@ class PymunkPhysics(PhysicsInterface):
         if uid not in self._balls.keys():
             return False
         self._balls[uid].remove_from_space(space=self._space)
+        del self._shapes[self._balls[uid].shape]
         del self._balls[uid]
+        self._ball_buffer_stale = True
+        self._min_ball_radius = None
         return True
 
     def remove_bumper(self, uid) -> bool:
         if uid not in self._bumpers.keys():
             return False
         self._bumpers[uid].remove_from_space(space=self._space)
+        del self._shapes[self._bumpers[uid].shape]
         del self._bumpers[uid]
+        self._bumper_revision += 1
         return True
 
+    def restore(self, data: bytes) -> None:
+        """Restore the state of the simulation from a blob created by ``snapshot()``.
+
+        This is much cheaper than rebuilding the space as the walls and flippers are
+        kept, only their state is overwritten. The balls are re-created in the order
+        they were in when the snapshot was taken (which also clears any cached contacts
+        for them), and bumpers are added or removed to match the snapshot.
+
+        Args:
+            data (bytes): Snapshot blob.
+
+        Raises:
+            ValueError: If the blob is not a valid snapshot or the flippers in the
+                snapshot do not match the flippers in the simulation.
+        """
+        snapshot = PhysicsSnapshot.from_bytes(data=data)
+        with self._threading_lock:
+            if sorted(snapshot.flippers["uid"].tolist()) != sorted(self._flippers):
+                raise ValueError("Snapshot flippers do not match the simulation")
+
+            for entity in self._balls.values():
+                entity.remove_from_space(space=self._space)
+                del self._shapes[entity.shape]
+            self._balls.clear()
+            for record in snapshot.balls:
+                uid = int(record["uid"])
+                entity = create_pymunk_ball(
+                    ball=domain.Ball(
+                        uid=uid,
+                        position=tuple(record["position"]),
+                        radius=int(record["radius"]),
+                    )
+                )
+                entity.body.velocity = tuple(record["velocity"])
+                entity.body.angle = float(record["angle"])
+                entity.body.angular_velocity = float(record["angular_velocity"])
+                entity.add_to_space(space=self._space)
+                self._balls[uid] = entity
+                self._shapes[entity.shape] = (CollisionEntity.BALL, uid)
+
+            for record in snapshot.flippers:
+                body = self._flippers[int(record["uid"])].flipper_body
+                body.position = tuple(record["position"])
+                body.velocity = tuple(record["velocity"])
+                body.angle = float(record["angle"])
+                body.angular_velocity = float(record["angular_velocity"])
+
+            self._restore_bumpers(records=snapshot.bumpers)
+
+            self._step_count = snapshot.step_count
+            self._accumulator = snapshot.accumulator
+            self._rng.setstate(snapshot.rng_state)
+            self._ball_buffer_stale = True
+            self._min_ball_radius = None
+            self._refresh_ball_buffer()
+
+    def snapshot(self) -> bytes:
+        """Capture the state of the simulation in a compact binary blob that can be
+        passed to ``restore()``. This includes the state of all the balls, flippers and
+        bumpers, the step count and accumulator, and the random number generator.
+
+        Returns:
+            bytes: Snapshot blob.
+        """
+        with self._threading_lock:
+            balls = numpy.zeros(shape=(len(self._balls),), dtype=BALL_DTYPE)
+            for i, (uid, entity) in enumerate(self._balls.items()):
+                body = entity.body
+                balls[i] = (
+                    uid,
+                    entity.radius,
+                    tuple(body.position),
+                    tuple(body.velocity),
+                    body.angle,
+                    body.angular_velocity,
+                )
+
+            flippers = numpy.zeros(shape=(len(self._flippers),), dtype=FLIPPER_DTYPE)
+            for i, (uid, flipper) in enumerate(self._flippers.items()):
+                body = flipper.flipper_body
+                flippers[i] = (
+                    uid,
+                    tuple(body.position),
+                    tuple(body.velocity),
+                    body.angle,
+                    body.angular_velocity,
+                )
+
+            bumpers = numpy.zeros(shape=(len(self._bumpers),), dtype=BUMPER_DTYPE)
+            for i, (uid, bumper) in enumerate(self._bumpers.items()):
+                config = bumper.config
+                if isinstance(config, domain.RoundBumper):
+                    size = (config.radius, 0.0)
+                    angle = 0.0
+                else:
+                    size = (float(config.size[0]), float(config.size[1]))
+                    angle = config.angle
+                bumpers[i] = (
+                    uid,
+                    bumper.type.value,
+                    tuple(config.position),
+                    size,
+                    angle,
+                )
+
+            return PhysicsSnapshot(
+                step_count=self._step_count,
+                accumulator=self._accumulator,
+                rng_state=self._rng.getstate(),
+                balls=balls,
+                flippers=flippers,
+                bumpers=bumpers,
+            ).to_bytes()
+
     def set_debug_display(self, screen) -> None:
         """Get a PyGame display surface for debugging.
 
@@ -594,14 +980,156 @@ class PymunkPhysics(PhysicsInterface):
         """
         self._draw_options = pymunk.pygame_util.DrawOptions(screen)
 
-    def update(self) -> None:
+    def update(self, delta_time: typing.Optional[float] = None) -> None:
         with self._threading_lock:
-            logger.debug("Updating Pymunk Physics")
+            debug = log.is_enabled(log.DEBUG, logger)
+            if debug:
+                logger.debug("Updating Pymunk Physics")
+
+            if delta_time is None:
+                delta_time = self._get_elapsed_time()
+            self._accumulator += delta_time
+
+            step_time = self._step_time
+            num_steps = int(self._accumulator / step_time + STEP_TOLERANCE)
+            if num_steps > self._max_steps_per_update:
+                if debug:
+                    logger.debug(
+                        "Dropping %d physics steps",
+                        num_steps - self._max_steps_per_update,
+                    )
+                num_steps = self._max_steps_per_update
+                self._accumulator = num_steps * step_time
+
+            for i in range(num_steps):
+                if i == num_steps - 1:
+                    self._store_previous_ball_positions()
+                sub_steps = self._sub_stepping.get_num_sub_steps(
+                    max_speed=self._get_max_speed(),
+                    step_time=step_time,
+                    collision_margin=self._get_collision_margin(),
+                )
+                sub_step_time = step_time / sub_steps
+                for _ in range(sub_steps):
+                    self._space.step(sub_step_time)
 
-            sub_step = 5
-            delta_time = 1.0 / self._fps / float(sub_step)
-            for _ in range(sub_step):
-                self._space.step(delta_time)
+            self._accumulator = max(self._accumulator - num_steps * step_time, 0.0)
+            self._step_count += num_steps
 
             if self._draw_options is not None:
                 self._space.debug_draw(options=self._draw_options)
+
+    def _get_elapsed_time(self) -> float:
+        """Get the time to advance the simulation by for an update.
+
+        Returns:
+            float: Elapsed time in seconds.
+        """
+        if not self._real_time:
+            return 1.0 / self._fps
+
+        now = time.monotonic()
+        last = self._last_update_time
+        self._last_update_time = now
+        if last is None:
+            return 1.0 / self._fps
+        return now - last
+
+    def _get_collision_margin(self) -> float:
+        """Get the smallest distance a ball can travel before it may pass through a
+        collider, i.e. the radius of the smallest ball plus the half-width of the
+        thinnest collider.
+
+        Returns:
+            float: Collision margin in pixels.
+        """
+        if self._min_ball_radius is None:
+            self._min_ball_radius = min(
+                (entity.radius for entity in self._balls.values()), default=math.inf
+            )
+        return self._min_ball_radius + self._min_collider_half_width
+
+    def _get_max_speed(self) -> float:
+        """Get the speed of the fastest ball plus the speed of the fastest flipper tip,
+        which is the largest relative speed two objects can collide at.
+
+        Returns:
+            float: Speed in pixels per second.
+        """
+        max_ball_speed_sqrd = 0.0
+        for entity in self._balls.values():
+            max_ball_speed_sqrd = max(
+                max_ball_speed_sqrd, entity.body.velocity.get_length_sqrd()
+            )
+
+        max_tip_speed = 0.0
+        for flipper in self._flippers.values():
+            tip_speed = (
+                abs(flipper.flipper_body.angular_velocity) * flipper.config.length
+            )
+            max_tip_speed = max(max_tip_speed, tip_speed)
+
+        return math.sqrt(max_ball_speed_sqrd) + max_tip_speed
+
+    def _refresh_ball_buffer(self) -> None:
+        """Rewrite the ball UIDs and radii in the state buffer if balls have been added
+        or removed since the buffer was last filled."""
+        if not self._ball_buffer_stale:
+            return
+
+        buffer = self._ball_buffer
+        buffer.reserve(size=len(self._balls))
+        for i, (uid, entity) in enumerate(self._balls.items()):
+            buffer.uids[i] = uid
+            buffer.radii[i] = entity.radius
+            buffer.previous_positions[i] = entity.body.position
+        self._ball_buffer_stale = False
+
+    def _restore_bumpers(self, records: numpy.ndarray) -> None:
+        """Add and remove bumpers so that they match the records from a snapshot.
+        Bumpers that exist in both are left untouched as they are static.
+
+        Args:
+            records (numpy.ndarray): Bumper records (``BUMPER_DTYPE``).
+        """
+        uids = set(records["uid"].tolist())
+        for uid in [uid for uid in self._bumpers if uid not in uids]:
+            self._bumpers[uid].remove_from_space(space=self._space)
+            del self._shapes[self._bumpers[uid].shape]
+            del self._bumpers[uid]
+            self._bumper_revision += 1
+
+        for record in records:
+            uid = int(record["uid"])
+            if uid in self._bumpers:
+                continue
+            position = tuple(record["position"])
+            bumper: domain.Bumper
+            if domain.BumperType(int(record["type"])) == domain.BumperType.ROUND:
+                bumper = domain.RoundBumper(
+                    uid=uid, position=position, radius=float(record["size"][0])
+                )
+                entity = create_round_bumper(bumper=bumper)
+            else:
+                bumper = domain.RectangleBumper(
+                    uid=uid,
+                    position=position,
+                    size=tuple(record["size"]),
+                    angle=float(record["angle"]),
+                )
+                entity = create_rectangle_bumper(bumper=bumper)
+            entity.add_to_space(space=self._space)
+            self._bumpers[uid] = entity
+            self._shapes[entity.shape] = (CollisionEntity.BUMPER, uid)
+            self._bumper_revision += 1
+            self._min_collider_half_width = min(
+                self._min_collider_half_width, get_bumper_half_width(bumper=bumper)
+            )
+
+    def _store_previous_ball_positions(self) -> None:
+        """Store the ball positions before the last physics step of an update, which
+        are used to interpolate the rendered positions."""
+        self._refresh_ball_buffer()
+        previous_positions = self._ball_buffer.previous_positions
+        for i, entity in enumerate(self._balls.values()):
+            previous_positions[i] = entity.body.position
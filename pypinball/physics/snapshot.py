@@ -0,0 +1,168 @@
+"""Module containing the compact binary format used to snapshot and restore the state of
+a ``PymunkPhysics`` instance.
+
+A snapshot is a fixed size header followed by the random number generator state and one
+packed NumPy record array each for the balls, flippers and bumpers. All values are
+little-endian so a snapshot can be moved between machines.
+"""
+
+import dataclasses
+import struct
+import typing
+
+import numpy
+
+# Magic bytes and version used to identify a snapshot blob.
+SNAPSHOT_MAGIC = b"PPSN"
+SNAPSHOT_VERSION = 1
+
+# Header: magic, version, step count, accumulator, number of balls, flippers and bumpers.
+HEADER_FORMAT = struct.Struct("<4sHQdIII")
+
+# Random number generator state: version, has gauss_next, gauss_next.
+RNG_FORMAT = struct.Struct("<i?d")
+
+# Number of integers in the internal state of ``random.Random``.
+RNG_STATE_SIZE = 625
+
+BALL_DTYPE = numpy.dtype(
+    [
+        ("uid", "<i8"),
+        ("radius", "<f8"),
+        ("position", "<f8", (2,)),
+        ("velocity", "<f8", (2,)),
+        ("angle", "<f8"),
+        ("angular_velocity", "<f8"),
+    ]
+)
+
+FLIPPER_DTYPE = numpy.dtype(
+    [
+        ("uid", "<i8"),
+        ("position", "<f8", (2,)),
+        ("velocity", "<f8", (2,)),
+        ("angle", "<f8"),
+        ("angular_velocity", "<f8"),
+    ]
+)
+
+# For round bumpers the first element of ``size`` holds the radius.
+BUMPER_DTYPE = numpy.dtype(
+    [
+        ("uid", "<i8"),
+        ("type", "<u1"),
+        ("position", "<f8", (2,)),
+        ("size", "<f8", (2,)),
+        ("angle", "<f8"),
+    ]
+)
+
+
+@dataclasses.dataclass
+class PhysicsSnapshot:
+    """
+    Decoded contents of a physics snapshot.
+
+    - step_count: Number of physics steps that had been run.
+    - accumulator: Time in the fixed timestep accumulator.
+    - rng_state: State of the random number generator (from ``random.Random.getstate()``).
+    - balls: Ball records (``BALL_DTYPE``).
+    - flippers: Flipper records (``FLIPPER_DTYPE``).
+    - bumpers: Bumper records (``BUMPER_DTYPE``).
+    """
+
+    step_count: int
+    accumulator: float
+    rng_state: typing.Tuple[int, typing.Tuple[int, ...], typing.Optional[float]]
+    balls: numpy.ndarray
+    flippers: numpy.ndarray
+    bumpers: numpy.ndarray
+
+    def to_bytes(self) -> bytes:
+        """Pack the snapshot into a binary blob.
+
+        Returns:
+            bytes: Binary blob.
+        """
+        version, state, gauss_next = self.rng_state
+        return b"".join(
+            [
+                HEADER_FORMAT.pack(
+                    SNAPSHOT_MAGIC,
+                    SNAPSHOT_VERSION,
+                    self.step_count,
+                    self.accumulator,
+                    len(self.balls),
+                    len(self.flippers),
+                    len(self.bumpers),
+                ),
+                RNG_FORMAT.pack(
+                    version,
+                    gauss_next is not None,
+                    0.0 if gauss_next is None else gauss_next,
+                ),
+                numpy.asarray(state, dtype="<u4").tobytes(),
+                self.balls.astype(BALL_DTYPE, copy=False).tobytes(),
+                self.flippers.astype(FLIPPER_DTYPE, copy=False).tobytes(),
+                self.bumpers.astype(BUMPER_DTYPE, copy=False).tobytes(),
+            ]
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PhysicsSnapshot":
+        """Unpack a binary blob created by ``to_bytes()``.
+
+        Args:
+            data (bytes): Binary blob.
+
+        Raises:
+            ValueError: If the blob is not a snapshot or is of an unsupported version.
+
+        Returns:
+            PhysicsSnapshot: Decoded snapshot.
+        """
+        if len(data) < HEADER_FORMAT.size:
+            raise ValueError("Snapshot data is too short")
+        (
+            magic,
+            version,
+            step_count,
+            accumulator,
+            num_balls,
+            num_flippers,
+            num_bumpers,
+        ) = HEADER_FORMAT.unpack_from(data, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Data is not a physics snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {version}")
+        offset = HEADER_FORMAT.size
+
+        rng_version, has_gauss, gauss_next = RNG_FORMAT.unpack_from(data, offset)
+        offset += RNG_FORMAT.size
+        state = numpy.frombuffer(data, dtype="<u4", count=RNG_STATE_SIZE, offset=offset)
+        offset += state.nbytes
+        rng_state = (
+            rng_version,
+            tuple(state.tolist()),
+            gauss_next if has_gauss else None,
+        )
+
+        records = list()
+        for dtype, count in [
+            (BALL_DTYPE, num_balls),
+            (FLIPPER_DTYPE, num_flippers),
+            (BUMPER_DTYPE, num_bumpers),
+        ]:
+            array = numpy.frombuffer(data, dtype=dtype, count=count, offset=offset)
+            offset += array.nbytes
+            records.append(array)
+
+        return cls(
+            step_count=step_count,
+            accumulator=accumulator,
+            rng_state=rng_state,
+            balls=records[0],
+            flippers=records[1],
+            bumpers=records[2],
+        )
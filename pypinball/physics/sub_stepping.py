@@ -0,0 +1,115 @@
+"""Module containing the adaptive sub-stepping policy used to decide how many sub-steps
+each fixed physics step is split into."""
+
+import dataclasses
+import math
+
+
+@dataclasses.dataclass
+class SubStepStats:
+    """
+    Counters for monitoring the adaptive sub-stepping.
+
+    - steps: Number of physics steps the policy has been queried for.
+    - sub_steps: Total number of sub-steps that have been run.
+    - last_sub_steps: Number of sub-steps used for the most recent physics step.
+    - peak_sub_steps: Largest number of sub-steps used for a single physics step.
+    - saturated_steps: Number of physics steps that were limited by the maximum bound.
+    """
+
+    steps: int = 0
+    sub_steps: int = 0
+    last_sub_steps: int = 0
+    peak_sub_steps: int = 0
+    saturated_steps: int = 0
+
+    @property
+    def mean_sub_steps(self) -> float:
+        """Get the average number of sub-steps per physics step.
+
+        Returns:
+            float: Mean sub-steps.
+        """
+        if self.steps == 0:
+            return 0.0
+        return self.sub_steps / self.steps
+
+
+class AdaptiveSubStepping:
+    """The AdaptiveSubStepping class picks the number of sub-steps to split a physics
+    step into, based upon how far the fastest object can move during the step relative
+    to the collision margin (the radius of the smallest ball plus the half-thickness of
+    the thinnest collider). Splitting the step so that no object moves more than a
+    fraction of the margin per sub-step prevents balls from tunnelling through thin
+    walls, while a ball at rest only needs a single sub-step.
+
+    Args:
+        min_sub_steps (int): Minimum number of sub-steps per physics step.
+        max_sub_steps (int): Maximum number of sub-steps per physics step.
+        max_travel_fraction (float): Fraction of the collision margin that an object may
+            travel in a single sub-step.
+    """
+
+    def __init__(
+        self,
+        min_sub_steps: int = 1,
+        max_sub_steps: int = 8,
+        max_travel_fraction: float = 0.5,
+    ) -> None:
+        if min_sub_steps < 1:
+            raise ValueError(f"min_sub_steps must be at least 1, got: {min_sub_steps}")
+        if max_sub_steps < min_sub_steps:
+            raise ValueError(
+                f"max_sub_steps ({max_sub_steps}) must not be less than min_sub_steps ({min_sub_steps})"
+            )
+        self._min_sub_steps = min_sub_steps
+        self._max_sub_steps = max_sub_steps
+        self._max_travel_fraction = max_travel_fraction
+        self._stats = SubStepStats()
+
+    @property
+    def stats(self) -> SubStepStats:
+        """Get the sub-stepping counters.
+
+        Returns:
+            SubStepStats: Counters.
+        """
+        return self._stats
+
+    def get_num_sub_steps(
+        self, max_speed: float, step_time: float, collision_margin: float
+    ) -> int:
+        """Get the number of sub-steps to use for a single physics step. Calling this
+        method also updates the counters.
+
+        Args:
+            max_speed (float): Speed of the fastest moving object (pixels per second).
+            step_time (float): Duration of the physics step (in seconds).
+            collision_margin (float): Smallest distance (in pixels) an object can move
+                before it may pass through a collider.
+
+        Returns:
+            int: Number of sub-steps.
+        """
+        max_travel = collision_margin * self._max_travel_fraction
+        if max_travel <= 0.0 or math.isinf(max_travel):
+            sub_steps = self._min_sub_steps
+        else:
+            sub_steps = math.ceil(max_speed * step_time / max_travel)
+
+        saturated = sub_steps > self._max_sub_steps
+        sub_steps = min(max(sub_steps, self._min_sub_steps), self._max_sub_steps)
+
+        stats = self._stats
+        stats.steps += 1
+        stats.sub_steps += sub_steps
+        stats.last_sub_steps = sub_steps
+        stats.peak_sub_steps = max(stats.peak_sub_steps, sub_steps)
+        if saturated:
+            stats.saturated_steps += 1
+
+        return sub_steps
+
+    def reset_stats(self) -> None:
+        """Reset the counters."""
+        self._stats = SubStepStats()
@@ -0,0 +1,427 @@
+"""Module for profiling a deterministic, scripted session of the game, so that profiles
+are comparable between runs.
+
+A session (see ``create_scripted_session()``) runs the game headless for a fixed number
+of ticks with a fixed seed, automatically launched balls and a scripted sequence of
+flipper inputs, with the physics stepped by a fixed amount per tick rather than the
+elapsed time. Nothing waits on a frame rate clock, audio or input devices.
+
+The session can be profiled with ``cProfile`` (see ``profile_cprofile()``), which
+records every call, or by periodically sampling the stack of the thread running the
+session (see ``StackSampler``), which has a much lower overhead. Both modes give a
+``pstats.Stats`` instance and a set of collapsed stacks, which can be written with
+``write_collapsed_stacks()`` and rendered as a flame graph (e.g. with ``flamegraph.pl``
+or speedscope).
+"""
+
+import collections
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import typing
+
+from . import display, events, log, scoring
+from .config import GameConfig
+from .controller import Controller
+from .simulation import (
+    SimulationStats,
+    create_headless_physics,
+    enable_auto_launch,
+    make_flipper_script,
+    make_script_player,
+    run_headless,
+)
+
+logger = log.get_logger(name=__name__)
+
+# Default interval (in seconds) between stack samples.
+DEFAULT_SAMPLE_INTERVAL = 0.001
+
+# Stacks whose share of the time is less than this (in seconds) are left out when
+# converting cProfile statistics into collapsed stacks.
+MIN_STACK_TIME = 1e-6
+
+# Type alias for a function as identified by ``pstats``, in the format
+# (filename, line number, function name).
+FunctionKey = typing.Tuple[str, int, str]
+
+# Type alias for a stack of functions, from the outermost to the innermost call.
+Stack = typing.Tuple[FunctionKey, ...]
+
+
+def create_scripted_session(
+    config: GameConfig,
+    num_ticks: int,
+    seed: int = 0,
+    display_factory: typing.Optional[
+        typing.Callable[[events.GameEventPublisher], display.DisplayInterface]
+    ] = None,
+) -> typing.Callable[[], SimulationStats]:
+    """Create a deterministic session of the game, ready to be run (and profiled). The
+    physics is seeded with a fixed seed, balls are launched automatically and both
+    flippers are actuated periodically.
+
+    Args:
+        config (GameConfig): Game configuration.
+        num_ticks (int): Number of ticks to run the session for.
+        seed (int): Seed for the physics random number generator.
+        display_factory (Callable, optional): Method that creates the display to render
+            to, given the event publisher of the session. The display should not wait on
+            a frame rate clock. If ``None`` a ``NullDisplay`` is used.
+
+    Returns:
+        Callable: Method that runs the session and returns its statistics.
+    """
+    event_pub = events.GameEventPublisher()
+    scorer = scoring.get_scorer(event_pub=event_pub)
+    physics = create_headless_physics(config=config, event_pub=event_pub, seed=seed)
+    controller = Controller(
+        config=config,
+        display_interface=(
+            display.NullDisplay()
+            if display_factory is None
+            else display_factory(event_pub)
+        ),
+        physics_interface=physics,
+        event_publisher=event_pub,
+    )
+    controller.setup()
+    on_tick = make_script_player(
+        controller=controller, script=make_flipper_script(num_ticks=num_ticks)
+    )
+
+    def _run() -> SimulationStats:
+        enable_auto_launch(controller=controller, event_pub=event_pub)
+        stats = run_headless(
+            controller=controller,
+            num_ticks=num_ticks,
+            fps=config.fames_per_second,
+            on_tick=on_tick,
+        )
+        logger.info(f"Session finished, score: {scorer.current_score}")
+        return stats
+
+    return _run
+
+
+def profile_cprofile(fn: typing.Callable[[], typing.Any]) -> pstats.Stats:
+    """Profile a method with ``cProfile``.
+
+    Args:
+        fn (Callable): Method to profile.
+
+    Returns:
+        pstats.Stats: Profile statistics.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        fn()
+    finally:
+        profiler.disable()
+    return pstats.Stats(profiler)
+
+
+class StackSampler:
+    """The StackSampler class samples the stack of a thread at a regular interval from a
+    background thread, and counts how many times each stack was seen. The time spent in
+    a function is then estimated from the number of samples it appeared in.
+
+    The sampler thread needs the GIL to take a sample, so while sampling the thread
+    switch interval (see ``sys.setswitchinterval()``) is reduced to the sample interval
+    if it is longer.
+
+    Args:
+        interval (float): Interval between samples (in seconds).
+        thread_id (int, optional): Identifier of the thread to sample. If ``None`` the
+            thread that creates the sampler is sampled.
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_SAMPLE_INTERVAL,
+        thread_id: typing.Optional[int] = None,
+    ) -> None:
+        self._interval = interval
+        self._thread_id = threading.get_ident() if thread_id is None else thread_id
+        self._samples: typing.Counter[Stack] = collections.Counter()
+        self._stop_event = threading.Event()
+        self._thread: typing.Optional[threading.Thread] = None
+        self._switch_interval: typing.Optional[float] = None
+
+    @property
+    def interval(self) -> float:
+        """Get the interval between samples.
+
+        Returns:
+            float: Interval in seconds.
+        """
+        return self._interval
+
+    @property
+    def samples(self) -> typing.Counter[Stack]:
+        """Get the number of times each stack has been sampled.
+
+        Returns:
+            Counter: Sample counts, keyed by stack.
+        """
+        return self._samples
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        self._stop_event.clear()
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self._interval))
+        self._thread = threading.Thread(
+            target=self._run, name="StackSampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling, waiting for the background thread to finish."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._switch_interval is not None:
+            sys.setswitchinterval(self._switch_interval)
+            self._switch_interval = None
+
+    def sample(self) -> None:
+        """Take a sample of the stack of the sampled thread."""
+        frame = sys._current_frames().get(  # pylint: disable=protected-access
+            self._thread_id
+        )
+        stack = list()
+        while frame is not None:
+            code = frame.f_code
+            stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+            frame = frame.f_back
+        if stack:
+            self._samples[tuple(reversed(stack))] += 1
+
+    def to_stats(self) -> pstats.Stats:
+        """Convert the samples into profile statistics (see ``samples_to_stats()``).
+
+        Returns:
+            pstats.Stats: Profile statistics.
+        """
+        return samples_to_stats(samples=self._samples, interval=self._interval)
+
+    def _run(self) -> None:
+        """Target method of the background thread, which takes samples until
+        ``stop()`` is called."""
+        while not self._stop_event.wait(timeout=self._interval):
+            self.sample()
+
+
+def profile_sampling(
+    fn: typing.Callable[[], typing.Any], interval: float = DEFAULT_SAMPLE_INTERVAL
+) -> StackSampler:
+    """Profile a method by sampling the stack of the calling thread.
+
+    Args:
+        fn (Callable): Method to profile.
+        interval (float): Interval between samples (in seconds).
+
+    Returns:
+        StackSampler: Sampler with the collected samples.
+    """
+    sampler = StackSampler(interval=interval)
+    sampler.start()
+    try:
+        fn()
+    finally:
+        sampler.stop()
+    logger.info(f"Collected {sum(sampler.samples.values())} stack samples")
+    return sampler
+
+
+class _SampledProfile:  # pylint: disable=too-few-public-methods
+    """Adapter that lets ``pstats.Stats`` load statistics built from stack samples, in
+    the same way as it loads a ``cProfile.Profile``."""
+
+    def __init__(self, stats: typing.Dict) -> None:
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        """Called by ``pstats.Stats`` to finalise the statistics, which are already
+        complete."""
+
+
+def samples_to_stats(
+    samples: typing.Mapping[Stack, int], interval: float
+) -> pstats.Stats:
+    """Convert stack samples into profile statistics. Each sample is counted as
+    ``interval`` seconds spent in every function on the stack (once per function, even
+    if it is recursive), and as time spent in the innermost function itself. The call
+    counts of the statistics are the numbers of samples each function appeared in.
+
+    Args:
+        samples (Mapping): Number of times each stack was sampled.
+        interval (float): Interval between samples (in seconds).
+
+    Returns:
+        pstats.Stats: Profile statistics.
+    """
+    stats: typing.Dict[FunctionKey, typing.List] = dict()
+    for stack, count in samples.items():
+        duration = count * interval
+        seen = set()
+        for i, func in enumerate(stack):
+            entry = stats.setdefault(func, [0, 0, 0.0, 0.0, dict()])
+            is_leaf = i == len(stack) - 1
+            if func not in seen:
+                seen.add(func)
+                entry[0] += count
+                entry[1] += count
+                entry[3] += duration
+            if is_leaf:
+                entry[2] += duration
+            if i > 0:
+                cc, nc, tt, ct = entry[4].get(stack[i - 1], (0, 0, 0.0, 0.0))
+                entry[4][stack[i - 1]] = (
+                    cc + count,
+                    nc + count,
+                    tt + (duration if is_leaf else 0.0),
+                    ct + duration,
+                )
+
+    # pstats.Stats() accepts any object with a create_stats() method and stats dict.
+    return pstats.Stats(
+        _SampledProfile(  # type: ignore[arg-type]
+            stats={func: tuple(entry) for func, entry in stats.items()}
+        )
+    )
+
+
+def stats_to_collapsed_stacks(
+    stats: pstats.Stats, min_time: float = MIN_STACK_TIME
+) -> typing.Dict[Stack, float]:
+    """Convert profile statistics into collapsed stacks, i.e. the time spent in the
+    innermost function of each stack. ``cProfile`` only records the time between each
+    caller and callee, so the stacks are rebuilt by walking down from the functions
+    without callers, splitting the time of each function between its callees in
+    proportion to the time spent in each. The result is therefore an estimate where a
+    function is called from several places.
+
+    Args:
+        stats (pstats.Stats): Profile statistics.
+        min_time (float): Stacks with less time than this (in seconds) are left out.
+
+    Returns:
+        Dict[Stack, float]: Time spent in the innermost function of each stack (in
+            seconds).
+    """
+    raw = stats.stats  # type: ignore[attr-defined]
+    callees: typing.Dict[FunctionKey, typing.Dict[FunctionKey, float]] = (
+        collections.defaultdict(dict)
+    )
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge[3]
+
+    stacks: typing.Dict[Stack, float] = collections.defaultdict(float)
+
+    def _walk(func: FunctionKey, parent: Stack, duration: float) -> None:
+        total = raw[func][3]
+        if total <= 0.0 or duration < min_time:
+            return
+        stack = parent + (func,)
+        scale = min(duration / total, 1.0)
+        self_time = raw[func][2] * scale
+        if self_time >= min_time:
+            stacks[stack] += self_time
+        for callee, edge_time in callees[func].items():
+            # Recursive calls are already included in the time of the outer call.
+            if callee not in stack:
+                _walk(func=callee, parent=stack, duration=edge_time * scale)
+
+    for func, (_, _, _, ct, callers) in raw.items():
+        if not callers:
+            _walk(func=func, parent=tuple(), duration=ct)
+    return dict(stacks)
+
+
+def format_function(func: FunctionKey) -> str:
+    """Format a function as a frame of a collapsed stack.
+
+    Args:
+        func (FunctionKey): Function, in the format (filename, line number, name).
+
+    Returns:
+        str: Frame label.
+    """
+    filename, line, name = func
+    if filename == "~":
+        # Built-in functions have no file.
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{line})"
+    # Semicolons separate the frames of a collapsed stack.
+    return label.replace(";", ":")
+
+
+def write_collapsed_stacks(
+    stacks: typing.Mapping[Stack, float], path: str, scale: float = 1.0
+) -> None:
+    """Write stacks in the collapsed stack format used by flame graph tools, with one
+    line per stack of the form ``outer;inner;innermost <count>``.
+
+    Args:
+        stacks (Mapping): Weight of each stack (e.g. time or number of samples).
+        path (str): Path of the file to write.
+        scale (float): Factor to scale each weight by before rounding it to an integer
+            count (e.g. ``1e6`` to write times in seconds as microseconds).
+    """
+    with open(path, mode="w", encoding="utf-8") as file:
+        for stack, weight in sorted(stacks.items()):
+            count = int(round(weight * scale))
+            if count > 0:
+                file.write(f"{';'.join(format_function(f) for f in stack)} {count}\n")
+    logger.info(f"Wrote collapsed stacks to: {path}")
+
+
+def profile_session(
+    session: typing.Callable[[], typing.Any],
+    output_prefix: str,
+    mode: str = "cprofile",
+    interval: float = DEFAULT_SAMPLE_INTERVAL,
+) -> pstats.Stats:
+    """Profile a session and write the statistics to ``<output_prefix>.prof`` (which
+    can be loaded with ``pstats`` or snakeviz) and the collapsed stacks to
+    ``<output_prefix>.collapsed``. In ``cprofile`` mode the stack weights are
+    microseconds, and in ``sample`` mode they are numbers of samples.
+
+    Args:
+        session (Callable): Method that runs the session.
+        output_prefix (str): Path of the output files, without the extension.
+        mode (str): Profiling mode, either ``"cprofile"`` or ``"sample"``.
+        interval (float): Interval between samples (in seconds) in ``sample`` mode.
+
+    Raises:
+        ValueError: If the mode is unknown.
+
+    Returns:
+        pstats.Stats: Profile statistics.
+    """
+    if mode == "cprofile":
+        stats = profile_cprofile(fn=session)
+        stacks = stats_to_collapsed_stacks(stats=stats)
+        scale = 1e6
+    elif mode == "sample":
+        sampler = profile_sampling(fn=session, interval=interval)
+        stats = sampler.to_stats()
+        stacks = dict(sampler.samples)
+        scale = 1.0
+    else:
+        raise ValueError(f"Unknown profiling mode: {mode}")
+
+    stats.dump_stats(f"{output_prefix}.prof")
+    logger.info(f"Wrote profile statistics to: {output_prefix}.prof")
+    write_collapsed_stacks(
+        stacks=stacks, path=f"{output_prefix}.collapsed", scale=scale
+    )
+    return stats
@@ -0,0 +1,271 @@
+"""Module for recording the input events of a game session and playing them back
+headless. The number of physics steps run in each frame is recorded, along with the
+frame each input event took effect at, so a recording can be played back at maximum
+speed (rather than in real time) while stepping the simulation and delivering each event
+exactly as in the recorded session.
+"""
+
+import dataclasses
+import json
+import threading
+import time
+import typing
+
+from . import events, inputs, log
+from .config import GameConfig
+from .physics import PymunkPhysics
+from .simulation import (
+    RunHeader,
+    SimulationStats,
+    create_headless_controller,
+    create_run_header,
+)
+
+logger = log.get_logger(name=__name__)
+
+
+@dataclasses.dataclass
+class Recording:
+    """
+    Recording of the input events of a single game session.
+
+    - header: Settings the session was run with (including the physics seed).
+    - frame_steps: Number of physics steps run in each frame of the session.
+    - events: Input events in the format (frame, event), in the order they occurred.
+      Each event took effect before the physics update of the given frame.
+    """
+
+    header: RunHeader
+    frame_steps: typing.List[int] = dataclasses.field(default_factory=list)
+    events: typing.List[typing.Tuple[int, inputs.InputEvents]] = dataclasses.field(
+        default_factory=list
+    )
+
+    @property
+    def num_steps(self) -> int:
+        """Get the number of physics steps the session ran for.
+
+        Returns:
+            int: Number of physics steps.
+        """
+        return sum(self.frame_steps)
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """Get the recording as a dictionary that can be serialised to JSON.
+
+        Returns:
+            Dict[str, Any]: Recording data.
+        """
+        return {
+            "header": self.header.to_dict(),
+            "frame_steps": self.frame_steps,
+            "events": [[frame, event.name] for frame, event in self.events],
+        }
+
+    @classmethod
+    def from_dict(cls, data: typing.Dict[str, typing.Any]) -> "Recording":
+        """Create a recording from a dictionary created by ``to_dict()``.
+
+        Args:
+            data (Dict[str, Any]): Recording data.
+
+        Returns:
+            Recording: Recording.
+        """
+        return cls(
+            header=RunHeader(**data["header"]),
+            frame_steps=[int(steps) for steps in data["frame_steps"]],
+            events=[
+                (int(frame), inputs.InputEvents[name]) for frame, name in data["events"]
+            ],
+        )
+
+
+def save_recording(recording: Recording, path: str) -> None:
+    """Save a recording to a JSON file.
+
+    Args:
+        recording (Recording): Recording to save.
+        path (str): Path of the file to write.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(recording.to_dict(), f)
+    logger.info(f"Saved {len(recording.events)} input events to: {path}")
+
+
+def load_recording(path: str) -> Recording:
+    """Load a recording from a JSON file.
+
+    Args:
+        path (str): Path of the file to read.
+
+    Returns:
+        Recording: Recording.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return Recording.from_dict(data=json.load(f))
+
+
+class InputRecorder:
+    """The InputRecorder class captures the events emitted by an ``InputEventPublisher``
+    and the number of physics steps run in each frame. The ``callback()`` method should
+    be subscribed to the publisher, the ``on_tick()`` method passed to
+    ``Controller.run()``, and ``finish()`` called once the session has ended.
+
+    Input events may arrive on another thread (e.g. from the keyboard listener). Each one
+    is stamped with the frame whose physics update it took effect before, by checking
+    whether the physics has been stepped since the start of the current frame.
+
+    Args:
+        physics (PymunkPhysics): Physics implementation used for the session.
+        config (GameConfig): Game configuration used for the session.
+    """
+
+    def __init__(self, physics: PymunkPhysics, config: GameConfig) -> None:
+        self._physics = physics
+        self._recording = Recording(
+            header=create_run_header(config=config, physics=physics)
+        )
+        self._frame_start_steps: typing.List[int] = list()
+        self._lock = threading.Lock()
+
+    @property
+    def recording(self) -> Recording:
+        """Get the recording.
+
+        Returns:
+            Recording: Recording.
+        """
+        return self._recording
+
+    def on_tick(self, _tick: int) -> None:
+        """Callback method for ``Controller.run()``, which records the start of a frame.
+        The tick count of the controller is not used, as the frames are counted from the
+        start of the recording."""
+        with self._lock:
+            self._end_frame()
+            self._frame_start_steps.append(self._physics.step_count)
+
+    def callback(self, event: inputs.InputEvents) -> None:
+        """Callback method for recording an input event.
+
+        Args:
+            event (InputEvents): Input event.
+        """
+        with self._lock:
+            frame = len(self._frame_start_steps) - 1
+            # The step count is read under the physics lock, so an update in progress
+            # finishes first and the event takes effect before the next frame.
+            if frame < 0 or self._physics.step_count > self._frame_start_steps[frame]:
+                frame += 1
+            self._recording.events.append((frame, event))
+
+    def finish(self) -> Recording:
+        """Finish recording, storing the number of physics steps run in the last frame.
+
+        Returns:
+            Recording: Recording.
+        """
+        with self._lock:
+            self._end_frame()
+            self._frame_start_steps.clear()
+        return self._recording
+
+    def _end_frame(self) -> None:
+        """Store the number of physics steps run in the current frame, if there is one.
+        The lock must be held."""
+        if not self._frame_start_steps:
+            return
+        steps = self._physics.step_count - self._frame_start_steps[-1]
+        self._recording.frame_steps.append(steps)
+
+
+class ReplayPhysics(PymunkPhysics):
+    """Implementation of the ``PymunkPhysics`` class for playing back a recording. Each
+    ``update()`` advances the simulation by the number of physics steps run in the next
+    frame of the recording, rather than by a fixed frame time.
+
+    Args:
+        recording (Recording): Recording to play back.
+        event_pub (GameEventPublisher): Publisher used to emit game events.
+    """
+
+    def __init__(
+        self, recording: Recording, event_pub: events.GameEventPublisher
+    ) -> None:
+        header = recording.header
+        super().__init__(
+            event_pub=event_pub,
+            fps=header.fps,
+            physics_hz=header.physics_hz,
+            max_steps_per_update=header.max_steps_per_update,
+            min_sub_steps=header.min_sub_steps,
+            max_sub_steps=header.max_sub_steps,
+            seed=header.seed,
+        )
+        self._frame_steps = iter(recording.frame_steps)
+
+    def update(self, delta_time: typing.Optional[float] = None) -> None:
+        if delta_time is None:
+            delta_time = next(self._frame_steps, 0) * self.step_time
+        super().update(delta_time=delta_time)
+
+
+def play_recording(
+    recording: Recording,
+    config: GameConfig,
+    event_pub: typing.Optional[events.GameEventPublisher] = None,
+    physics: typing.Optional[ReplayPhysics] = None,
+) -> SimulationStats:
+    """Play a recording back headless and as fast as possible. The controller is ticked
+    once per recorded frame, with the physics run for the same number of steps as in
+    the recorded session, so the per-frame work (e.g. checking for lost balls) happens
+    at the same points in the simulation. Each input event is passed to the controller
+    at the start of the frame it was recorded at.
+
+    Args:
+        recording (Recording): Recording to play back.
+        config (GameConfig): Game configuration the recording was made with.
+        event_pub (GameEventPublisher, optional): Event publisher to use. If ``None``
+            a new one is created.
+        physics (ReplayPhysics, optional): Physics implementation to use, which must
+            have been created for the recording and not yet updated. If ``None`` a new
+            one is created.
+
+    Returns:
+        SimulationStats: Statistics of the playback.
+    """
+    if event_pub is None:
+        event_pub = events.GameEventPublisher()
+    if physics is None:
+        physics = ReplayPhysics(recording=recording, event_pub=event_pub)
+    controller = create_headless_controller(
+        config=config, event_pub=event_pub, physics=physics
+    )
+
+    recorded_events = sorted(recording.events, key=lambda e: e[0])
+    next_event = 0
+
+    def _on_tick(tick: int) -> None:
+        nonlocal next_event
+        while (
+            next_event < len(recorded_events) and recorded_events[next_event][0] <= tick
+        ):
+            controller.handle_input_event(event=recorded_events[next_event][1])
+            next_event += 1
+
+    logger.info(f"Playing back recording with header: {recording.header}")
+    start = time.perf_counter()
+    ticks = controller.run(max_ticks=len(recording.frame_steps), on_tick=_on_tick)
+    wall_seconds = time.perf_counter() - start
+
+    stats = SimulationStats(
+        ticks=ticks,
+        simulated_seconds=physics.step_count * physics.step_time,
+        wall_seconds=wall_seconds,
+    )
+    logger.info(
+        f"Played back {stats.simulated_seconds:.1f}s in {stats.wall_seconds:.3f}s "
+        f"({stats.realtime_factor:.1f} simulated seconds per wall second)"
+    )
+    return stats
@@ -1,3 +1,10 @@
+from .bundle import (
+    AssetBundle,
+    BundleEntry,
+    build_bundle,
+    build_default_bundle,
+    get_default_bundle_path,
+)
 from .resource import (
     get_audio_resource_path,
     get_image_resource_path,
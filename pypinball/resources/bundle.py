@@ -0,0 +1,383 @@
+"""Module for building and loading asset bundles.
+
+An asset bundle is a single file containing the game images as raw RGBA pixel data and
+the game audio as raw PCM data, so that at startup the assets can be used straight from
+a memory-mapped file rather than opening and decoding each PNG/WAV/MP3 file.
+
+The file is a fixed size header, followed by a JSON index of the entries and then the
+data of each entry (aligned to ``BUNDLE_ALIGNMENT`` bytes). Bundles are built with
+``build_bundle()`` (see ``scripts/build_asset_bundle.py``) and loaded with the
+``AssetBundle`` class.
+"""
+
+import dataclasses
+import json
+import mmap
+import os
+import struct
+import typing
+import wave
+
+import pygame
+import simpleaudio
+from pydub import AudioSegment
+
+from .. import log
+from .resource import get_python_pkg_resource_path
+
+logger = log.get_logger(name=__name__)
+
+# Magic bytes and version used to identify a bundle file.
+BUNDLE_MAGIC = b"PPAB"
+BUNDLE_VERSION = 1
+
+# Header: magic, version, size of the JSON index in bytes.
+HEADER_FORMAT = struct.Struct("<4sHI")
+
+# Alignment (in bytes) of the data of each entry.
+BUNDLE_ALIGNMENT = 16
+
+# Name of the bundle file within the ``pypinball.resources`` module.
+DEFAULT_BUNDLE_FILENAME = "assets.bundle"
+
+IMAGE = "image"
+AUDIO = "audio"
+
+
+@dataclasses.dataclass(frozen=True)
+class BundleEntry:
+    """
+    Index entry for a single asset in a bundle.
+
+    - name: Name of the asset (the file name of the source asset, e.g. ``ball.png``).
+    - kind: Type of the asset, either ``"image"`` or ``"audio"``.
+    - offset: Offset of the data from the start of the file (in bytes).
+    - size: Size of the data (in bytes).
+    - params: Parameters needed to use the data. For images these are the ``width`` and
+        ``height``, and for audio the ``num_channels``, ``bytes_per_sample`` and
+        ``sample_rate``.
+    """
+
+    name: str
+    kind: str
+    offset: int
+    size: int
+    params: typing.Dict[str, int]
+
+
+def read_image_data(path: str) -> typing.Tuple[bytes, typing.Dict[str, int]]:
+    """Decode an image file into raw RGBA pixel data.
+
+    Args:
+        path (str): Path to the image file.
+
+    Returns:
+        Tuple[bytes, Dict[str, int]]: Pixel data and the image parameters.
+    """
+    surface = pygame.image.load(path)
+    width, height = surface.get_size()
+    return pygame.image.tobytes(surface, "RGBA"), {"width": width, "height": height}
+
+
+def read_audio_data(path: str) -> typing.Tuple[bytes, typing.Dict[str, int]]:
+    """Decode an audio file (WAV, or anything supported by pydub) into raw PCM data.
+
+    Args:
+        path (str): Path to the audio file.
+
+    Returns:
+        Tuple[bytes, Dict[str, int]]: PCM data and the audio parameters.
+    """
+    if path.lower().endswith(".wav"):
+        with wave.open(path, "rb") as wav:
+            params = {
+                "num_channels": wav.getnchannels(),
+                "bytes_per_sample": wav.getsampwidth(),
+                "sample_rate": wav.getframerate(),
+            }
+            return wav.readframes(wav.getnframes()), params
+
+    audio = AudioSegment.from_file(file=path)
+    params = {
+        "num_channels": audio.channels,
+        "bytes_per_sample": audio.sample_width,
+        "sample_rate": audio.frame_rate,
+    }
+    return audio.raw_data, params
+
+
+def build_bundle(
+    output_path: str, image_paths: typing.List[str], audio_paths: typing.List[str]
+) -> typing.List[BundleEntry]:
+    """Decode a set of image and audio files and write them into a bundle file. Assets
+    are named by their file name, so these must be unique.
+
+    Args:
+        output_path (str): Path of the bundle file to write.
+        image_paths (list): Paths to the image files.
+        audio_paths (list): Paths to the audio files.
+
+    Raises:
+        ValueError: If two assets have the same file name.
+
+    Returns:
+        List[BundleEntry]: Index of the written bundle.
+    """
+    assets = list()
+    for kind, paths, reader in [
+        (IMAGE, image_paths, read_image_data),
+        (AUDIO, audio_paths, read_audio_data),
+    ]:
+        for path in paths:
+            logger.debug("Adding %s to bundle: %s", kind, path)
+            data, params = reader(path)
+            assets.append((os.path.basename(path), kind, data, params))
+
+    names = [name for name, _, _, _ in assets]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Asset file names must be unique, got: {names}")
+
+    def _align(value: int) -> int:
+        return -(-value // BUNDLE_ALIGNMENT) * BUNDLE_ALIGNMENT
+
+    # The offsets depend upon the size of the index, which depends upon the offsets, so
+    # lay the data out until the size of the index stops changing.
+    index_size = 0
+    while True:
+        offset = _align(HEADER_FORMAT.size + index_size)
+        entries = list()
+        for name, kind, data, params in assets:
+            entries.append(
+                BundleEntry(
+                    name=name, kind=kind, offset=offset, size=len(data), params=params
+                )
+            )
+            offset = _align(offset + len(data))
+        index = json.dumps([dataclasses.asdict(e) for e in entries]).encode("utf-8")
+        if len(index) == index_size:
+            break
+        index_size = len(index)
+
+    with open(output_path, "wb") as file:
+        file.write(HEADER_FORMAT.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(index)))
+        file.write(index)
+        for entry, (_, _, data, _) in zip(entries, assets):
+            file.seek(entry.offset)
+            file.write(data)
+
+    logger.info(f"Wrote asset bundle: {output_path}, assets: {len(entries)}")
+    return entries
+
+
+def get_default_bundle_path() -> str:
+    """Get the path of the asset bundle within the ``pypinball.resources`` module. The
+    file only exists once it has been built.
+
+    Returns:
+        str: Full system path of the bundle file.
+    """
+    return os.path.join(os.path.dirname(__file__), DEFAULT_BUNDLE_FILENAME)
+
+
+def build_default_bundle(output_path: typing.Optional[str] = None) -> str:
+    """Build a bundle containing all of the image and audio resources in the pypinball
+    package.
+
+    Args:
+        output_path (str, optional): Path of the bundle file to write. If ``None`` the
+            default path (see ``get_default_bundle_path()``) is used.
+
+    Returns:
+        str: Path of the written bundle file.
+    """
+    if output_path is None:
+        output_path = get_default_bundle_path()
+
+    def _get_paths(prefix: str, extensions: typing.Tuple[str, ...]) -> typing.List[str]:
+        module_dir = os.path.dirname(
+            get_python_pkg_resource_path(prefix=prefix, resource="__init__.py")
+        )
+        return [
+            os.path.join(module_dir, filename)
+            for filename in sorted(os.listdir(module_dir))
+            if filename.lower().endswith(extensions)
+        ]
+
+    build_bundle(
+        output_path=output_path,
+        image_paths=_get_paths("pypinball.resources.images", (".png",)),
+        audio_paths=_get_paths("pypinball.resources.audio", (".wav", ".mp3")),
+    )
+    return output_path
+
+
+class AssetBundle:
+    """The AssetBundle class memory-maps a bundle file and creates surfaces and audio
+    objects straight from the mapped data, without decoding anything. Images are
+    created with ``pygame.image.frombuffer()`` and so share memory with the mapping,
+    which is why the bundle must stay open while they are in use.
+
+    Args:
+        path (str): Path to the bundle file.
+
+    Raises:
+        ValueError: If the file is not a bundle or is of an unsupported version.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < HEADER_FORMAT.size:
+            self._mmap.close()
+            raise ValueError(f"Asset bundle is too short: {path}")
+        magic, version, index_size = HEADER_FORMAT.unpack_from(self._mmap, 0)
+        if magic != BUNDLE_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"File is not an asset bundle: {path}")
+        if version != BUNDLE_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Unsupported asset bundle version: {version}")
+
+        start = HEADER_FORMAT.size
+        index = json.loads(bytes(self._mmap[start : start + index_size]))
+        self._entries = {e["name"]: BundleEntry(**e) for e in index}
+        logger.debug("Opened asset bundle: %s, assets: %d", path, len(self._entries))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def names(self) -> typing.List[str]:
+        """Get the names of the assets in the bundle.
+
+        Returns:
+            List[str]: Asset names.
+        """
+        return list(self._entries.keys())
+
+    def get_entry(self, name: str) -> BundleEntry:
+        """Get the index entry of an asset.
+
+        Args:
+            name (str): Name of the asset.
+
+        Raises:
+            KeyError: If the asset is not in the bundle.
+
+        Returns:
+            BundleEntry: Index entry.
+        """
+        return self._entries[name]
+
+    def get_image(self, name: str) -> pygame.Surface:
+        """Get an image as a surface that uses the pixel data in the bundle.
+
+        Args:
+            name (str): Name of the image (e.g. ``ball.png``).
+
+        Raises:
+            KeyError: If the image is not in the bundle.
+
+        Returns:
+            pygame.Surface: Image surface.
+        """
+        entry = self._get_entry(name=name, kind=IMAGE)
+        size = (entry.params["width"], entry.params["height"])
+        return pygame.image.frombuffer(self._get_data(entry=entry), size, "RGBA")
+
+    def get_wave_object(self, name: str) -> simpleaudio.WaveObject:
+        """Get a sound as a ``simpleaudio.WaveObject``.
+
+        Args:
+            name (str): Name of the sound (e.g. ``ball_lost.wav``).
+
+        Raises:
+            KeyError: If the sound is not in the bundle.
+
+        Returns:
+            simpleaudio.WaveObject: Sound.
+        """
+        entry = self._get_entry(name=name, kind=AUDIO)
+        return simpleaudio.WaveObject(self._get_data(entry=entry), **entry.params)
+
+    def get_pcm_data(self, name: str) -> memoryview:
+        """Get the raw PCM data of a sound, without copying it. The format of the data
+        is given by the ``params`` of the entry (see ``get_entry()``).
+
+        Args:
+            name (str): Name of the sound.
+
+        Raises:
+            KeyError: If the sound is not in the bundle.
+
+        Returns:
+            memoryview: PCM data.
+        """
+        return self._get_data(entry=self._get_entry(name=name, kind=AUDIO))
+
+    def get_audio_segment(self, name: str) -> AudioSegment:
+        """Get a sound as a ``pydub.AudioSegment``.
+
+        Args:
+            name (str): Name of the sound (e.g. ``default_background_music.mp3``).
+
+        Raises:
+            KeyError: If the sound is not in the bundle.
+
+        Returns:
+            AudioSegment: Sound.
+        """
+        entry = self._get_entry(name=name, kind=AUDIO)
+        return AudioSegment(
+            data=bytes(self.get_pcm_data(name=name)),
+            sample_width=entry.params["bytes_per_sample"],
+            frame_rate=entry.params["sample_rate"],
+            channels=entry.params["num_channels"],
+        )
+
+    def close(self) -> None:
+        """Close the memory mapping. The surfaces from ``get_image()`` (and the other
+        objects that share the mapped data, e.g. from ``get_pcm_data()``) must be
+        dropped first.
+
+        Raises:
+            BufferError: If objects that share the mapped data are still in use. The
+                bundle is left open, so it can be closed once they have been dropped.
+        """
+        try:
+            self._mmap.close()
+        except BufferError as exc:
+            raise BufferError(
+                f"Unable to close asset bundle while its assets are in use (drop the "
+                f"surfaces and sounds created from it first): {self._path}"
+            ) from exc
+
+    def _get_entry(self, name: str, kind: str) -> BundleEntry:
+        """Get the index entry of an asset, checking it is of the expected type.
+
+        Args:
+            name (str): Name of the asset.
+            kind (str): Expected type of the asset.
+
+        Raises:
+            KeyError: If there is no asset of the given type with the name.
+
+        Returns:
+            BundleEntry: Index entry.
+        """
+        entry = self._entries.get(name)
+        if entry is None or entry.kind != kind:
+            raise KeyError(f"No {kind} named {name} in asset bundle: {self._path}")
+        return entry
+
+    def _get_data(self, entry: BundleEntry) -> memoryview:
+        """Get a view of the data of an entry, without copying it.
+
+        Args:
+            entry (BundleEntry): Index entry.
+
+        Returns:
+            memoryview: Data.
+        """
+        return memoryview(self._mmap)[entry.offset : entry.offset + entry.size]
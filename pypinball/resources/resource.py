@@ -22,7 +22,7 @@ def get_python_pkg_resource_path(prefix: str, resource: str) -> str:
         ModuleNotFoundError: If the prefix does not exist.
         FileNotFoundError: If the resource file does not exist.
     """
-    logger.debug(f"Loading resource path, prefix: {prefix}, resource: {resource}")
+    logger.debug("Loading resource path, prefix: %s, resource: %s", prefix, resource)
     with importlib.resources.path(package=prefix, resource=resource) as path:
         if not os.path.exists(path):
             raise FileNotFoundError(f"Unable to find file: {path}")
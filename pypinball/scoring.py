@@ -1,3 +1,5 @@
+import typing
+
 from . import log
 from .events import GameEventPublisher, GameEvents
 
@@ -43,12 +45,25 @@ class Scoring:
         Args:
             event (GameEvents): Event to handle.
         """
-        LOGGER.debug(f"Handing event: {event}, updating score...")
+        LOGGER.debug("Handing event: %s, updating score...", event)
         if event != GameEvents.COLLISION_BALL_BUMPER:
             return
         new_score = self._score + int(self._multiplier * 1.0)
         self.set_score(value=new_score)
-        LOGGER.debug(f"Score: {self.current_score}")
+        LOGGER.debug("Score: %s", self._score)
+
+    def batch_callback(self, events: typing.List[GameEvents]) -> None:
+        """Batch callback method for handling GameEvents, which is used to subscribe to
+        batches of GameEvents via ``GameEventPublisher.subscribe_batch()``. This is
+        equivalent to calling ``event_callback()`` with each event.
+
+        Args:
+            events (list): Events to handle.
+        """
+        count = events.count(GameEvents.COLLISION_BALL_BUMPER)
+        if count == 0:
+            return
+        self.set_score(value=self._score + count * int(self._multiplier * 1.0))
 
     def reset(self) -> None:
         """Reset the score back to zero."""
@@ -70,7 +85,7 @@ class Scoring:
         Args:
             value (int): Value to set the score to.
         """
-        LOGGER.debug(f"Setting a new score value: {value}")
+        LOGGER.debug("Setting a new score value: %s", value)
         self._score = int(value)
 
 
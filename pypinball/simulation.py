@@ -0,0 +1,418 @@
+"""Module containing helpers for running the game headless (i.e. without any display,
+audio or input devices). This is useful for running batch simulations of a table as
+the physics is stepped as fast as the CPU allows rather than at the display frame rate.
+
+Multiple independent tables can be simulated in parallel across processes using the
+``run_tables()`` function, which yields the result of each table as soon as it finishes.
+"""
+
+import collections
+import concurrent.futures
+import dataclasses
+import time
+import typing
+
+from . import events, inputs, log, scoring
+from .config import GameConfig
+from .controller import Controller
+from .display import NullDisplay
+from .physics import PymunkPhysics
+
+logger = log.get_logger(name=__name__)
+
+# Type alias for a scripted sequence of input events, in the format (tick, event).
+InputScript = typing.Sequence[typing.Tuple[int, inputs.InputEvents]]
+
+
+@dataclasses.dataclass
+class SimulationStats:
+    """
+    Statistics captured from a headless simulation run.
+
+    - ticks: Number of controller ticks that were run.
+    - simulated_seconds: Amount of game time that was simulated.
+    - wall_seconds: Amount of real (wall clock) time the simulation took.
+    """
+
+    ticks: int
+    simulated_seconds: float
+    wall_seconds: float
+
+    @property
+    def realtime_factor(self) -> float:
+        """Get the number of simulated seconds per wall clock second.
+
+        Returns:
+            float: Simulated seconds per wall second.
+        """
+        if self.wall_seconds <= 0.0:
+            return float("inf")
+        return self.simulated_seconds / self.wall_seconds
+
+
+@dataclasses.dataclass(frozen=True)
+class RunHeader:
+    """
+    Header describing the settings a run was started with. Together with the inputs, this
+    is everything required to reproduce a run.
+
+    - seed: Seed of the physics random number generator.
+    - fps: Frame rate the controller is ticked at.
+    - physics_hz: Rate of the fixed physics timestep.
+    - max_steps_per_update: Maximum number of physics steps run per frame.
+    - min_sub_steps: Minimum number of sub-steps per physics step.
+    - max_sub_steps: Maximum number of sub-steps per physics step.
+    """
+
+    seed: int
+    fps: float
+    physics_hz: float
+    max_steps_per_update: int
+    min_sub_steps: int
+    max_sub_steps: int
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """Get the header as a dictionary (e.g. for writing to a file).
+
+        Returns:
+            Dict[str, Any]: Header fields.
+        """
+        return dataclasses.asdict(self)
+
+
+@dataclasses.dataclass
+class TableResult:
+    """
+    Result of simulating a single table.
+
+    - table_index: Index of the table within the batch.
+    - seed: Seed the table was simulated with.
+    - score: Final score.
+    - lives_lost: Number of balls that were lost.
+    - collisions: Count of each collision ``GameEvents`` type, keyed by the event name.
+    - stats: Timing statistics of the simulation.
+    """
+
+    table_index: int
+    seed: int
+    score: int
+    lives_lost: int
+    collisions: typing.Dict[str, int]
+    stats: SimulationStats
+
+
+@dataclasses.dataclass
+class BatchSummary:
+    """
+    Aggregated results from simulating a batch of tables.
+
+    - num_tables: Number of tables that were simulated.
+    - mean_score: Mean final score.
+    - max_score: Highest final score.
+    - lives_lost: Total number of balls lost across all tables.
+    - collisions: Total count of each collision ``GameEvents`` type, keyed by name.
+    """
+
+    num_tables: int = 0
+    mean_score: float = 0.0
+    max_score: int = 0
+    lives_lost: int = 0
+    collisions: typing.Dict[str, int] = dataclasses.field(default_factory=dict)
+
+
+def create_run_header(config: GameConfig, physics: PymunkPhysics) -> RunHeader:
+    """Create the header for a run, recording the seed the physics is using.
+
+    Args:
+        config (GameConfig): Game configuration.
+        physics (PymunkPhysics): Physics implementation used for the run.
+
+    Returns:
+        RunHeader: Run header.
+    """
+    return RunHeader(
+        seed=physics.seed,
+        fps=config.fames_per_second,
+        physics_hz=config.physics_hz,
+        max_steps_per_update=config.max_physics_steps_per_update,
+        min_sub_steps=config.min_physics_sub_steps,
+        max_sub_steps=config.max_physics_sub_steps,
+    )
+
+
+def create_headless_physics(
+    config: GameConfig,
+    event_pub: events.GameEventPublisher,
+    seed: typing.Optional[int] = None,
+) -> PymunkPhysics:
+    """Create a ``PymunkPhysics`` instance configured from a ``GameConfig``, which steps
+    by a fixed amount of time per update rather than the elapsed real time.
+
+    Args:
+        config (GameConfig): Game configuration.
+        event_pub (GameEventPublisher): Event publisher to use.
+        seed (int, optional): Seed for the physics random number generator. If ``None``
+            the seed from the ``GameConfig`` is used.
+
+    Returns:
+        PymunkPhysics: Physics implementation.
+    """
+    return PymunkPhysics(
+        event_pub=event_pub,
+        fps=config.fames_per_second,
+        physics_hz=config.physics_hz,
+        max_steps_per_update=config.max_physics_steps_per_update,
+        min_sub_steps=config.min_physics_sub_steps,
+        max_sub_steps=config.max_physics_sub_steps,
+        seed=config.seed if seed is None else seed,
+    )
+
+
+def create_headless_controller(
+    config: GameConfig,
+    event_pub: typing.Optional[events.GameEventPublisher] = None,
+    physics: typing.Optional[PymunkPhysics] = None,
+) -> Controller:
+    """Create a ``Controller`` that uses a ``NullDisplay`` and a ``PymunkPhysics``
+    implementation. The ``Controller.setup()`` method is called before returning.
+
+    Args:
+        config (GameConfig): Game configuration.
+        event_pub (GameEventPublisher, optional): Event publisher to use. If ``None``
+            a new one is created.
+        physics (PymunkPhysics, optional): Physics implementation to use. If ``None``
+            one is created using ``create_headless_physics()``.
+
+    Returns:
+        Controller: Controller that is ready to be run.
+    """
+    if event_pub is None:
+        event_pub = events.GameEventPublisher()
+
+    if physics is None:
+        physics = create_headless_physics(config=config, event_pub=event_pub)
+
+    controller = Controller(
+        config=config,
+        display_interface=NullDisplay(),
+        physics_interface=physics,
+        event_publisher=event_pub,
+    )
+    controller.setup()
+    return controller
+
+
+def enable_auto_launch(
+    controller: Controller, event_pub: events.GameEventPublisher
+) -> None:
+    """Launch a ball and automatically launch a new one each time a ball is lost. This
+    acts as a stand-in for a player pressing the center button.
+
+    Args:
+        controller (Controller): Controller to launch balls for.
+        event_pub (GameEventPublisher): Event publisher the controller emits to.
+    """
+
+    def _callback(event: events.GameEvents) -> None:
+        if event != events.GameEvents.BALL_LOST:
+            return
+        controller.handle_input_event(event=inputs.InputEvents.CENTER_BUTTON_PRESSED)
+
+    event_pub.subscribe(callback=_callback)
+    controller.handle_input_event(event=inputs.InputEvents.CENTER_BUTTON_PRESSED)
+
+
+def make_flipper_script(num_ticks: int, period: int = 30) -> InputScript:
+    """Create a simple input script that actuates both flippers every ``period`` ticks.
+
+    Args:
+        num_ticks (int): Number of ticks the script should cover.
+        period (int): Number of ticks between each actuation.
+
+    Returns:
+        InputScript: Scripted input events.
+    """
+    script = list()
+    for tick in range(0, num_ticks, period):
+        script.append((tick, inputs.InputEvents.LEFT_BUTTON_PRESSED))
+        script.append((tick, inputs.InputEvents.RIGHT_BUTTON_PRESSED))
+    return script
+
+
+def make_script_player(
+    controller: Controller, script: InputScript
+) -> typing.Callable[[int], None]:
+    """Create a callback for ``Controller.run()`` that passes the scripted input events
+    to the controller on the tick they are scheduled for.
+
+    Args:
+        controller (Controller): Controller to pass the input events to.
+        script (InputScript): Scripted input events.
+
+    Returns:
+        Callable: Callback method that takes the current tick.
+    """
+    schedule: typing.Dict[int, typing.List[inputs.InputEvents]] = dict()
+    for tick, event in script:
+        schedule.setdefault(tick, list()).append(event)
+
+    def _on_tick(tick: int) -> None:
+        for event in schedule.get(tick, ()):
+            controller.handle_input_event(event=event)
+
+    return _on_tick
+
+
+def run_headless(
+    controller: Controller,
+    num_ticks: int,
+    fps: float,
+    on_tick: typing.Optional[typing.Callable[[int], None]] = None,
+) -> SimulationStats:
+    """Run a controller for a number of ticks as fast as possible and measure how much
+    game time was simulated per second of wall clock time.
+
+    Args:
+        controller (Controller): Controller to run. This should be using a display that
+            does not block (e.g. ``NullDisplay``).
+        num_ticks (int): Maximum number of ticks to run.
+        fps (float): Frame rate the physics is stepped at (i.e. simulated ticks per second).
+        on_tick (Callable, optional): Method called with the tick count before each tick.
+
+    Returns:
+        SimulationStats: Statistics of the run.
+    """
+    start = time.perf_counter()
+    ticks = controller.run(max_ticks=num_ticks, on_tick=on_tick)
+    wall_seconds = time.perf_counter() - start
+
+    stats = SimulationStats(
+        ticks=ticks, simulated_seconds=ticks / fps, wall_seconds=wall_seconds
+    )
+    logger.info(
+        f"Simulated {stats.simulated_seconds:.1f}s in {stats.wall_seconds:.3f}s "
+        f"({stats.realtime_factor:.1f} simulated seconds per wall second)"
+    )
+    return stats
+
+
+def simulate_table(
+    config: GameConfig,
+    seed: int,
+    num_ticks: int,
+    script: InputScript = (),
+    table_index: int = 0,
+) -> TableResult:
+    """Simulate a single headless table with automatically launched balls and a
+    scripted sequence of inputs. This is a module level function so that it can be
+    run in a separate process.
+
+    Args:
+        config (GameConfig): Game configuration.
+        seed (int): Seed for the physics random number generator.
+        num_ticks (int): Maximum number of ticks to simulate.
+        script (InputScript): Scripted input events.
+        table_index (int): Index of the table within a batch.
+
+    Returns:
+        TableResult: Result of the simulation.
+    """
+    event_pub = events.GameEventPublisher()
+    scorer = scoring.get_scorer(event_pub=event_pub)
+    counts: typing.Counter[events.GameEvents] = collections.Counter()
+
+    def _count_event(event: events.GameEvents) -> None:
+        counts[event] += 1
+
+    event_pub.subscribe(callback=_count_event)
+
+    physics = create_headless_physics(config=config, event_pub=event_pub, seed=seed)
+    logger.info(f"Run header: {create_run_header(config=config, physics=physics)}")
+    controller = create_headless_controller(
+        config=config, event_pub=event_pub, physics=physics
+    )
+    enable_auto_launch(controller=controller, event_pub=event_pub)
+    stats = run_headless(
+        controller=controller,
+        num_ticks=num_ticks,
+        fps=config.fames_per_second,
+        on_tick=make_script_player(controller=controller, script=script),
+    )
+
+    return TableResult(
+        table_index=table_index,
+        seed=seed,
+        score=scorer.current_score,
+        lives_lost=counts[events.GameEvents.BALL_LOST],
+        collisions={
+            event.name: count
+            for event, count in counts.items()
+            if event.name.startswith("COLLISION_")
+        },
+        stats=stats,
+    )
+
+
+def run_tables(
+    config: GameConfig,
+    num_tables: int,
+    num_ticks: int,
+    base_seed: int = 0,
+    script: InputScript = (),
+    max_workers: typing.Optional[int] = None,
+) -> typing.Iterator[TableResult]:
+    """Simulate a number of independent tables in parallel using a process pool. Each
+    table is seeded with ``base_seed + table_index`` so that a batch is reproducible.
+    Results are yielded as each table finishes, so they are not necessarily in order.
+
+    Args:
+        config (GameConfig): Game configuration used for every table.
+        num_tables (int): Number of tables to simulate.
+        num_ticks (int): Maximum number of ticks to simulate per table.
+        base_seed (int): Seed of the first table.
+        script (InputScript): Scripted input events used for every table.
+        max_workers (int, optional): Number of worker processes. Defaults to the
+            number of CPUs.
+
+    Yields:
+        TableResult: Result of each table.
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                simulate_table,
+                config=config,
+                seed=base_seed + i,
+                num_ticks=num_ticks,
+                script=script,
+                table_index=i,
+            )
+            for i in range(num_tables)
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+
+def summarise_results(results: typing.Iterable[TableResult]) -> BatchSummary:
+    """Aggregate the results of a batch of tables.
+
+    Args:
+        results (Iterable[TableResult]): Table results.
+
+    Returns:
+        BatchSummary: Aggregated results.
+    """
+    summary = BatchSummary()
+    total_score = 0
+    collisions: typing.Counter[str] = collections.Counter()
+    for result in results:
+        summary.num_tables += 1
+        summary.max_score = max(summary.max_score, result.score)
+        summary.lives_lost += result.lives_lost
+        total_score += result.score
+        collisions.update(result.collisions)
+
+    if summary.num_tables > 0:
+        summary.mean_score = total_score / summary.num_tables
+    summary.collisions = dict(collisions)
+    return summary
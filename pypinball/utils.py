@@ -1,13 +1,27 @@
 import math
 import typing
 
+import numpy
+
 from .config import GameConfig
 from .display import DisplayInterface
-from .domain import Ball, BallState, Bumper, FlipperState, RectangleBumper, RoundBumper
+from .domain import (
+    Ball,
+    BallState,
+    BallStateArrays,
+    Bumper,
+    Flipper,
+    FlipperState,
+    RectangleBumper,
+    RoundBumper,
+)
 from .lives import Lives
 from .physics import PhysicsInterface
 from .scoring import Scoring
 
+# Height of a rendered flipper as a fraction of its length.
+FLIPPER_HEIGHT_RATIO = 0.35
+
 
 class ObjectIdGenerator:
     """
@@ -54,6 +68,27 @@ def check_ball_is_within_area(
     return all([ball_in_width, ball_in_height])
 
 
+def find_balls_outside_area(
+    balls: BallStateArrays, width: float, height: float
+) -> numpy.ndarray:
+    """
+    Find all the balls whose position is outside of the playing area. This is the
+    vectorized equivalent of calling ``check_ball_is_within_area()`` for each ball.
+
+    Args:
+        balls (BallStateArrays): State of the balls.
+        width (float): Area width.
+        height (float): Area height.
+
+    Returns:
+        numpy.ndarray: UIDs of the balls outside of the area.
+    """
+    x = balls.positions[:, 0]
+    y = balls.positions[:, 1]
+    within = (x >= 0.0) & (x <= width) & (y >= 0.0) & (y <= height)
+    return balls.uids[~within]
+
+
 def handle_center_button_press(
     physics: PhysicsInterface, config: GameConfig, id_gen: ObjectIdGenerator
 ) -> None:
@@ -88,6 +123,42 @@ def render_physics_balls(
         display.draw_ball(pos=ball.position, diameter=ball.radius * 2.0, alpha=1.0)
 
 
+def interpolate_ball_positions(balls: BallStateArrays, alpha: float) -> numpy.ndarray:
+    """
+    Interpolate the ball positions between the previous and current physics step.
+
+    Args:
+        balls (BallStateArrays): State of the balls.
+        alpha (float): Interpolation value in the range [0, 1], where 0 is the previous
+            position and 1 is the current position.
+
+    Returns:
+        numpy.ndarray: Interpolated positions with shape (N, 2).
+    """
+    if balls.previous_positions is None or alpha >= 1.0:
+        return balls.positions
+    previous = balls.previous_positions
+    return previous + (balls.positions - previous) * alpha
+
+
+def render_physics_ball_arrays(
+    balls: BallStateArrays, display: DisplayInterface, alpha: float = 1.0
+) -> None:
+    """
+    Render/draw the current state of the Balls in the Physics simulation from a
+    ``BallStateArrays`` snapshot.
+
+    Args:
+        balls (BallStateArrays): State of the balls.
+        display (DisplayInterface): Display to draw the balls onto.
+        alpha (float): Interpolation value between the previous and current physics step.
+    """
+    positions = interpolate_ball_positions(balls=balls, alpha=alpha)
+    diameters = (balls.radii * 2.0).tolist()
+    for pos, diameter in zip(positions.tolist(), diameters):
+        display.draw_ball(pos=(pos[0], pos[1]), diameter=diameter, alpha=1.0)
+
+
 def render_physics_bumpers(
     bumpers: typing.List[Bumper], display: DisplayInterface
 ) -> None:
@@ -133,11 +204,46 @@ def render_physics_flippers(
             uid=flipper.uid,
             pos=(x, y),
             angle=flipper.angle,
-            size=(flipper.length, flipper.length * 0.35),
+            size=(flipper.length, flipper.length * FLIPPER_HEIGHT_RATIO),
             alpha=1.0,
         )
 
 
+def preload_flippers(flippers: typing.List[Flipper], display: DisplayInterface) -> None:
+    """Ask the display to prepare each flipper over its full range of motion, i.e.
+    between its rest angle and its rest angle plus the actuation angle.
+
+    Args:
+        flippers (list): List of flipper configurations.
+        display (DisplayInterface): Implementation of the display interface.
+    """
+    for flipper in flippers:
+        config = flipper.config
+        display.preload_flipper(
+            uid=flipper.uid,
+            size=(config.length, config.length * FLIPPER_HEIGHT_RATIO),
+            min_angle=config.angle + min(0.0, config.actuation_angle),
+            max_angle=config.angle + max(0.0, config.actuation_angle),
+        )
+
+
+def render_static_layer(physics: PhysicsInterface, display: DisplayInterface) -> None:
+    """
+    Render the static layer (the background and the bumpers) into the display. The layer
+    is only re-drawn when the bumper revision of the physics has changed since it was
+    last rendered, otherwise the pre-rendered layer is used.
+
+    Args:
+        physics (PhysicsInterface): Physics to get the bumpers from.
+        display (DisplayInterface): Display to draw on.
+    """
+    if display.begin_static_layer(revision=physics.get_bumper_revision()):
+        display.draw_background()
+        render_physics_bumpers(bumpers=physics.get_bumper_states(), display=display)
+        display.end_static_layer()
+    display.draw_static_layer()
+
+
 def render_physics_state(physics: PhysicsInterface, display: DisplayInterface) -> None:
     """
     Render the state of the Physics scene in the display.
@@ -146,9 +252,12 @@ def render_physics_state(physics: PhysicsInterface, display: DisplayInterface) -
         physics (PhysicsInterface): Physics to get the state from.
         display (DisplayInterface): Display to draw on.
     """
-    display.draw_background()
-    render_physics_balls(balls=physics.get_ball_states(), display=display)
-    render_physics_bumpers(bumpers=physics.get_bumper_states(), display=display)
+    render_static_layer(physics=physics, display=display)
+    render_physics_ball_arrays(
+        balls=physics.get_ball_state_arrays(),
+        display=display,
+        alpha=physics.get_interpolation_alpha(),
+    )
     render_physics_flippers(flippers=physics.get_flipper_states(), display=display)
 
 
@@ -0,0 +1,105 @@
+"""Module containing the WorkerQueue class, a bounded queue whose items are processed on
+a dedicated worker thread. This is the base of the queues that deliver events to
+asynchronous subscribers and write log records, so it must not log itself.
+"""
+
+import collections
+import threading
+import typing
+
+
+class WorkerQueue:
+    """The WorkerQueue class is the base class for a bounded queue of items that are
+    processed one at a time on a dedicated worker thread, so that putting an item never
+    waits on it being processed. Subclasses implement ``_process()``, and implement
+    putting items (including what to do when the queue is full) under ``_condition``.
+
+    The worker thread is only started by ``start()``, so that a queue can be created
+    without starting a thread until there is something to process.
+
+    Args:
+        max_size (int): Maximum number of queued items.
+        name (str): Name of the worker thread.
+        drain_on_close (bool): Whether the queued items are processed when the queue is
+            closed, or discarded.
+    """
+
+    def __init__(self, max_size: int, name: str, drain_on_close: bool) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got: {max_size}")
+        self._max_size = max_size
+        self._name = name
+        self._drain_on_close = drain_on_close
+        self._queue: typing.Deque[typing.Any] = collections.deque()
+        self._busy = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread: typing.Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the worker thread, if it has not already been started. This may be
+        called with ``_condition`` held, as its lock is re-entrant."""
+        with self._condition:
+            if self._thread is not None or self._closed:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name=self._name, daemon=True
+            )
+            self._thread.start()
+
+    def flush(self, timeout: typing.Optional[float] = None) -> bool:
+        """Wait until all of the queued items have been processed.
+
+        Args:
+            timeout (float, optional): Maximum time to wait (in seconds).
+
+        Returns:
+            bool: ``True`` if the queue was flushed, else ``False``.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._closed or (not self._queue and not self._busy),
+                timeout=timeout,
+            )
+
+    def close(self) -> None:
+        """Stop the worker thread, after processing the item currently being processed
+        (and the queued items, if ``drain_on_close`` is set)."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None and threading.current_thread() is not thread:
+            thread.join()
+
+    def _pop(self) -> typing.Any:
+        """Remove the oldest queued item. The condition must be held.
+
+        Returns:
+            Any: Item.
+        """
+        return self._queue.popleft()
+
+    def _process(self, item: typing.Any) -> None:
+        """Process an item on the worker thread. This is called without the condition
+        held.
+
+        Args:
+            item (Any): Item.
+        """
+        raise NotImplementedError()
+
+    def _run(self) -> None:
+        """Target method of the worker thread, which processes the queued items until
+        the queue is closed."""
+        while True:
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+                self._condition.wait_for(lambda: self._closed or self._queue)
+                if self._closed and not (self._drain_on_close and self._queue):
+                    return
+                item = self._pop()
+                self._busy = True
+
+            self._process(item)
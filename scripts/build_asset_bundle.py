@@ -0,0 +1,27 @@
+"""Script to build the asset bundle, which contains all of the pypinball images and
+audio pre-decoded into a single file that is memory-mapped at startup.
+
+By default the bundle is written into the ``pypinball.resources`` module, where it is
+picked up automatically by ``pypinball.main``. The bundle needs re-building whenever
+any of the assets change.
+"""
+
+import argparse
+
+import pypinball
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        description="Script to build the pypinball asset bundle"
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Output file to write the bundle to (defaults to the bundle in the package)",
+    )
+    args = parser.parse_args()
+
+    path = pypinball.resources.build_default_bundle(output_path=args.output)
+    print(f"Wrote asset bundle: {path}")
@@ -0,0 +1,70 @@
+"""Script to run the pypinball benchmark suite (see ``pypinball.benchmark``).
+
+The results can be written to a JSON file, and compared against the results of an
+earlier run (e.g. from the main branch). The script exits with a non-zero status if any
+benchmark is slower than the baseline by more than the threshold.
+"""
+
+import argparse
+import os
+import sys
+
+# The benchmarks render to an offscreen display, so don't open a window.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pypinball  # pylint: disable=wrong-import-position
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        description="Script to run the pypinball benchmark suite"
+    )
+    parser.add_argument(
+        "--output", type=str, default=None, help="Output file to write the results to"
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=5,
+        help="Number of timed repeats of each benchmark",
+    )
+    parser.add_argument(
+        "--filter",
+        type=str,
+        default=None,
+        help="Only run the benchmarks whose name contains this",
+    )
+    parser.add_argument(
+        "--compare",
+        type=str,
+        default=None,
+        help="Results file of an earlier run to compare against",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=pypinball.benchmark.DEFAULT_REGRESSION_THRESHOLD,
+        help="Fraction by which a benchmark must be slower than the earlier run to fail",
+    )
+    args = parser.parse_args()
+
+    results = pypinball.benchmark.run_benchmarks(
+        benchmarks=pypinball.benchmark.get_benchmarks(),
+        repeats=args.repeats,
+        name_filter=args.filter,
+    )
+    report = pypinball.benchmark.create_report(results=results)
+    print(pypinball.benchmark.format_results(results=results))
+
+    if args.output is not None:
+        pypinball.benchmark.save_report(report=report, path=args.output)
+
+    if args.compare is not None:
+        comparisons = pypinball.benchmark.compare_reports(
+            baseline=pypinball.benchmark.load_report(path=args.compare),
+            current=report,
+            threshold=args.threshold,
+        )
+        print(pypinball.benchmark.format_comparisons(comparisons=comparisons))
+        if any(c.regressed for c in comparisons):
+            sys.exit(1)
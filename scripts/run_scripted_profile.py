@@ -0,0 +1,95 @@
+"""Script to profile a deterministic, scripted session of pypinball (see
+``pypinball.profiling``).
+
+Unlike ``run_profiler.py``, the session runs headless with a fixed seed and scripted
+inputs for a fixed number of ticks, without waiting on the frame rate clock, so that
+profiles are comparable between runs. The profile statistics are written to
+``<output>.prof`` (which can be visualized using snakeviz) and the collapsed stacks to
+``<output>.collapsed`` (which can be rendered as a flame graph, e.g. using flamegraph.pl
+or speedscope).
+"""
+
+import argparse
+import os
+
+# The session renders to an offscreen display (if at all), so don't open a window.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pypinball  # pylint: disable=wrong-import-position
+from pypinball.config import (  # pylint: disable=wrong-import-position
+    DEFAULT_DISPLAY_CONFIG,
+    DEFAULT_GAME_CONFIG,
+)
+from pypinball.display import PyGameDisplay  # pylint: disable=wrong-import-position
+
+
+def create_display(
+    event_pub: pypinball.events.GameEventPublisher,
+) -> pypinball.DisplayInterface:
+    """Create an offscreen display that does not limit the frame rate.
+
+    Args:
+        event_pub (GameEventPublisher): Event publisher of the session.
+
+    Returns:
+        DisplayInterface: Display.
+    """
+    return PyGameDisplay(
+        width=int(DEFAULT_GAME_CONFIG.playing_area[0]),
+        height=int(DEFAULT_GAME_CONFIG.playing_area[1]),
+        game_events=event_pub,
+        config=DEFAULT_DISPLAY_CONFIG,
+        # A frame rate of zero doesn't limit the frame rate (see Clock.tick()).
+        fps=0.0,
+    )
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        description="Script to profile a scripted session of the pypinball program"
+    )
+    parser.add_argument(
+        "output",
+        type=str,
+        help="Path to write the profile data to, without the extension",
+    )
+    parser.add_argument(
+        "--ticks", type=int, default=3600, help="Number of ticks to run for"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Seed for the physics simulation"
+    )
+    parser.add_argument(
+        "--mode",
+        type=str,
+        choices=["cprofile", "sample"],
+        default="cprofile",
+        help="Profile every call with cProfile, or sample the stack",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=pypinball.profiling.DEFAULT_SAMPLE_INTERVAL,
+        help="Interval between stack samples (in seconds) in sample mode",
+    )
+    parser.add_argument(
+        "--render",
+        action="store_true",
+        help="Render each frame to an offscreen display",
+    )
+    args = parser.parse_args()
+
+    session = pypinball.profiling.create_scripted_session(
+        config=DEFAULT_GAME_CONFIG,
+        num_ticks=args.ticks,
+        seed=args.seed,
+        display_factory=create_display if args.render else None,
+    )
+    stats = pypinball.profiling.profile_session(
+        session=session,
+        output_prefix=args.output,
+        mode=args.mode,
+        interval=args.interval,
+    )
+    stats.sort_stats("cumulative").print_stats(20)
@@ -5,6 +5,7 @@ setup(
     version="0.0.1a",
     packages=find_packages(include=["pypinball", "pypinball.*"]),
     package_data={
+        "pypinball.resources": ["*.bundle"],
         "pypinball.resources.audio": ["*.mp3", "*.wav"],
         "pypinball.resources.images": ["*.png"],
     },
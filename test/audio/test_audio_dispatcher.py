@@ -0,0 +1,136 @@
+"""Test the AudioDispatcher class in the audio_dispatcher.py module."""
+
+import threading
+import unittest
+import unittest.mock
+
+import pypinball
+
+
+class MockVoice:
+    """Mock of a simpleaudio.PlayObject which plays until it is stopped."""
+
+    def __init__(self) -> None:
+        self.playing = True
+
+    def is_playing(self) -> bool:
+        return self.playing
+
+    def stop(self) -> None:
+        self.playing = False
+
+
+class MockPlayer:
+    """Mock SoundPlayer that records the sounds it starts."""
+
+    def __init__(self) -> None:
+        self.started = list()
+        self.voices = list()
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def start_sound_file(self, file_path: str) -> MockVoice:
+        self.gate.wait(timeout=5.0)
+        self.started.append(file_path)
+        self.voices.append(MockVoice())
+        return self.voices[-1]
+
+
+class TestAudioDispatcher(unittest.TestCase):
+    """Test queuing and playing sounds with the AudioDispatcher class."""
+
+    def setUp(self) -> None:
+        self.time = 0.0
+        self.player = MockPlayer()
+        self.dispatcher = pypinball.audio.AudioDispatcher(
+            player=self.player,
+            coalesce_window=0.05,
+            max_voices=3,
+            max_queue_size=8,
+            clock=lambda: self.time,
+        )
+
+    def tearDown(self) -> None:
+        self.player.gate.set()
+        self.dispatcher.close()
+
+    def test_play_does_not_block(self) -> None:
+        """Test that play_sound_file() returns before the sound has been started."""
+        self.player.gate.clear()
+        self.assertTrue(self.dispatcher.play_sound_file(file_path="a.wav"))
+        self.assertListEqual(self.player.started, [])
+        self.player.gate.set()
+        self.dispatcher.wait()
+        self.assertListEqual(self.player.started, ["a.wav"])
+
+    def test_coalesce_identical_sounds(self) -> None:
+        """Test that a burst of requests for the same sound only plays it once, while
+        other sounds and later requests are played."""
+        for path in ["a.wav", "a.wav", "b.wav", "a.wav"]:
+            self.dispatcher.play_sound_file(file_path=path)
+        self.time = 0.1
+        self.dispatcher.play_sound_file(file_path="a.wav")
+        self.dispatcher.wait()
+
+        self.assertListEqual(self.player.started, ["a.wav", "b.wav", "a.wav"])
+        self.assertEqual(self.dispatcher.stats.coalesced, 2)
+        self.assertEqual(self.dispatcher.stats.played, 3)
+
+    def test_voice_limit(self) -> None:
+        """Test that the oldest sound is stopped when the voice limit is reached."""
+        for i in range(4):
+            self.time = float(i)
+            self.dispatcher.play_sound_file(file_path=f"{i}.wav")
+        self.dispatcher.wait()
+
+        self.assertEqual(self.dispatcher.get_num_voices(), 3)
+        self.assertFalse(self.player.voices[0].is_playing())
+        self.assertEqual(self.dispatcher.stats.stolen, 1)
+
+    def test_finished_voices_not_stolen(self) -> None:
+        """Test that sounds that have finished do not count towards the voice limit."""
+        for i in range(3):
+            self.time = float(i)
+            self.dispatcher.play_sound_file(file_path=f"{i}.wav")
+        self.dispatcher.wait()
+        self.player.voices[1].stop()
+
+        self.time = 10.0
+        self.dispatcher.play_sound_file(file_path="3.wav")
+        self.dispatcher.wait()
+        self.assertEqual(self.dispatcher.stats.stolen, 0)
+        self.assertTrue(self.player.voices[0].is_playing())
+
+    def test_drop_when_queue_full(self) -> None:
+        """Test that requests are dropped while the queue is full."""
+        self.player.gate.clear()
+        results = list()
+        for i in range(10):
+            self.time = float(i)
+            results.append(self.dispatcher.play_sound_file(file_path=f"{i}.wav"))
+        self.assertIn(False, results)
+        self.assertEqual(self.dispatcher.stats.dropped, results.count(False))
+        self.player.gate.set()
+        self.dispatcher.wait()
+        self.assertEqual(len(self.player.started), results.count(True))
+
+    def test_failed_sound(self) -> None:
+        """Test that a sound that fails to start is counted and does not stop the
+        dispatcher."""
+        with unittest.mock.patch.object(
+            self.player, "start_sound_file", return_value=None
+        ):
+            self.dispatcher.play_sound_file(file_path="missing.wav")
+            self.dispatcher.wait()
+        self.assertEqual(self.dispatcher.stats.failed, 1)
+
+        self.time = 1.0
+        self.dispatcher.play_sound_file(file_path="a.wav")
+        self.dispatcher.wait()
+        self.assertListEqual(self.player.started, ["a.wav"])
+
+    def test_close_stops_voices(self) -> None:
+        """Test that closing the dispatcher stops all of the playing sounds."""
+        self.dispatcher.play_sound_file(file_path="a.wav")
+        self.dispatcher.close()
+        self.assertFalse(self.player.voices[0].is_playing())
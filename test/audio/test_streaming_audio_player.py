@@ -0,0 +1,182 @@
+"""Test module for the StreamingAudioPlayer class."""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+import wave
+
+import pypinball
+from pypinball.audio import PcmFormat, PcmRingBuffer, StreamingAudioPlayer
+
+
+class TestPcmRingBuffer(unittest.TestCase):
+    """Test the PcmRingBuffer class."""
+
+    def test_read_write_wrap_around(self) -> None:
+        """Test that data is read in the order it was written when it wraps around the
+        end of the buffer."""
+        buffer = PcmRingBuffer(capacity=8)
+        self.assertTrue(buffer.write(b"abcdef"))
+        self.assertEqual(buffer.read(num_bytes=4), b"abcd")
+        self.assertTrue(buffer.write(b"ghijk"))
+        self.assertEqual(len(buffer), 7)
+        self.assertEqual(buffer.read(num_bytes=7), b"efghijk")
+        self.assertEqual(len(buffer), 0)
+
+    def test_write_waits_for_space(self) -> None:
+        """Test that a write larger than the free space waits for a reader."""
+        buffer = PcmRingBuffer(capacity=4)
+        thread = threading.Thread(target=buffer.write, args=(b"0123456789",))
+        thread.start()
+        result = b"".join(buffer.read(num_bytes=2) for _ in range(5))
+        thread.join(timeout=5.0)
+        self.assertEqual(result, b"0123456789")
+
+    def test_close_wakes_reader(self) -> None:
+        """Test that closing the buffer wakes a waiting reader, which gets the data
+        that was left."""
+        buffer = PcmRingBuffer(capacity=4)
+        buffer.write(b"ab")
+        result = list()
+        thread = threading.Thread(target=lambda: result.append(buffer.read(4)))
+        thread.start()
+        time.sleep(0.05)
+        buffer.close()
+        thread.join(timeout=5.0)
+        self.assertListEqual(result, [b"ab"])
+        self.assertFalse(buffer.write(b"cd"))
+
+
+class MockOutput:
+    """Mock AudioOutput that records the blocks queued to it."""
+
+    def __init__(self, pcm_format: PcmFormat, num_bytes: int) -> None:
+        self.format = pcm_format
+        self.num_bytes = num_bytes
+        self.data = bytearray()
+        self.done = threading.Event()
+        self.stopped = False
+
+    def queue(self, data: bytes, stop_event: threading.Event) -> None:
+        if len(self.data) < self.num_bytes:
+            self.data += data
+        else:
+            self.done.set()
+            stop_event.wait(timeout=5.0)
+
+    def stop(self) -> None:
+        self.stopped = True
+
+
+class TestStreamingAudioPlayer(unittest.TestCase):
+    """Test streaming a WAV file on a loop with the StreamingAudioPlayer class."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "music.wav")
+        self.frames = bytes(i % 251 for i in range(2 * 2 * 3001))
+        with wave.open(self.filename, "wb") as wav:
+            wav.setnchannels(2)
+            wav.setsampwidth(2)
+            wav.setframerate(8000)
+            wav.writeframes(self.frames)
+
+        self.outputs = list()
+
+        def _create_output(pcm_format: PcmFormat) -> MockOutput:
+            self.outputs.append(MockOutput(pcm_format, len(self.frames) * 3))
+            return self.outputs[-1]
+
+        self.player = StreamingAudioPlayer(
+            filename=self.filename,
+            buffer_seconds=0.1,
+            block_seconds=0.01,
+            output_factory=_create_output,
+        )
+
+    def tearDown(self) -> None:
+        self.player.stop()
+        self.tmp_dir.cleanup()
+
+    def test_format(self) -> None:
+        """Test that the format matches the WAV file."""
+        self.assertEqual(
+            self.player.get_format(),
+            PcmFormat(num_channels=2, bytes_per_sample=2, sample_rate=8000),
+        )
+
+    def test_buffer_smaller_than_file(self) -> None:
+        """Test that the decoded audio held in memory is bounded by the buffer."""
+        self.assertEqual(self.player.get_buffer_size(), 3200)
+        self.assertLess(self.player.get_buffer_size(), len(self.frames))
+
+    def test_seamless_loop(self) -> None:
+        """Test that the output is the audio repeated with nothing between the loops."""
+        self.assertTrue(self.player.play())
+        self.assertFalse(self.player.play())
+        self.assertTrue(self.outputs[0].done.wait(timeout=5.0))
+        self.assertTrue(self.player.stop())
+        self.assertFalse(self.player.is_playing())
+        self.assertTrue(self.outputs[0].stopped)
+
+        data = bytes(self.outputs[0].data)
+        self.assertGreaterEqual(len(data), len(self.frames) * 3)
+        self.assertEqual(data[: len(self.frames) * 3], self.frames * 3)
+
+    def test_stop_when_not_playing(self) -> None:
+        """Test that stopping a player that is not playing returns False."""
+        self.assertFalse(self.player.stop())
+
+    def test_play_from_bundle(self) -> None:
+        """Test streaming the pre-decoded audio from an asset bundle."""
+        path = os.path.join(self.tmp_dir.name, "assets.bundle")
+        pypinball.resources.build_bundle(
+            output_path=path, image_paths=[], audio_paths=[self.filename]
+        )
+        bundle = pypinball.resources.AssetBundle(path=path)
+        output = MockOutput(self.player.get_format(), len(self.frames) * 2)
+        player = StreamingAudioPlayer(
+            filename="missing/music.wav",
+            bundle=bundle,
+            buffer_seconds=0.1,
+            block_seconds=0.01,
+            output_factory=lambda _: output,
+        )
+        player.play()
+        self.assertTrue(output.done.wait(timeout=5.0))
+        player.stop()
+        self.assertEqual(bytes(output.data[: len(self.frames) * 2]), self.frames * 2)
+
+
+class TestStreamingAudioPlayerMissingFile(unittest.TestCase):
+    """Test the initialisation of the StreamingAudioPlayer with a missing file."""
+
+    def test_init_with_missing_file(self) -> None:
+        """Test that initialisation with a missing file throws a FileNotFoundError"""
+        with self.assertRaises(FileNotFoundError):
+            StreamingAudioPlayer(filename="foobar.mp3")
+
+
+class TestPygameMixerOutput(unittest.TestCase):
+    """Test the PygameMixerOutput class."""
+
+    def test_queue_waits_for_playing_block(self) -> None:
+        """Test that queueing a block waits while a block is playing and another block
+        is queued after it."""
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        pcm_format = PcmFormat(num_channels=2, bytes_per_sample=2, sample_rate=22050)
+        output = pypinball.audio.streaming_audio_player.PygameMixerOutput(
+            pcm_format=pcm_format
+        )
+        block = bytes(pcm_format.get_num_bytes(duration=0.1))
+        stop_event = threading.Event()
+
+        start = time.monotonic()
+        output.queue(data=block, stop_event=stop_event)
+        output.queue(data=block, stop_event=stop_event)
+        self.assertLess(time.monotonic() - start, 0.05)
+        output.queue(data=block, stop_event=stop_event)
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+        output.stop()
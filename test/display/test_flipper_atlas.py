@@ -0,0 +1,90 @@
+import math
+import os
+import tempfile
+import unittest
+
+import pygame
+
+import pypinball
+from pypinball.display import flipper_atlas
+
+
+class TestGetQuantisedAngles(unittest.TestCase):
+    """Test the flipper_atlas.get_quantised_angles() method."""
+
+    def test_range_covered(self) -> None:
+        """Test that the quantised angles cover the full range of motion."""
+        angles = flipper_atlas.get_quantised_angles(
+            min_angle=math.radians(-12.0), max_angle=math.radians(31.0), angle_step=5
+        )
+        self.assertEqual(angles, [-35, -30, -25, -20, -15, -10, -5, 0, 5, 10, 15])
+
+
+class TestFlipperAtlas(unittest.TestCase):
+    """Test the FlipperAtlas class."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.set_mode((1, 1), pygame.NOFRAME)
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.icon_path = os.path.join(cls.tmp_dir.name, "flipper.png")
+        surface = pygame.Surface(size=(40, 10), flags=pygame.SRCALPHA)
+        surface.fill((255, 0, 0, 255))
+        pygame.image.save(surface, cls.icon_path)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.tmp_dir.cleanup()
+
+    def setUp(self) -> None:
+        self.atlas = flipper_atlas.FlipperAtlas(icon_path=self.icon_path, angle_step=5)
+
+    def test_not_built(self) -> None:
+        """Test that a flipper is not in the atlas until it has been built."""
+        self.assertNotIn(0, self.atlas)
+        with self.assertRaises(KeyError):
+            self.atlas.get(uid=0, angle=0.0)
+
+    def test_sprite_matches_quantised_angle(self) -> None:
+        """Test that each sprite is rotated by its quantised angle, and that the offset
+        centres the sprite on the flipper."""
+        self.atlas.build(uid=0, size=(40, 10), min_angle=0.0, max_angle=1.0)
+        self.assertIn(0, self.atlas)
+
+        for angle in [0.0, 0.3, 0.52, 1.0]:
+            sprite, offset = self.atlas.get(uid=0, angle=angle)
+            quantised = round(math.degrees(-angle) / 5) * 5
+            expected = pygame.transform.rotate(
+                pygame.Surface(size=(40, 10)), angle=quantised
+            )
+            self.assertEqual(sprite.get_size(), expected.get_size())
+            self.assertEqual(
+                offset, (-sprite.get_width() / 2, -sprite.get_height() / 2)
+            )
+
+    def test_sprites_share_atlas(self) -> None:
+        """Test that the sprites are views of a single atlas surface and that getting the
+        same angle again returns the same surface."""
+        self.atlas.build(uid=0, size=(40, 10), min_angle=0.0, max_angle=1.0)
+        sprite, _ = self.atlas.get(uid=0, angle=0.5)
+        self.assertIsNotNone(sprite.get_parent())
+        self.assertIs(self.atlas.get(uid=0, angle=0.5)[0], sprite)
+
+    def test_angle_clamped(self) -> None:
+        """Test that angles outside of the range of motion use the closest sprite."""
+        self.atlas.build(uid=0, size=(40, 10), min_angle=0.0, max_angle=0.5)
+        self.assertIs(
+            self.atlas.get(uid=0, angle=2.0)[0], self.atlas.get(uid=0, angle=0.5)[0]
+        )
+        self.assertIs(
+            self.atlas.get(uid=0, angle=-1.0)[0], self.atlas.get(uid=0, angle=0.0)[0]
+        )
+
+    def test_build_in_background(self) -> None:
+        """Test building the atlas in a worker thread."""
+        self.atlas.build(
+            uid=3, size=(40, 10), min_angle=0.0, max_angle=1.0, background=True
+        )
+        self.atlas.wait()
+        self.assertIn(3, self.atlas)
@@ -2,7 +2,11 @@ import unittest
 
 import pygame
 
-from pypinball.display.pygame_score import ScoringCache, generate_scoring_cache
+from pypinball.display.pygame_score import (
+    DigitScoreRenderer,
+    ScoringCache,
+    generate_scoring_cache,
+)
 
 
 class GenerateScoringCache(unittest.TestCase):
@@ -48,3 +52,39 @@ class TestScoringCache(unittest.TestCase):
         """Test that accessing the cache with an incorrect type throws a TypeError"""
         with self.assertRaises(TypeError):
             _ = self.cache["foo"]
+
+
+class TestDigitScoreRenderer(unittest.TestCase):
+    """Test the DigitScoreRenderer class"""
+
+    def setUp(self) -> None:
+        self.renderer = DigitScoreRenderer()
+
+    def test_width_is_sum_of_glyphs(self) -> None:
+        """Test that the surface for a score is as wide as the glyphs of its digits."""
+        widths = {
+            d: self.renderer.get(score=int(d)).get_width() for d in ["1", "2", "3"]
+        }
+        result = self.renderer.get(score=123)
+        self.assertEqual(result.get_width(), sum(widths.values()))
+
+    def test_same_surface_for_same_score(self) -> None:
+        """Test that requesting the same score twice returns the same surface."""
+        first = self.renderer.get(score=42)
+        self.assertIs(self.renderer.get(score=42), first)
+        self.assertIsNot(self.renderer.get(score=43), first)
+
+    def test_large_score(self) -> None:
+        """Test that scores have no upper limit."""
+        result = self.renderer.get(score=123456789)
+        self.assertGreater(result.get_width(), self.renderer.get(score=500).get_width())
+
+    def test_negative_score(self) -> None:
+        """Test that a negative score can be rendered."""
+        result = self.renderer.get(score=-5)
+        self.assertIsInstance(result, pygame.Surface)
+
+    def test_wrong_type(self) -> None:
+        """Test that rendering a score with an incorrect type throws a TypeError"""
+        with self.assertRaises(TypeError):
+            _ = self.renderer.get(score="foo")
@@ -0,0 +1,313 @@
+import os
+import tempfile
+import typing
+import unittest
+import unittest.mock
+
+import pygame
+
+import pypinball
+
+
+def create_image(path: str, size: typing.Tuple[int, int], color: pygame.Color) -> None:
+    """Save a semi-transparent image with a solid border to a file."""
+    surface = pygame.Surface(size=size, flags=pygame.SRCALPHA)
+    surface.fill(color)
+    pygame.draw.rect(surface, (0, 0, 0, 255), surface.get_rect(), width=2)
+    pygame.image.save(surface, path)
+
+
+class PyGameDisplayTestCase(unittest.TestCase):
+    """Base test case that creates image assets for the PyGameDisplay class."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        paths = dict()
+        for i, name in enumerate(
+            ["background", "ball", "round_bumper", "rect_bumper", "flipper", "life"]
+        ):
+            paths[name] = os.path.join(cls.tmp_dir.name, f"{name}.png")
+            create_image(
+                path=paths[name],
+                size=(64, 64),
+                color=pygame.Color(40 * i, 255 - 40 * i, 100, 160),
+            )
+        cls.config = pypinball.config.DisplayConfig(
+            background_image_path=paths["background"],
+            ball_image_path=paths["ball"],
+            round_bumper_image_path=paths["round_bumper"],
+            rectangle_bumper_image_path=paths["rect_bumper"],
+            flipper_image_path=paths["flipper"],
+            life_icon_path=paths["life"],
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.tmp_dir.cleanup()
+
+    def create_display(self, dirty_rects: bool) -> pypinball.display.PyGameDisplay:
+        """Create a small display using the test image assets."""
+        return pypinball.display.PyGameDisplay(
+            width=200,
+            height=300,
+            game_events=pypinball.events.GameEventPublisher(),
+            config=self.config,
+            fps=1000.0,
+            dirty_rects=dirty_rects,
+        )
+
+
+class TestDirtyRects(PyGameDisplayTestCase):
+    """Test the dirty rectangle rendering mode of the PyGameDisplay class."""
+
+    def render_frames(self, dirty_rects: bool) -> typing.List[bytes]:
+        """Render a sequence of frames with a moving ball and return the screen contents
+        of each frame."""
+        display = self.create_display(dirty_rects=dirty_rects)
+        frames = list()
+        for i in range(5):
+            display.clear()
+            display.draw_background()
+            display.draw_ball(pos=(60.0 + 7.5 * i, 100.0), diameter=30.0, alpha=1.0)
+            display.draw_round_bumper(
+                uid=0, pos=(80.0, 100.0), diameter=40.0, alpha=1.0
+            )
+            display.draw_flipper(
+                uid=1, pos=(100.0, 250.0), angle=0.1 * i, size=(80, 28), alpha=1.0
+            )
+            display.draw_lives(lives=3)
+            display.draw_score(score=str(i // 2))
+            display.update()
+            frames.append(pygame.image.tobytes(pygame.display.get_surface(), "RGB"))
+        return frames
+
+    def test_matches_full_redraw(self) -> None:
+        """Test that each frame is identical to the frame drawn by a full redraw."""
+        expected = self.render_frames(dirty_rects=False)
+        frames = self.render_frames(dirty_rects=True)
+        for i, (frame, exp) in enumerate(zip(frames, expected)):
+            self.assertEqual(frame, exp, msg=f"Frame {i} differs")
+
+    def test_only_changed_regions_updated(self) -> None:
+        """Test that the first frame is flipped and later frames only update the
+        regions around the moving sprites."""
+        display = self.create_display(dirty_rects=True)
+
+        def _draw(x: float) -> None:
+            display.clear()
+            display.draw_background()
+            display.draw_ball(pos=(x, 100.0), diameter=30.0, alpha=1.0)
+            display.draw_round_bumper(
+                uid=0, pos=(150.0, 200.0), diameter=40.0, alpha=1.0
+            )
+            display.update()
+
+        with unittest.mock.patch("pygame.display.flip") as flip, unittest.mock.patch(
+            "pygame.display.update"
+        ) as update:
+            _draw(x=50.0)
+            flip.assert_called_once()
+            update.assert_not_called()
+
+            _draw(x=60.0)
+            update.assert_called_once()
+            rects = update.call_args.args[0]
+            self.assertEqual(
+                sorted(tuple(r) for r in rects), [(35, 85, 30, 30), (45, 85, 30, 30)]
+            )
+
+            update.reset_mock()
+            _draw(x=60.0)
+            update.assert_not_called()
+
+            display.invalidate()
+            _draw(x=60.0)
+            self.assertEqual(flip.call_count, 2)
+
+
+class TestStaticLayer(PyGameDisplayTestCase):
+    """Test rendering the background and bumpers into the static layer."""
+
+    def setUp(self) -> None:
+        self.physics = pypinball.physics.PymunkPhysics(
+            event_pub=pypinball.events.GameEventPublisher(), fps=60.0
+        )
+        self.physics.add_bumper(
+            bumper=pypinball.domain.RoundBumper(uid=0, position=(50, 100), radius=15)
+        )
+        self.physics.add_bumper(
+            bumper=pypinball.domain.RectangleBumper(
+                uid=1, position=(120, 200), size=(40, 10), angle=0.3
+            )
+        )
+        self.physics.add_ball(ball=pypinball.domain.Ball(uid=0, position=(60, 90)))
+
+    def render_frames(self, dirty_rects: bool, num_frames: int) -> typing.List[bytes]:
+        """Render the physics state for a number of frames, removing a bumper part way
+        through, and return the screen contents of each frame."""
+        display = self.create_display(dirty_rects=dirty_rects)
+        frames = list()
+        for i in range(num_frames):
+            if i == num_frames // 2:
+                self.physics.remove_bumper(uid=1)
+            self.physics.update()
+            display.clear()
+            pypinball.utils.render_physics_state(physics=self.physics, display=display)
+            display.update()
+            frames.append(pygame.image.tobytes(pygame.display.get_surface(), "RGB"))
+        return frames
+
+    def test_bumpers_drawn_once(self) -> None:
+        """Test that the bumpers are only drawn when the bumper set changes."""
+        display = self.create_display(dirty_rects=False)
+        with unittest.mock.patch.object(
+            display, "draw_round_bumper", wraps=display.draw_round_bumper
+        ) as draw:
+            for _ in range(3):
+                display.clear()
+                pypinball.utils.render_physics_state(
+                    physics=self.physics, display=display
+                )
+                display.update()
+            self.assertEqual(draw.call_count, 1)
+
+            self.physics.add_bumper(
+                bumper=pypinball.domain.RoundBumper(uid=5, position=(150, 50), radius=9)
+            )
+            pypinball.utils.render_physics_state(physics=self.physics, display=display)
+            self.assertEqual(draw.call_count, 3)
+
+    def test_removed_bumper_not_drawn(self) -> None:
+        """Test that the static layer is re-rendered when a bumper is removed, and that
+        the dirty rectangle mode gives the same output."""
+        expected = self.render_frames(dirty_rects=False, num_frames=4)
+        self.assertNotEqual(expected[1], expected[2])
+
+        self.setUp()
+        frames = self.render_frames(dirty_rects=True, num_frames=4)
+        for i, (frame, exp) in enumerate(zip(frames, expected)):
+            self.assertEqual(frame, exp, msg=f"Frame {i} differs")
+
+
+class TestFlipperAtlas(PyGameDisplayTestCase):
+    """Test drawing the flippers from the pre-rendered atlas."""
+
+    def test_preloaded_flipper_not_rotated(self) -> None:
+        """Test that drawing a preloaded flipper does not rotate anything on demand."""
+        display = self.create_display(dirty_rects=False)
+        display.preload_flipper(uid=0, size=(80, 28), min_angle=-1.0, max_angle=0.0)
+        with unittest.mock.patch("pygame.transform.rotate") as rotate:
+            for angle in [0.0, -0.3, -0.7, -1.0]:
+                display.draw_flipper(
+                    uid=0, pos=(100.0, 200.0), angle=angle, size=(80, 28), alpha=1.0
+                )
+            rotate.assert_not_called()
+
+
+class TestAssetLoader(PyGameDisplayTestCase):
+    """Test loading the images of the PyGameDisplay with an AssetLoader."""
+
+    def test_matches_synchronous_loading(self) -> None:
+        """Test that the frames drawn with the images loaded by an AssetLoader match the
+        frames drawn with the images loaded on the calling thread."""
+
+        def _render(
+            asset_loader: typing.Optional[pypinball.asset_loader.AssetLoader],
+        ) -> bytes:
+            display = pypinball.display.PyGameDisplay(
+                width=200,
+                height=300,
+                game_events=pypinball.events.GameEventPublisher(),
+                config=self.config,
+                fps=1000.0,
+                asset_loader=asset_loader,
+            )
+            display.clear()
+            display.draw_background()
+            display.draw_ball(pos=(60.0, 100.0), diameter=30.0, alpha=1.0)
+            display.draw_round_bumper(
+                uid=0, pos=(80.0, 100.0), diameter=40.0, alpha=1.0
+            )
+            display.draw_flipper(
+                uid=1, pos=(100.0, 250.0), angle=0.2, size=(80, 28), alpha=1.0
+            )
+            display.draw_lives(lives=3)
+            display.update()
+            return pygame.image.tobytes(pygame.display.get_surface(), "RGB")
+
+        expected = _render(asset_loader=None)
+        loader = pypinball.asset_loader.AssetLoader()
+        frame = _render(asset_loader=loader)
+        loader.shutdown()
+
+        self.assertEqual(frame, expected)
+        names = {t.name for t in loader.get_timings()}
+        self.assertEqual(names, set(vars(self.config).values()))
+
+
+class TestAssetBundle(PyGameDisplayTestCase):
+    """Test loading the images of the PyGameDisplay from an asset bundle."""
+
+    def test_images_from_bundle(self) -> None:
+        """Test that the images are taken from the bundle, and that the frames drawn
+        match those drawn with the images loaded from file."""
+        path = os.path.join(self.tmp_dir.name, "assets.bundle")
+        pypinball.resources.build_bundle(
+            output_path=path,
+            image_paths=sorted(set(vars(self.config).values())),
+            audio_paths=[],
+        )
+        bundle = pypinball.resources.AssetBundle(path=path)
+
+        def _render(asset_bundle: typing.Optional[pypinball.resources.AssetBundle]):
+            display = pypinball.display.PyGameDisplay(
+                width=200,
+                height=300,
+                game_events=pypinball.events.GameEventPublisher(),
+                config=self.config,
+                fps=1000.0,
+                asset_bundle=asset_bundle,
+            )
+            display.clear()
+            display.draw_background()
+            display.draw_ball(pos=(60.0, 100.0), diameter=30.0, alpha=1.0)
+            display.draw_round_bumper(
+                uid=0, pos=(80.0, 100.0), diameter=40.0, alpha=1.0
+            )
+            display.draw_lives(lives=3)
+            display.update()
+            return pygame.image.tobytes(pygame.display.get_surface(), "RGB")
+
+        expected = _render(asset_bundle=None)
+        with unittest.mock.patch("pygame.image.load") as load:
+            frame = _render(asset_bundle=bundle)
+            load.assert_not_called()
+        self.assertEqual(frame, expected)
+
+
+class TestOverlay(PyGameDisplayTestCase):
+    """Test drawing the overlay with the PyGameDisplay class."""
+
+    def test_overlay_cached(self) -> None:
+        """Test that the overlay text is only re-rendered when it changes."""
+        display = self.create_display(dirty_rects=True)
+        with unittest.mock.patch.object(
+            display, "_render_overlay", wraps=display._render_overlay
+        ) as render:
+            for lines in [["a", "bb"], ["a", "bb"], ["c"]]:
+                display.clear()
+                display.draw_overlay(lines=lines)
+                display.update()
+            self.assertEqual(render.call_count, 2)
+
+    def test_overlay_position(self) -> None:
+        """Test that the overlay is drawn in the bottom-left corner."""
+        display = self.create_display(dirty_rects=True)
+        display.clear()
+        display.draw_overlay(lines=["test"])
+        surface, rect = display._frame[-1]
+        self.assertEqual(rect.left, 0)
+        self.assertEqual(rect.bottom, 300)
+        self.assertEqual(surface.get_height(), rect.height)
@@ -0,0 +1,120 @@
+import unittest
+
+import pygame
+
+from pypinball.display.pygame_score import ScoringCache
+from pypinball.display.surface_cache import (
+    NamespacedCache,
+    SurfaceCache,
+    get_surface_num_bytes,
+)
+
+
+def create_surface(width: int = 10, height: int = 10) -> pygame.Surface:
+    """Create a 32-bit surface, which uses four bytes per pixel."""
+    return pygame.Surface(size=(width, height), depth=32)
+
+
+class TestGetSurfaceNumBytes(unittest.TestCase):
+    """Test the get_surface_num_bytes() method."""
+
+    def test_num_bytes(self) -> None:
+        """Test that the size is calculated from the dimensions and bit depth."""
+        self.assertEqual(get_surface_num_bytes(create_surface(10, 20)), 800)
+        surface = pygame.Surface(size=(10, 20), depth=8)
+        self.assertEqual(get_surface_num_bytes(surface), 200)
+
+
+class TestSurfaceCache(unittest.TestCase):
+    """Test the SurfaceCache class."""
+
+    def setUp(self) -> None:
+        # Budget for exactly three 10x10 32-bit surfaces.
+        self.cache = SurfaceCache(max_bytes=1200)
+
+    def test_hit_and_miss(self) -> None:
+        """Test that lookups are counted as hits and misses."""
+        self.assertIsNone(self.cache.get(key="a"))
+        self.cache.put(key="a", surface=create_surface())
+        self.assertIsNotNone(self.cache.get(key="a"))
+
+        stats = self.cache.stats
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+        self.assertAlmostEqual(stats.hit_rate, 0.5)
+        self.assertEqual((stats.entries, stats.num_bytes), (1, 400))
+
+    def test_least_recently_used_evicted(self) -> None:
+        """Test that the least recently used surface is evicted when over budget."""
+        for key in ["a", "b", "c"]:
+            self.cache.put(key=key, surface=create_surface())
+        self.cache.get(key="a")
+        self.cache.put(key="d", surface=create_surface())
+
+        self.assertEqual(self.cache.keys(), ["c", "a", "d"])
+        self.assertEqual(self.cache.stats.evictions, 1)
+        self.assertEqual(self.cache.stats.num_bytes, 1200)
+
+    def test_surface_larger_than_budget(self) -> None:
+        """Test that a surface larger than the whole budget is not cached."""
+        self.cache.put(key="a", surface=create_surface())
+        self.cache.put(key="big", surface=create_surface(width=100))
+        self.assertNotIn("big", self.cache)
+        self.assertIn("a", self.cache)
+
+    def test_get_or_create(self) -> None:
+        """Test that the factory is only called when the surface is not cached."""
+        calls = list()
+
+        def _factory() -> pygame.Surface:
+            calls.append(1)
+            return create_surface()
+
+        first = self.cache.get_or_create(key="a", factory=_factory)
+        second = self.cache.get_or_create(key="a", factory=_factory)
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)
+
+    def test_replace_and_discard(self) -> None:
+        """Test that the memory accounting is kept up to date when surfaces are
+        replaced and removed."""
+        self.cache.put(key="a", surface=create_surface())
+        self.cache.put(key="a", surface=create_surface(width=20))
+        self.assertEqual(self.cache.stats.num_bytes, 800)
+        self.cache.discard(key="a")
+        self.assertEqual((self.cache.stats.entries, self.cache.stats.num_bytes), (0, 0))
+
+    def test_unbounded(self) -> None:
+        """Test that a cache without a budget never evicts."""
+        cache = SurfaceCache()
+        for i in range(100):
+            cache.put(key=i, surface=create_surface())
+        self.assertEqual(len(cache), 100)
+        self.assertEqual(cache.stats.evictions, 0)
+
+
+class TestSharedSurfaceCache(unittest.TestCase):
+    """Test sharing a SurfaceCache between several caches."""
+
+    def setUp(self) -> None:
+        pygame.font.init()
+        self.cache = SurfaceCache()
+
+    def test_namespaces(self) -> None:
+        """Test that each cache only counts and clears its own surfaces."""
+        first = ScoringCache(max_score=10, cache=self.cache)
+        second = ScoringCache(max_score=10, cache=self.cache)
+        first[1]
+        first[2]
+        second[1]
+
+        self.assertEqual(len(self.cache), 3)
+        self.assertEqual((len(first), len(second)), (2, 1))
+        self.assertIsNot(first[1], second[1])
+
+        first.clear()
+        self.assertEqual((len(first), len(second)), (0, 1))
+
+    def test_default_cache(self) -> None:
+        """Test that a cache without a shared SurfaceCache creates its own."""
+        cache = NamespacedCache()
+        self.assertEqual(len(cache), 0)
@@ -0,0 +1,174 @@
+"""Test asynchronous delivery of events with the AsyncSubscriber class and the
+EventPublisher.subscribe_async() method."""
+
+import threading
+import unittest
+import unittest.mock
+
+import pypinball
+from pypinball.events import AsyncSubscriber, GameEvents, OverflowPolicy
+
+
+class BlockingCallback:
+    """Callback that records events, and waits on a gate before returning."""
+
+    def __init__(self) -> None:
+        self.events = list()
+        self.gate = threading.Event()
+        self.gate.set()
+        self.started = threading.Event()
+
+    def __call__(self, event: GameEvents) -> None:
+        self.started.set()
+        self.gate.wait(timeout=5.0)
+        self.events.append(event)
+
+
+class TestAsyncSubscriber(unittest.TestCase):
+    """Test the AsyncSubscriber class."""
+
+    def setUp(self) -> None:
+        self.callback = BlockingCallback()
+
+    def create(self, policy: OverflowPolicy) -> AsyncSubscriber:
+        """Create a subscriber whose worker is blocked delivering a first event."""
+        self.callback.gate.clear()
+        subscriber = AsyncSubscriber(
+            callback=self.callback, max_queue_size=3, policy=policy
+        )
+        self.addCleanup(subscriber.close)
+        self.addCleanup(self.callback.gate.set)
+        subscriber.put(GameEvents.GAME_STARTED)
+        self.assertTrue(self.callback.started.wait(timeout=5.0))
+        return subscriber
+
+    def deliver(self, subscriber: AsyncSubscriber) -> None:
+        """Unblock the worker and wait for the queue to be delivered."""
+        self.callback.gate.set()
+        self.assertTrue(subscriber.flush(timeout=5.0))
+
+    def test_put_does_not_block(self) -> None:
+        """Test that events are queued while the callback is busy, and then delivered
+        in order."""
+        subscriber = self.create(policy=OverflowPolicy.DROP_OLDEST)
+        events = [GameEvents.BALL_LAUNCHED, GameEvents.LIFE_LOST]
+        for event in events:
+            self.assertTrue(subscriber.put(event))
+        self.assertEqual(subscriber.stats.depth, 2)
+        self.deliver(subscriber)
+
+        self.assertListEqual(self.callback.events, [GameEvents.GAME_STARTED] + events)
+        self.assertEqual(subscriber.stats.delivered, 3)
+        self.assertEqual(subscriber.stats.depth, 0)
+        self.assertEqual(subscriber.stats.max_depth, 2)
+
+    def test_drop_oldest(self) -> None:
+        """Test that the oldest queued event is dropped when the queue is full."""
+        subscriber = self.create(policy=OverflowPolicy.DROP_OLDEST)
+        events = [
+            GameEvents.BALL_LAUNCHED,
+            GameEvents.BALL_LOST,
+            GameEvents.LIFE_LOST,
+            GameEvents.GAME_OVER,
+        ]
+        for event in events:
+            subscriber.put(event)
+        self.deliver(subscriber)
+
+        self.assertListEqual(self.callback.events[1:], events[1:])
+        self.assertEqual(subscriber.stats.dropped, 1)
+
+    def test_drop_newest(self) -> None:
+        """Test that a new event is dropped when the queue is full."""
+        subscriber = self.create(policy=OverflowPolicy.DROP_NEWEST)
+        events = [
+            GameEvents.BALL_LAUNCHED,
+            GameEvents.BALL_LOST,
+            GameEvents.LIFE_LOST,
+            GameEvents.GAME_OVER,
+        ]
+        results = [subscriber.put(event) for event in events]
+        self.deliver(subscriber)
+
+        self.assertListEqual(results, [True, True, True, False])
+        self.assertListEqual(self.callback.events[1:], events[:3])
+        self.assertEqual(subscriber.stats.dropped, 1)
+
+    def test_coalesce(self) -> None:
+        """Test that an event equal to one already queued is coalesced."""
+        subscriber = self.create(policy=OverflowPolicy.COALESCE)
+        for _ in range(5):
+            subscriber.put(GameEvents.COLLISION_BALL_WALL)
+        subscriber.put(GameEvents.BALL_LOST)
+        self.deliver(subscriber)
+
+        self.assertListEqual(
+            self.callback.events[1:],
+            [GameEvents.COLLISION_BALL_WALL, GameEvents.BALL_LOST],
+        )
+        self.assertEqual(subscriber.stats.coalesced, 4)
+
+    def test_failing_callback(self) -> None:
+        """Test that a callback raising an exception does not stop delivery."""
+        callback = unittest.mock.MagicMock(side_effect=[RuntimeError("foo"), None])
+        subscriber = AsyncSubscriber(callback=callback)
+        self.addCleanup(subscriber.close)
+        subscriber.put(GameEvents.BALL_LOST)
+        subscriber.put(GameEvents.LIFE_LOST)
+        self.assertTrue(subscriber.flush(timeout=5.0))
+        self.assertEqual(subscriber.stats.failed, 1)
+        self.assertEqual(subscriber.stats.delivered, 1)
+
+
+class TestPublisherAsyncSubscribers(unittest.TestCase):
+    """Test subscribing to a GameEventPublisher asynchronously."""
+
+    def setUp(self) -> None:
+        self.publisher = pypinball.events.GameEventPublisher()
+        self.addCleanup(self.publisher.close)
+
+    def test_sync_and_async_subscribers(self) -> None:
+        """Test that synchronous subscribers are called within emit(), while
+        asynchronous subscribers are called on a worker thread."""
+        sync_threads = list()
+        async_threads = list()
+        self.publisher.subscribe(lambda _: sync_threads.append(threading.get_ident()))
+        self.publisher.subscribe_async(
+            lambda _: async_threads.append(threading.get_ident())
+        )
+        self.assertEqual(self.publisher.num_subscribers, 2)
+
+        self.publisher.emit(GameEvents.GAME_STARTED)
+        self.assertListEqual(sync_threads, [threading.get_ident()])
+        self.assertTrue(self.publisher.flush(timeout=5.0))
+        self.assertEqual(len(async_threads), 1)
+        self.assertNotEqual(async_threads[0], threading.get_ident())
+
+    def test_subscribe_same_callback_twice(self) -> None:
+        """Test that a callback can't be subscribed both synchronously and
+        asynchronously."""
+        callback = unittest.mock.MagicMock()
+        self.assertTrue(self.publisher.subscribe_async(callback))
+        self.assertFalse(self.publisher.subscribe(callback))
+        self.assertFalse(self.publisher.subscribe_async(callback))
+
+    def test_subscriber_stats(self) -> None:
+        """Test getting the statistics of each asynchronous subscriber."""
+        callback = unittest.mock.MagicMock()
+        self.publisher.subscribe_async(callback)
+        for _ in range(3):
+            self.publisher.emit(GameEvents.COLLISION_BALL_BUMPER)
+        self.publisher.flush(timeout=5.0)
+        stats = self.publisher.get_subscriber_stats()
+        self.assertEqual(list(stats.keys()), [callback])
+        self.assertEqual(stats[callback].delivered, 3)
+
+    def test_unsubscribe_async(self) -> None:
+        """Test that an asynchronous subscriber is no longer called after it has
+        unsubscribed."""
+        callback = unittest.mock.MagicMock()
+        self.publisher.subscribe_async(callback)
+        self.assertTrue(self.publisher.unsubscribe(callback))
+        self.assertEqual(self.publisher.num_subscribers, 0)
+        self.publisher.emit(GameEvents.GAME_STARTED)
+        callback.assert_not_called()
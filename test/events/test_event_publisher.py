@@ -45,3 +45,59 @@ class TestEventPublisherInit(unittest.TestCase):
         self.publisher.subscribe(self.callback)
         self.publisher.emit(event=event)
         self.callback.assert_called_once_with(event)
+
+
+class TestEventPublisherBatch(unittest.TestCase):
+    """Test delivering batches of events to batch subscribers."""
+
+    def setUp(self) -> None:
+        self.callback = unittest.mock.MagicMock()
+        self.batch_callback = unittest.mock.MagicMock()
+        self.publisher = pypinball.events.GameEventPublisher()
+        self.publisher.subscribe(self.callback)
+        self.publisher.subscribe_batch(self.batch_callback)
+
+    def test_num_subscribers(self):
+        """Test that batch subscribers are counted."""
+        self.assertEqual(self.publisher.num_subscribers, 2)
+        self.assertFalse(self.publisher.subscribe(self.batch_callback))
+        self.assertFalse(self.publisher.subscribe_batch(self.batch_callback))
+
+    def test_emit_outside_batch(self):
+        """Test that an event emitted outside of a batch is delivered straight away."""
+        event = pypinball.events.GameEvents.GAME_STARTED
+        self.publisher.emit(event=event)
+        self.batch_callback.assert_called_once_with([event])
+
+    def test_emit_in_batch(self):
+        """Test that events emitted in a batch are delivered as one list when the
+        outermost batch is closed, while other subscribers get them straight away."""
+        events = [
+            pypinball.events.GameEvents.COLLISION_BALL_WALL,
+            pypinball.events.GameEvents.COLLISION_BALL_BUMPER,
+            pypinball.events.GameEvents.COLLISION_BALL_WALL,
+        ]
+        with self.publisher.batch():
+            with self.publisher.batch():
+                for event in events:
+                    self.publisher.emit(event=event)
+            self.assertEqual(self.callback.call_count, 3)
+            self.batch_callback.assert_not_called()
+        self.batch_callback.assert_called_once_with(events)
+
+    def test_empty_batch(self):
+        """Test that nothing is delivered for a batch without any events."""
+        with self.publisher.batch():
+            pass
+        self.batch_callback.assert_not_called()
+
+    def test_unbalanced_end_batch(self):
+        """Test that closing a batch that wasn't opened throws a RuntimeError."""
+        with self.assertRaises(RuntimeError):
+            self.publisher.end_batch()
+
+    def test_unsubscribe_batch(self):
+        """Test that a batch subscriber can unsubscribe."""
+        self.assertTrue(self.publisher.unsubscribe(self.batch_callback))
+        self.publisher.emit(event=pypinball.events.GameEvents.GAME_STARTED)
+        self.batch_callback.assert_not_called()
@@ -94,6 +94,51 @@ class TestRemoveBall(unittest.TestCase):
             self.physics.get_ball_state(uid=10)
 
 
+class TestBallStateArrays(unittest.TestCase):
+    """
+    Test the get_ball_state_arrays() method in the PymunkPhysics class.
+    """
+
+    def setUp(self) -> None:
+        self.event_pub = pypinball.events.GameEventPublisher()
+        self.physics = pypinball.physics.PymunkPhysics(
+            event_pub=self.event_pub, fps=60.0
+        )
+        for uid in range(40):
+            ball = pypinball.domain.Ball(uid=uid, position=(uid, 2.0 * uid), radius=5)
+            self.physics.add_ball(ball=ball)
+
+    def test_array_shapes(self) -> None:
+        """Test that there is a row in each array for every ball."""
+        res = self.physics.get_ball_state_arrays()
+        self.assertEqual(len(res), 40)
+        self.assertTupleEqual(res.positions.shape, (40, 2))
+        self.assertTupleEqual(res.velocities.shape, (40, 2))
+        self.assertTupleEqual(res.radii.shape, (40,))
+
+    def test_matches_ball_states(self) -> None:
+        """Test that the arrays match the values from get_ball_states()."""
+        res = self.physics.get_ball_state_arrays()
+        for i, state in enumerate(self.physics.get_ball_states()):
+            self.assertEqual(res.uids[i], state.uid)
+            self.assertEqual(res.radii[i], state.radius)
+            self.assertTrue(numpy.allclose(res.positions[i], state.position))
+
+    def test_remove_ball(self) -> None:
+        """Test that removed balls are no longer present in the arrays."""
+        self.physics.get_ball_state_arrays()
+        self.physics.remove_ball(uid=10)
+        res = self.physics.get_ball_state_arrays()
+        self.assertEqual(len(res), 39)
+        self.assertNotIn(10, res.uids.tolist())
+
+    def test_velocities_updated(self) -> None:
+        """Test that the velocities are updated as the balls fall under gravity."""
+        self.physics.update()
+        res = self.physics.get_ball_state_arrays()
+        self.assertTrue(numpy.all(res.velocities[:, 1] > 0.0))
+
+
 class TestBallLaunch(unittest.TestCase):
     """
     Test the general functionality of launching a ball via the PymunkPhysics class.
@@ -85,3 +85,33 @@ class TestBumper(unittest.TestCase):
 
     def test_get_bumper_states_unknown(self) -> None:
         self.assertEqual(len(self.physics.get_bumper_states()), 0)
+
+    def test_bumper_revision(self):
+        """
+        Test that the bumper revision only changes when a bumper is added or removed.
+        """
+        revision = self.physics.get_bumper_revision()
+        bumper = pypinball.domain.RoundBumper(uid=0, position=(50, 100), radius=15.0)
+        self.physics.add_bumper(bumper=bumper)
+        added_revision = self.physics.get_bumper_revision()
+        self.assertNotEqual(added_revision, revision)
+
+        self.physics.add_bumper(bumper=bumper)
+        self.physics.update()
+        self.assertEqual(self.physics.get_bumper_revision(), added_revision)
+
+        self.physics.remove_bumper(uid=bumper.uid)
+        self.assertNotIn(self.physics.get_bumper_revision(), [revision, added_revision])
+
+    def test_unsupported_bumper_type(self) -> None:
+        """
+        Test that getting the half-width of an unsupported bumper type raises an
+        exception.
+        """
+        bumper = pypinball.domain.Bumper(
+            uid=0,
+            position=(50, 100),
+            bumper_type=pypinball.domain.BumperType.ROUND,
+        )
+        with self.assertRaises(TypeError):
+            pypinball.physics.pymunk_physics.get_bumper_half_width(bumper=bumper)
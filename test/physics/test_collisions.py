@@ -0,0 +1,61 @@
+import unittest
+import unittest.mock
+
+import pypinball
+
+
+class TestCollisionEvents(unittest.TestCase):
+    """
+    Test that the PymunkPhysics class emits Collision events identifying the objects
+    that a ball has collided with.
+    """
+
+    def setUp(self) -> None:
+        self.event_pub = pypinball.events.GameEventPublisher()
+        self.physics = pypinball.physics.PymunkPhysics(
+            event_pub=self.event_pub, fps=60.0
+        )
+        self.callback = unittest.mock.MagicMock()
+        self.physics.collision_events.subscribe(callback=self.callback)
+
+        self.physics.add_ball(
+            ball=pypinball.domain.Ball(uid=7, position=(50.0, 50.0), radius=10)
+        )
+
+    def step(self, num_steps: int = 100) -> None:
+        """Step the physics simulation forward."""
+        for _ in range(num_steps):
+            self.physics.update()
+
+    def test_ball_bumper_collision(self) -> None:
+        """Test the collision event contains the UIDs of the ball and bumper."""
+        self.physics.add_bumper(
+            bumper=pypinball.domain.RoundBumper(uid=3, position=(50, 150), radius=10)
+        )
+        self.step()
+        self.callback.assert_any_call(
+            pypinball.physics.Collision(
+                ball_uid=7, entity=pypinball.physics.CollisionEntity.BUMPER, uid=3
+            )
+        )
+
+    def test_ball_wall_collision(self) -> None:
+        """Test the collision event contains the UIDs of the ball and wall."""
+        self.physics.add_wall(
+            wall=pypinball.domain.Wall(uid=11, points=[(0.0, 150.0), (100.0, 150.0)])
+        )
+        self.step()
+        self.callback.assert_any_call(
+            pypinball.physics.Collision(
+                ball_uid=7, entity=pypinball.physics.CollisionEntity.WALL, uid=11
+            )
+        )
+
+    def test_removed_bumper_has_no_collision(self) -> None:
+        """Test that a removed bumper no longer produces collision events."""
+        self.physics.add_bumper(
+            bumper=pypinball.domain.RoundBumper(uid=3, position=(50, 150), radius=10)
+        )
+        self.physics.remove_bumper(uid=3)
+        self.step()
+        self.callback.assert_not_called()
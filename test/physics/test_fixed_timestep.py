@@ -0,0 +1,75 @@
+import unittest
+
+import numpy
+
+import pypinball
+
+
+class TestFixedTimestep(unittest.TestCase):
+    """
+    Test the fixed timestep accumulator in the PymunkPhysics class.
+    """
+
+    def setUp(self) -> None:
+        self.event_pub = pypinball.events.GameEventPublisher()
+
+    def create_physics(self, **kwargs) -> pypinball.physics.PymunkPhysics:
+        """Create a physics instance with a single ball in it."""
+        physics = pypinball.physics.PymunkPhysics(
+            event_pub=self.event_pub, fps=60.0, **kwargs
+        )
+        physics.add_ball(ball=pypinball.domain.Ball(uid=0, position=(50.0, 50.0)))
+        return physics
+
+    def test_default_steps_per_update(self) -> None:
+        """Test that an update at 60fps runs five 300Hz physics steps."""
+        physics = self.create_physics()
+        physics.update()
+        self.assertEqual(physics.step_count, 5)
+
+    def test_many_updates_do_not_drift(self) -> None:
+        """Test that floating point error does not drop steps over many updates."""
+        physics = self.create_physics(physics_hz=240.0)
+        for _ in range(600):
+            physics.update()
+        self.assertEqual(physics.step_count, 2400)
+
+    def test_render_faster_than_physics(self) -> None:
+        """Test that time smaller than a step is accumulated between updates."""
+        physics = self.create_physics(physics_hz=60.0)
+        physics.update(delta_time=1.0 / 240.0)
+        self.assertEqual(physics.step_count, 0)
+        self.assertAlmostEqual(physics.get_interpolation_alpha(), 0.25)
+
+        for _ in range(3):
+            physics.update(delta_time=1.0 / 240.0)
+        self.assertEqual(physics.step_count, 1)
+        self.assertAlmostEqual(physics.get_interpolation_alpha(), 0.0)
+
+    def test_max_steps_per_update(self) -> None:
+        """Test that a long frame is limited to the maximum number of steps."""
+        physics = self.create_physics(max_steps_per_update=10)
+        physics.update(delta_time=10.0)
+        self.assertEqual(physics.step_count, 10)
+        self.assertLess(physics.get_interpolation_alpha(), 1.0)
+
+    def test_gameplay_speed_independent_of_physics_rate(self) -> None:
+        """Test that a ball falls the same distance regardless of the physics rate."""
+        fast = self.create_physics(physics_hz=600.0)
+        slow = self.create_physics(physics_hz=120.0)
+        for _ in range(30):
+            fast.update()
+            slow.update()
+        fast_pos = fast.get_ball_state(uid=0).position
+        slow_pos = slow.get_ball_state(uid=0).position
+        self.assertTrue(numpy.allclose(fast_pos, slow_pos, atol=2.0))
+
+    def test_previous_positions(self) -> None:
+        """Test the previous positions are the ball positions before the last step."""
+        physics = self.create_physics()
+        physics.update()
+        before = physics.get_ball_state_arrays().positions.copy()
+        physics.update()
+        res = physics.get_ball_state_arrays()
+        self.assertTrue(numpy.all(res.previous_positions[:, 1] > before[:, 1]))
+        self.assertTrue(numpy.all(res.previous_positions[:, 1] < res.positions[:, 1]))
@@ -0,0 +1,45 @@
+import typing
+import unittest
+
+import pypinball
+
+
+class TestSeededLaunch(unittest.TestCase):
+    """
+    Test that the ball launch force is drawn from the seeded random number generator
+    owned by the PymunkPhysics class.
+    """
+
+    def setUp(self) -> None:
+        self.event_pub = pypinball.events.GameEventPublisher()
+
+    def launch(self, seed: int) -> typing.List[float]:
+        """Launch three balls and return their vertical velocities after an update."""
+        physics = pypinball.physics.PymunkPhysics(
+            event_pub=self.event_pub, fps=60.0, seed=seed
+        )
+        for uid in range(3):
+            physics.add_ball(
+                ball=pypinball.domain.Ball(uid=uid, position=(50.0 + 50.0 * uid, 300.0))
+            )
+            physics.launch_ball(uid=uid)
+        physics.update()
+        return physics.get_ball_state_arrays().velocities[:, 1].tolist()
+
+    def test_same_seed(self) -> None:
+        """Test that the same seed gives the same launch velocities."""
+        self.assertEqual(self.launch(seed=42), self.launch(seed=42))
+
+    def test_different_seed(self) -> None:
+        """Test that a different seed gives different launch velocities."""
+        self.assertNotEqual(self.launch(seed=1), self.launch(seed=2))
+
+    def test_seed_property(self) -> None:
+        """Test that the seed is available, including when one is picked at random."""
+        physics = pypinball.physics.PymunkPhysics(
+            event_pub=self.event_pub, fps=60.0, seed=7
+        )
+        self.assertEqual(physics.seed, 7)
+
+        physics = pypinball.physics.PymunkPhysics(event_pub=self.event_pub, fps=60.0)
+        self.assertIsInstance(physics.seed, int)
@@ -0,0 +1,127 @@
+import unittest
+
+import numpy
+
+import pypinball
+
+
+class TestSnapshot(unittest.TestCase):
+    """
+    Test capturing and restoring the state of the PymunkPhysics class.
+    """
+
+    def setUp(self) -> None:
+        self.event_pub = pypinball.events.GameEventPublisher()
+        self.physics = pypinball.simulation.create_headless_physics(
+            config=pypinball.config.DEFAULT_GAME_CONFIG,
+            event_pub=self.event_pub,
+            seed=1,
+        )
+        for bumper in pypinball.config.DEFAULT_GAME_CONFIG.bumpers:
+            self.physics.add_bumper(bumper=bumper)
+        for flipper in pypinball.config.DEFAULT_GAME_CONFIG.flippers:
+            self.physics.add_flipper(flipper=flipper)
+        for wall in pypinball.config.DEFAULT_GAME_CONFIG.walls:
+            self.physics.add_wall(wall=wall)
+        self.physics.add_ball(ball=pypinball.domain.Ball(uid=0, position=(200, 400)))
+        self.physics.add_ball(ball=pypinball.domain.Ball(uid=1, position=(300, 300)))
+        self.physics.launch_ball(uid=0)
+        for _ in range(10):
+            self.physics.update()
+
+    def get_state(self) -> numpy.ndarray:
+        """Get the positions and velocities of all the balls and flipper angles."""
+        arrays = self.physics.get_ball_state_arrays()
+        flippers = [f.angle for f in self.physics.get_flipper_states()]
+        return numpy.concatenate(
+            [arrays.positions.ravel(), arrays.velocities.ravel(), flippers]
+        )
+
+    def test_restore(self) -> None:
+        """Test that restoring a snapshot returns the balls to their previous state."""
+        data = self.physics.snapshot()
+        expected = self.get_state()
+        step_count = self.physics.step_count
+
+        for _ in range(10):
+            self.physics.update()
+        self.assertFalse(numpy.allclose(self.get_state(), expected))
+
+        self.physics.restore(data=data)
+        numpy.testing.assert_array_equal(self.get_state(), expected)
+        self.assertEqual(self.physics.step_count, step_count)
+
+    def test_branches_match(self) -> None:
+        """Test that two branches restored from the same snapshot match, including
+        a ball being launched with a random force."""
+        data = self.physics.snapshot()
+
+        branches = list()
+        for _ in range(2):
+            self.physics.restore(data=data)
+            self.physics.launch_ball(uid=1)
+            self.physics.actuate_flipper(uid=1)
+            for _ in range(30):
+                self.physics.update()
+            branches.append(self.get_state())
+
+        numpy.testing.assert_array_equal(branches[0], branches[1])
+
+    def test_restore_balls_and_bumpers(self) -> None:
+        """Test that balls and bumpers added or removed after the snapshot are
+        returned to the snapshot state."""
+        data = self.physics.snapshot()
+        self.physics.remove_ball(uid=0)
+        self.physics.add_ball(ball=pypinball.domain.Ball(uid=5, position=(100, 100)))
+        self.physics.remove_bumper(uid=1002)
+
+        self.physics.restore(data=data)
+        self.assertEqual(self.physics.get_ball_state_arrays().uids.tolist(), [0, 1])
+        self.assertEqual(
+            sorted(b.uid for b in self.physics.get_bumper_states()),
+            [1000, 1001, 1002, 1003],
+        )
+        self.assertEqual(self.physics.get_bumper_state(uid=1002).radius, 15)
+
+    def test_restore_bumper_collision_margin(self) -> None:
+        """Test that restoring a thin bumper updates the collision margin used for
+        sub-stepping in the same way as adding it."""
+        self.physics.add_bumper(
+            bumper=pypinball.domain.RectangleBumper(
+                uid=2000, position=(200, 200), size=(40, 2), angle=0.0
+            )
+        )
+        data = self.physics.snapshot()
+
+        other = pypinball.simulation.create_headless_physics(
+            config=pypinball.config.DEFAULT_GAME_CONFIG, event_pub=self.event_pub
+        )
+        for flipper in pypinball.config.DEFAULT_GAME_CONFIG.flippers:
+            other.add_flipper(flipper=flipper)
+        other.restore(data=data)
+        self.assertEqual(
+            other._get_collision_margin(),  # pylint: disable=protected-access
+            self.physics._get_collision_margin(),  # pylint: disable=protected-access
+        )
+
+    def test_compact(self) -> None:
+        """Test that the snapshot size only grows by a fixed record size per ball."""
+        size = len(self.physics.snapshot())
+        self.physics.add_ball(ball=pypinball.domain.Ball(uid=5, position=(100, 100)))
+        self.assertEqual(
+            len(self.physics.snapshot()) - size,
+            pypinball.physics.snapshot.BALL_DTYPE.itemsize,
+        )
+
+    def test_invalid_data(self) -> None:
+        """Test that restoring invalid data raises a ValueError."""
+        with self.assertRaises(ValueError):
+            self.physics.restore(data=b"not a snapshot")
+        with self.assertRaises(ValueError):
+            self.physics.restore(data=b"XXXX" + self.physics.snapshot()[4:])
+
+    def test_mismatched_flippers(self) -> None:
+        """Test that restoring a snapshot from a different table raises a ValueError."""
+        other = pypinball.physics.PymunkPhysics(event_pub=self.event_pub, fps=60.0)
+        with self.assertRaises(ValueError):
+            other.restore(data=self.physics.snapshot())
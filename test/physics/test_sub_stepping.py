@@ -0,0 +1,94 @@
+import unittest
+
+import pypinball
+
+
+class TestAdaptiveSubStepping(unittest.TestCase):
+    """
+    Test the AdaptiveSubStepping policy class.
+    """
+
+    def setUp(self) -> None:
+        self.policy = pypinball.physics.AdaptiveSubStepping(
+            min_sub_steps=1, max_sub_steps=8, max_travel_fraction=0.5
+        )
+
+    def test_at_rest_uses_min_sub_steps(self) -> None:
+        """Test that an object at rest only needs the minimum number of sub-steps."""
+        res = self.policy.get_num_sub_steps(
+            max_speed=0.0, step_time=0.01, collision_margin=10.0
+        )
+        self.assertEqual(res, 1)
+
+    def test_fast_object_uses_more_sub_steps(self) -> None:
+        """Test that the number of sub-steps keeps the travel below half the margin."""
+        res = self.policy.get_num_sub_steps(
+            max_speed=2000.0, step_time=0.01, collision_margin=10.0
+        )
+        self.assertEqual(res, 4)
+
+    def test_max_sub_steps_bound(self) -> None:
+        """Test that the number of sub-steps is limited and counted as saturated."""
+        res = self.policy.get_num_sub_steps(
+            max_speed=1e6, step_time=0.01, collision_margin=10.0
+        )
+        self.assertEqual(res, 8)
+        self.assertEqual(self.policy.stats.saturated_steps, 1)
+
+    def test_no_colliders(self) -> None:
+        """Test that an infinite margin (i.e. nothing to collide with) uses the minimum."""
+        res = self.policy.get_num_sub_steps(
+            max_speed=1e6, step_time=0.01, collision_margin=float("inf")
+        )
+        self.assertEqual(res, 1)
+
+    def test_stats(self) -> None:
+        """Test the counters are updated on each call."""
+        self.policy.get_num_sub_steps(
+            max_speed=0.0, step_time=0.01, collision_margin=10.0
+        )
+        self.policy.get_num_sub_steps(
+            max_speed=2000.0, step_time=0.01, collision_margin=10.0
+        )
+        stats = self.policy.stats
+        self.assertEqual(stats.steps, 2)
+        self.assertEqual(stats.sub_steps, 5)
+        self.assertEqual(stats.last_sub_steps, 4)
+        self.assertEqual(stats.peak_sub_steps, 4)
+        self.assertAlmostEqual(stats.mean_sub_steps, 2.5)
+
+    def test_invalid_bounds(self) -> None:
+        """Test that invalid bounds raise a ValueError."""
+        with self.assertRaises(ValueError):
+            pypinball.physics.AdaptiveSubStepping(min_sub_steps=0)
+        with self.assertRaises(ValueError):
+            pypinball.physics.AdaptiveSubStepping(min_sub_steps=4, max_sub_steps=2)
+
+
+class TestFastBallDoesNotTunnel(unittest.TestCase):
+    """
+    Test that a small, fast moving ball does not pass through a thin wall.
+    """
+
+    def setUp(self) -> None:
+        self.event_pub = pypinball.events.GameEventPublisher()
+        self.physics = pypinball.physics.PymunkPhysics(
+            event_pub=self.event_pub, fps=60.0
+        )
+        self.physics.add_wall(
+            wall=pypinball.domain.Wall(uid=1, points=[(0.0, 100.0), (500.0, 100.0)])
+        )
+        ball = pypinball.domain.Ball(uid=0, position=(250.0, 400.0), radius=3)
+        self.physics.add_ball(ball=ball)
+        self.physics.launch_ball(uid=ball.uid)
+
+        for _ in range(30):
+            self.physics.update()
+
+    def test_ball_bounced_off_wall(self) -> None:
+        """Test that the ball is still below the wall."""
+        self.assertGreater(self.physics.get_ball_state(uid=0).position[1], 100.0)
+
+    def test_sub_steps_used(self) -> None:
+        """Test that more than one sub-step was used while the ball was moving fast."""
+        self.assertGreater(self.physics.sub_step_stats.peak_sub_steps, 1)
@@ -0,0 +1,112 @@
+"""Test building and loading asset bundles with the bundle.py module."""
+
+import os
+import tempfile
+import unittest
+import wave
+
+import pygame
+
+import pypinball
+from pypinball.resources import AssetBundle, build_bundle
+
+
+def create_wav(path: str, num_frames: int) -> bytes:
+    """Save a mono 16-bit WAV file and return its frame data."""
+    frames = b"".join(i.to_bytes(2, "little", signed=True) for i in range(num_frames))
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(8000)
+        wav.writeframes(frames)
+    return frames
+
+
+class TestAssetBundle(unittest.TestCase):
+    """Test a bundle built from some image and audio files."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.image = pygame.Surface(size=(5, 3), flags=pygame.SRCALPHA)
+        self.image.fill((10, 20, 30, 128))
+        self.image.set_at((4, 2), (255, 0, 0, 255))
+        image_path = os.path.join(self.tmp_dir.name, "image.png")
+        pygame.image.save(self.image, image_path)
+
+        audio_path = os.path.join(self.tmp_dir.name, "sound.wav")
+        self.frames = create_wav(path=audio_path, num_frames=101)
+
+        self.path = os.path.join(self.tmp_dir.name, "assets.bundle")
+        self.entries = build_bundle(
+            output_path=self.path, image_paths=[image_path], audio_paths=[audio_path]
+        )
+        self.bundle = AssetBundle(path=self.path)
+
+    def tearDown(self) -> None:
+        del self.bundle
+        self.tmp_dir.cleanup()
+
+    def test_names(self) -> None:
+        """Test that the assets are named by their file name."""
+        self.assertListEqual(self.bundle.names(), ["image.png", "sound.wav"])
+        self.assertIn("image.png", self.bundle)
+        self.assertNotIn("foo.png", self.bundle)
+
+    def test_data_is_aligned(self) -> None:
+        """Test that the data of each entry is aligned."""
+        for entry in self.entries:
+            self.assertEqual(
+                entry.offset % pypinball.resources.bundle.BUNDLE_ALIGNMENT, 0
+            )
+
+    def test_get_image(self) -> None:
+        """Test that an image from the bundle has the same pixels as the original."""
+        result = self.bundle.get_image(name="image.png")
+        self.assertEqual(result.get_size(), self.image.get_size())
+        self.assertEqual(
+            pygame.image.tobytes(result, "RGBA"),
+            pygame.image.tobytes(self.image, "RGBA"),
+        )
+
+    def test_get_audio_segment(self) -> None:
+        """Test that a sound from the bundle has the same data as the original."""
+        result = self.bundle.get_audio_segment(name="sound.wav")
+        self.assertEqual(result.raw_data, self.frames)
+        self.assertEqual(result.channels, 1)
+        self.assertEqual(result.sample_width, 2)
+        self.assertEqual(result.frame_rate, 8000)
+
+    def test_close_with_image_in_use(self) -> None:
+        """Test that closing the bundle while an image from it is in use throws a
+        BufferError, and that it can be closed once the image is dropped."""
+        image = self.bundle.get_image(name="image.png")
+        with self.assertRaises(BufferError):
+            self.bundle.close()
+        self.assertEqual(image.get_size(), self.image.get_size())
+
+        del image
+        self.bundle.close()
+
+    def test_get_wrong_kind(self) -> None:
+        """Test that getting an asset as the wrong type throws a KeyError."""
+        with self.assertRaises(KeyError):
+            self.bundle.get_image(name="sound.wav")
+        with self.assertRaises(KeyError):
+            self.bundle.get_audio_segment(name="image.png")
+
+    def test_duplicate_names(self) -> None:
+        """Test that building a bundle with two assets with the same name throws a
+        ValueError."""
+        path = os.path.join(self.tmp_dir.name, "image.png")
+        with self.assertRaises(ValueError):
+            build_bundle(
+                output_path=self.path, image_paths=[path, path], audio_paths=[]
+            )
+
+    def test_invalid_file(self) -> None:
+        """Test that loading a file that is not a bundle throws a ValueError."""
+        path = os.path.join(self.tmp_dir.name, "not_a.bundle")
+        with open(path, "wb") as file:
+            file.write(b"foobar" * 10)
+        with self.assertRaises(ValueError):
+            AssetBundle(path=path)
@@ -0,0 +1,87 @@
+"""Test the AssetLoader class in the asset_loader.py module."""
+
+import threading
+import time
+import unittest
+
+import pypinball
+from pypinball.asset_loader import AssetLoader, AssetTiming, format_timing_report
+
+
+class TestAssetLoader(unittest.TestCase):
+    """Test loading assets with the AssetLoader class."""
+
+    def setUp(self) -> None:
+        self.loader = AssetLoader(max_workers=4)
+
+    def tearDown(self) -> None:
+        self.loader.shutdown()
+
+    def test_submit_returns_result(self) -> None:
+        """Test that the future returned by submit() has the loaded value."""
+        future = self.loader.submit("sum", sum, [1, 2, 3])
+        self.assertEqual(future.result(), 6)
+
+    def test_assets_loaded_concurrently(self) -> None:
+        """Test that assets are loaded at the same time in different threads."""
+        barrier = threading.Barrier(parties=3, timeout=5.0)
+        futures = [self.loader.submit(f"asset_{i}", barrier.wait) for i in range(3)]
+        for future in futures:
+            future.result()
+        threads = {t.thread for t in self.loader.get_timings()}
+        self.assertEqual(len(threads), 3)
+
+    def test_timings(self) -> None:
+        """Test that a timing is recorded for each asset, including those that fail."""
+        self.loader.submit("slow", time.sleep, 0.05)
+
+        def _fail() -> None:
+            raise FileNotFoundError("foo")
+
+        failed = self.loader.submit("failed", _fail)
+        self.assertTrue(self.loader.wait(timeout=5.0))
+        with self.assertRaises(FileNotFoundError):
+            failed.result()
+
+        timings = {t.name: t for t in self.loader.get_timings()}
+        self.assertSetEqual(set(timings.keys()), {"slow", "failed"})
+        self.assertGreaterEqual(timings["slow"].duration, 0.05)
+        self.assertIn("slow", self.loader.format_report())
+
+    def test_on_all_done(self) -> None:
+        """Test that the on_all_done() callback is called once all assets have loaded."""
+        event = threading.Event()
+        self.loader.submit("a", time.sleep, 0.02)
+        self.loader.submit("b", time.sleep, 0.01)
+        calls = list()
+
+        def _callback() -> None:
+            calls.append(len(self.loader.get_timings()))
+            event.set()
+
+        self.loader.on_all_done(callback=_callback)
+        self.assertTrue(event.wait(timeout=5.0))
+        self.assertEqual(calls, [2])
+
+    def test_on_all_done_with_nothing_pending(self) -> None:
+        """Test that the on_all_done() callback is called straight away if nothing is
+        loading."""
+        calls = list()
+        self.loader.on_all_done(callback=lambda: calls.append(True))
+        self.assertEqual(calls, [True])
+
+
+class TestFormatTimingReport(unittest.TestCase):
+    """Test the format_timing_report() method."""
+
+    def test_report(self) -> None:
+        """Test that the report lists the slowest asset first, with the totals."""
+        timings = [
+            AssetTiming(name="fast.png", start=0.0, duration=0.01, thread="t0"),
+            AssetTiming(name="slow.mp3", start=0.0, duration=0.2, thread="t1"),
+        ]
+        lines = format_timing_report(timings=timings).splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertIn("slow.mp3", lines[1])
+        self.assertIn("fast.png", lines[2])
+        self.assertIn("Total load time: 210.0 ms, wall time: 200.0 ms", lines[3])
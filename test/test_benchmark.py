@@ -0,0 +1,140 @@
+import os
+import tempfile
+import unittest
+
+import pypinball
+from pypinball.benchmark import (
+    Benchmark,
+    BenchmarkResult,
+    compare_reports,
+    create_report,
+    get_benchmarks,
+    load_report,
+    run_benchmark,
+    save_report,
+)
+
+
+class MockClock:
+    """Clock that advances by a fixed number of nanoseconds on each call."""
+
+    def __init__(self, step_ns: int) -> None:
+        self.now = 0
+        self.step_ns = step_ns
+
+    def __call__(self) -> int:
+        self.now += self.step_ns
+        return self.now
+
+
+def make_result(name: str, median: float) -> BenchmarkResult:
+    """Create a benchmark result with the given median time."""
+    return BenchmarkResult(
+        name=name,
+        iterations=1,
+        repeats=1,
+        min=median,
+        median=median,
+        mean=median,
+        stdev=0.0,
+    )
+
+
+class TestRunBenchmark(unittest.TestCase):
+    """Test the run_benchmark() method."""
+
+    def setUp(self) -> None:
+        self.num_setups = 0
+        self.num_calls = 0
+
+        def _setup():
+            self.num_setups += 1
+
+            def _fn() -> None:
+                self.num_calls += 1
+
+            return _fn
+
+        self.benchmark = Benchmark(name="test", setup=_setup, iterations=10)
+        self.result = run_benchmark(
+            benchmark=self.benchmark,
+            repeats=3,
+            warmup=1,
+            clock=MockClock(step_ns=1000),
+        )
+
+    def test_setup_per_repeat(self) -> None:
+        """Test that fresh state is created for the warmup and each repeat."""
+        self.assertEqual(self.num_setups, 4)
+        self.assertEqual(self.num_calls, 40)
+
+    def test_times(self) -> None:
+        """Test that the times are per call, excluding the warmup."""
+        self.assertEqual(self.result.repeats, 3)
+        self.assertAlmostEqual(self.result.median, 1000 / 1e9 / 10)
+        self.assertEqual(self.result.stdev, 0.0)
+
+    def test_invalid_repeats(self) -> None:
+        """Test that running with no repeats raises a ValueError."""
+        with self.assertRaises(ValueError):
+            run_benchmark(benchmark=self.benchmark, repeats=0)
+
+
+class TestReports(unittest.TestCase):
+    """Test saving, loading and comparing benchmark reports."""
+
+    def setUp(self) -> None:
+        self.baseline = create_report(
+            results=[make_result("a", 1.0), make_result("b", 1.0)]
+        )
+        self.current = create_report(
+            results=[
+                make_result("a", 1.05),
+                make_result("b", 1.5),
+                make_result("c", 1.0),
+            ]
+        )
+
+    def test_save_and_load(self) -> None:
+        """Test that a saved report is loaded unchanged."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "results.json")
+            save_report(report=self.baseline, path=path)
+            self.assertEqual(load_report(path=path), self.baseline)
+
+    def test_header(self) -> None:
+        """Test that the header records the report version and environment."""
+        header = self.baseline["header"]
+        self.assertEqual(header["version"], pypinball.benchmark.REPORT_VERSION)
+        self.assertIn("python", header)
+        self.assertIn("commit", header)
+
+    def test_compare(self) -> None:
+        """Test that only the benchmarks slower than the threshold have regressed, and
+        that benchmarks missing from the baseline are skipped."""
+        comparisons = compare_reports(
+            baseline=self.baseline, current=self.current, threshold=0.1
+        )
+        self.assertEqual([c.name for c in comparisons], ["a", "b"])
+        self.assertEqual([c.regressed for c in comparisons], [False, True])
+        self.assertAlmostEqual(comparisons[1].ratio, 1.5)
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Test the benchmarks in the suite."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    def test_unique_names(self) -> None:
+        """Test that the benchmark names are unique."""
+        names = [b.name for b in get_benchmarks()]
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_benchmarks_run(self) -> None:
+        """Test that each benchmark can be set up and called."""
+        for benchmark in get_benchmarks():
+            with self.subTest(name=benchmark.name):
+                fn = benchmark.setup()
+                fn()
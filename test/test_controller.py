@@ -328,3 +328,81 @@ class TestLeftButtonPressed(unittest.TestCase):
         self.event_pub.emit.assert_any_call(
             event=pypinball.events.GameEvents.FLIPPER_ACTIVATED
         )
+
+
+class TestRunWithMaxTicks(unittest.TestCase):
+    """
+    Test running the Controller main loop for a limited number of ticks.
+    """
+
+    def setUp(self) -> None:
+        self.event_pub = pypinball.events.GameEventPublisher()
+        self.controller = pypinball.Controller(
+            config=MOC_SOUND_FILE_MAP,
+            display_interface=pypinball.display.NullDisplay(),
+            physics_interface=pypinball.physics.PymunkPhysics(
+                event_pub=self.event_pub, fps=60.0
+            ),
+            event_publisher=self.event_pub,
+        )
+        self.controller.setup()
+
+    def test_run_returns_number_of_ticks(self) -> None:
+        """Test that the run() method returns once the max ticks have been run."""
+        res = self.controller.run(max_ticks=10)
+        self.assertEqual(res, 10)
+        self.assertEqual(self.controller.tick_count, 10)
+
+    def test_run_stops_when_quit(self) -> None:
+        """Test that a QUIT event stops the loop before the max ticks are reached."""
+        self.event_pub.emit(event=pypinball.events.GameEvents.QUIT)
+        res = self.controller.run(max_ticks=10)
+        self.assertEqual(res, 0)
+
+
+class TestControllerProfiler(unittest.TestCase):
+    """Test the frame profiling of the Controller."""
+
+    def setUp(self) -> None:
+        self.event_pub = pypinball.events.GameEventPublisher()
+        self.display = unittest.mock.MagicMock(spec=pypinball.DisplayInterface)
+
+    def create_controller(self, show_overlay: bool) -> pypinball.Controller:
+        """Create a controller with an empty scene."""
+        return pypinball.Controller(
+            config=MOC_SOUND_FILE_MAP,
+            display_interface=self.display,
+            physics_interface=pypinball.physics.PymunkPhysics(
+                event_pub=self.event_pub, fps=60.0
+            ),
+            event_publisher=self.event_pub,
+            show_profiler_overlay=show_overlay,
+        )
+
+    def test_stages_timed(self) -> None:
+        """Test that each stage of every tick is timed."""
+        controller = self.create_controller(show_overlay=False)
+        for _ in range(3):
+            controller.tick()
+        stats = controller.profiler.get_stats()
+        self.assertEqual(stats.frames, 3)
+        self.assertEqual(
+            [s.name for s in stats.stages],
+            ["clear", "physics", "render", "hud", "display", "lost_balls"],
+        )
+        self.assertTrue(all(s.count == 3 for s in stats.stages))
+
+    def test_overlay_disabled(self) -> None:
+        """Test that the overlay is not drawn by default."""
+        controller = self.create_controller(show_overlay=False)
+        controller.tick()
+        self.display.draw_overlay.assert_not_called()
+
+    def test_overlay_enabled(self) -> None:
+        """Test that the overlay is drawn every tick, with the profiler statistics."""
+        controller = self.create_controller(show_overlay=True)
+        for _ in range(2):
+            controller.tick()
+        self.assertEqual(self.display.draw_overlay.call_count, 2)
+        lines = self.display.draw_overlay.call_args.kwargs["lines"]
+        self.assertIn("overruns", lines[0])
@@ -0,0 +1,118 @@
+import typing
+import unittest
+
+import pypinball
+from pypinball.frame_profiler import FrameProfiler, calculate_stage_stats
+
+
+class MockClock:
+    """Clock that returns a scripted sequence of times (in nanoseconds)."""
+
+    def __init__(self) -> None:
+        self.now = 0
+
+    def __call__(self) -> int:
+        return self.now
+
+    def advance(self, ms: float) -> None:
+        """Advance the clock by a number of milliseconds."""
+        self.now += int(ms * 1e6)
+
+
+class TestCalculateStageStats(unittest.TestCase):
+    """Test the calculate_stage_stats() method."""
+
+    def test_percentiles(self) -> None:
+        """Test the statistics of 1 ms to 100 ms."""
+        stats = calculate_stage_stats(
+            name="test", times_ns=[int(i * 1e6) for i in range(1, 101)]
+        )
+        self.assertEqual(stats.count, 100)
+        self.assertEqual(stats.last, 100.0)
+        self.assertAlmostEqual(stats.mean, 50.5)
+        self.assertAlmostEqual(stats.p50, 50.5)
+        self.assertAlmostEqual(stats.p95, 95.05)
+        self.assertAlmostEqual(stats.p99, 99.01)
+        self.assertEqual(stats.max, 100.0)
+
+    def test_empty(self) -> None:
+        """Test that the statistics of no times are all zero."""
+        stats = calculate_stage_stats(name="test", times_ns=[])
+        self.assertEqual(stats.count, 0)
+        self.assertEqual(stats.max, 0.0)
+
+
+class TestFrameProfiler(unittest.TestCase):
+    """Test the FrameProfiler class."""
+
+    def setUp(self) -> None:
+        self.clock = MockClock()
+        self.profiler = FrameProfiler(budget=0.010, window=4, clock=self.clock)
+
+    def run_frame(self, stage_times: typing.Dict[str, float]) -> None:
+        """Profile a frame with the given time (in ms) for each stage."""
+        self.profiler.begin_frame()
+        for name, ms in stage_times.items():
+            self.clock.advance(ms=ms)
+            self.profiler.mark(stage=name)
+        self.profiler.end_frame()
+
+    def test_stage_times(self) -> None:
+        """Test that the time of each stage is the time since the previous mark."""
+        self.run_frame(stage_times={"a": 1.0, "b": 2.5})
+        stats = self.profiler.get_stats()
+        self.assertEqual([s.name for s in stats.stages], ["a", "b"])
+        self.assertEqual(stats.stages[0].last, 1.0)
+        self.assertEqual(stats.stages[1].last, 2.5)
+        self.assertEqual(stats.frame.last, 3.5)
+
+    def test_overruns(self) -> None:
+        """Test that only the frames that take longer than the budget are counted as
+        overruns."""
+        self.run_frame(stage_times={"a": 5.0})
+        self.run_frame(stage_times={"a": 10.0})
+        self.run_frame(stage_times={"a": 8.0, "b": 4.0})
+        self.assertEqual(self.profiler.num_frames, 3)
+        self.assertEqual(self.profiler.num_overruns, 1)
+        self.assertEqual(self.profiler.get_stats().overruns, 1)
+
+    def test_window(self) -> None:
+        """Test that the statistics only cover the most recent frames."""
+        for i in range(10):
+            self.run_frame(stage_times={"a": float(i)})
+        stats = self.profiler.get_stats()
+        self.assertEqual(stats.frames, 10)
+        self.assertEqual(stats.frame.count, 4)
+        self.assertEqual(stats.stages[0].p50, 7.5)
+
+    def test_end_frame_without_begin(self) -> None:
+        """Test that ending a frame that was not started raises a RuntimeError."""
+        with self.assertRaises(RuntimeError):
+            self.profiler.end_frame()
+
+    def test_reset(self) -> None:
+        """Test that resetting clears the times and counters."""
+        self.run_frame(stage_times={"a": 20.0})
+        self.profiler.reset()
+        stats = self.profiler.get_stats()
+        self.assertEqual(stats.frames, 0)
+        self.assertEqual(stats.overruns, 0)
+        self.assertEqual(stats.stages, [])
+
+    def test_format_report(self) -> None:
+        """Test that the report has a line for the counters, the frame and each
+        stage."""
+        self.run_frame(stage_times={"physics": 1.0, "render": 2.0})
+        lines = self.profiler.format_report().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertIn("overruns: 0", lines[0])
+        self.assertIn("physics", lines[2])
+        self.assertIn("render", lines[3])
+
+
+class TestModuleExport(unittest.TestCase):
+    """Test that the module is exported by the package."""
+
+    def test_exported(self) -> None:
+        """Test that the frame_profiler module is accessible from pypinball."""
+        self.assertIs(pypinball.frame_profiler.FrameProfiler, FrameProfiler)
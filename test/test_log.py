@@ -2,7 +2,10 @@ import logging
 import os
 import random
 import shutil
+import tempfile
+import threading
 import unittest
+import unittest.mock
 
 import pypinball
 
@@ -40,6 +43,7 @@ class TestLoggerInitWithFilePath(unittest.TestCase):
             name=self.name, filename=self.filepath, level=logging.INFO
         )
         self.logger.critical("Testing...")
+        pypinball.log.flush()
 
     def tearDown(self) -> None:
         shutil.rmtree(self.logdir)
@@ -80,3 +84,187 @@ class TestSetGlobalLogLevel(unittest.TestCase):
     def test_logger_2_log_level(self) -> None:
         """Test that the level of logger 2 has been set to DEBUG"""
         self.assertEqual(pypinball.log.DEBUG, self._logger_2.level)
+
+
+class TestCustomFormatter(unittest.TestCase):
+    """Test the CustomFormatter class."""
+
+    def setUp(self) -> None:
+        self.formatter = pypinball.log.CustomFormatter()
+
+    def _make_record(self, level: int) -> logging.LogRecord:
+        return logging.LogRecord(
+            name="test",
+            level=level,
+            pathname=__file__,
+            lineno=1,
+            msg="Value: %d",
+            args=(42,),
+            exc_info=None,
+        )
+
+    def test_formats_message(self) -> None:
+        """Test that the message is formatted with its arguments, in the level color."""
+        output = self.formatter.format(self._make_record(level=logging.WARNING))
+        self.assertIn("[WARNING][test] - Value: 42", output)
+        self.assertTrue(output.startswith(pypinball.log.CustomFormatter.YELLOW))
+
+    def test_unknown_level(self) -> None:
+        """Test that a record with a custom level is formatted as just the message."""
+        output = self.formatter.format(self._make_record(level=25))
+        self.assertEqual(output, "Value: 42")
+
+    def test_formatters_are_reused(self) -> None:
+        """Test that formatting a record does not create a new logging.Formatter."""
+        with unittest.mock.patch("logging.Formatter.__init__") as mock_init:
+            self.formatter.format(self._make_record(level=logging.INFO))
+            mock_init.assert_not_called()
+
+
+class TestIsEnabled(unittest.TestCase):
+    """Test the is_enabled() method."""
+
+    def setUp(self) -> None:
+        self.logger = pypinball.log.get_logger(
+            name="test_is_enabled", level=pypinball.log.INFO
+        )
+
+    def test_logger_level(self) -> None:
+        """Test checking the levels of a specific logger."""
+        self.assertFalse(pypinball.log.is_enabled(pypinball.log.DEBUG, self.logger))
+        self.assertTrue(pypinball.log.is_enabled(pypinball.log.INFO, self.logger))
+
+    def test_level_change(self) -> None:
+        """Test that the check reflects a change of the logger level."""
+        self.logger.setLevel(pypinball.log.DEBUG)
+        self.assertTrue(pypinball.log.is_enabled(pypinball.log.DEBUG, self.logger))
+
+    def test_any_logger(self) -> None:
+        """Test checking whether any of the created loggers are enabled."""
+        self.assertTrue(pypinball.log.is_enabled(pypinball.log.CRITICAL))
+
+
+class BlockingHandler(logging.Handler):
+    """Handler that records the messages it handles, waiting on an event first."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.unblock = threading.Event()
+        self.messages = list()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.unblock.wait()
+        self.messages.append(record.getMessage())
+
+
+class TestLogQueue(unittest.TestCase):
+    """Test the LogQueue class."""
+
+    def setUp(self) -> None:
+        self.handler = BlockingHandler()
+        self.log_queue = pypinball.log.LogQueue(max_size=2)
+
+    def tearDown(self) -> None:
+        self.handler.unblock.set()
+        self.log_queue.close()
+
+    def _make_record(self, msg: str) -> logging.LogRecord:
+        return logging.LogRecord("test", logging.INFO, __file__, 1, msg, None, None)
+
+    def test_thread_started_on_first_record(self) -> None:
+        """Test that the worker thread is only started when a record is queued."""
+        num_threads = threading.active_count()
+        log_queue = pypinball.log.LogQueue()
+        self.assertEqual(threading.active_count(), num_threads)
+        self.handler.unblock.set()
+        log_queue.put(handler=self.handler, record=self._make_record("a"))
+        self.assertEqual(threading.active_count(), num_threads + 1)
+        log_queue.close()
+        self.assertEqual(self.handler.messages, ["a"])
+
+    def test_drops_when_full(self) -> None:
+        """Test that records are dropped and counted, without blocking, when the queue
+        is full."""
+        results = [
+            self.log_queue.put(handler=self.handler, record=self._make_record(str(i)))
+            for i in range(10)
+        ]
+        self.assertFalse(all(results))
+        self.assertEqual(self.log_queue.num_dropped, results.count(False))
+        self.handler.unblock.set()
+        self.assertTrue(self.log_queue.flush(timeout=5.0))
+        self.assertEqual(len(self.handler.messages), results.count(True))
+
+    def test_flush_timeout(self) -> None:
+        """Test that flushing times out while the handler is blocked."""
+        self.log_queue.put(handler=self.handler, record=self._make_record("a"))
+        self.assertFalse(self.log_queue.flush(timeout=0.05))
+
+    def test_close_writes_queued_records(self) -> None:
+        """Test that closing the queue writes the queued records, and that records put
+        afterwards are written straight away."""
+        self.log_queue.put(handler=self.handler, record=self._make_record("a"))
+        self.handler.unblock.set()
+        self.log_queue.close()
+        self.assertEqual(self.handler.messages, ["a"])
+        self.log_queue.put(handler=self.handler, record=self._make_record("b"))
+        self.assertEqual(self.handler.messages, ["a", "b"])
+
+
+class TestAsyncLogger(unittest.TestCase):
+    """Test logging via AsyncHandlers."""
+
+    def setUp(self) -> None:
+        self.handler = BlockingHandler()
+        self.handler.unblock.set()
+        self.logger = logging.getLogger("test_async_logger")
+        self.logger.handlers.clear()
+        self.logger.propagate = False
+        self.logger.addHandler(pypinball.log.AsyncHandler(handler=self.handler))
+
+    def test_default_handlers_are_async(self) -> None:
+        """Test that get_logger() uses asynchronous handlers by default."""
+        logger = pypinball.log.get_logger(name="test_default_async")
+        self.assertIsInstance(logger.handlers[0], pypinball.log.AsyncHandler)
+        logger = pypinball.log.get_logger(name="test_sync", asynchronous=False)
+        self.assertNotIsInstance(logger.handlers[0], pypinball.log.AsyncHandler)
+
+    def test_message_formatted_when_logged(self) -> None:
+        """Test that the message is formatted with the arguments as they were when it
+        was logged."""
+        values = [1]
+        self.logger.warning("Values: %s", values)
+        values.append(2)
+        self.assertTrue(pypinball.log.flush(timeout=5.0))
+        self.assertEqual(self.handler.messages, ["Values: [1]"])
+
+
+class TestFileRotation(unittest.TestCase):
+    """Test that log files are rotated by size."""
+
+    def setUp(self) -> None:
+        self.logdir = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.logdir, "test.log")
+        self.handler = pypinball.log.get_file_handler(
+            filename=self.filepath, max_bytes=1024, backup_count=2
+        )
+        self.logger = logging.getLogger("test_file_rotation")
+        self.logger.handlers.clear()
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+        for i in range(100):
+            self.logger.warning("Line %d", i)
+
+    def tearDown(self) -> None:
+        self.handler.close()
+        shutil.rmtree(self.logdir)
+
+    def test_backup_files(self) -> None:
+        """Test that the expected number of backup files are kept."""
+        self.assertEqual(
+            sorted(os.listdir(self.logdir)), ["test.log", "test.log.1", "test.log.2"]
+        )
+
+    def test_file_size(self) -> None:
+        """Test that the log file does not exceed the maximum size."""
+        self.assertLessEqual(os.path.getsize(self.filepath), 1024)
@@ -0,0 +1,205 @@
+import os
+import pstats
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+import pypinball
+from pypinball import profiling
+
+CONFIG = pypinball.GameConfig(
+    playing_area=(450, 650),
+    walls=[
+        pypinball.domain.Wall(
+            uid=0,
+            points=[
+                (0.0, 600.0),
+                (0.0, 10.0),
+                (440.0, 10.0),
+                (440.0, 600.0),
+                (0.0, 600.0),
+            ],
+        )
+    ],
+)
+
+FUNC_A = ("a.py", 1, "a")
+FUNC_B = ("b.py", 1, "b")
+FUNC_C = ("c.py", 1, "c")
+
+
+def _busy_wait(duration: float) -> None:
+    """Spin for a period of time, holding the GIL as much as possible."""
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        pass
+
+
+class TestScriptedSession(unittest.TestCase):
+    """Test the scripted session."""
+
+    def test_num_ticks(self) -> None:
+        """Test that the session runs for the requested number of ticks."""
+        session = profiling.create_scripted_session(
+            config=CONFIG, num_ticks=120, seed=3
+        )
+        self.assertEqual(session().ticks, 120)
+
+    def test_deterministic(self) -> None:
+        """Test that two sessions with the same seed make the same calls."""
+        call_counts = list()
+        for _ in range(2):
+            session = profiling.create_scripted_session(
+                config=CONFIG, num_ticks=120, seed=3
+            )
+            stats = profiling.profile_cprofile(fn=session)
+            call_counts.append(
+                {
+                    func: value[1]
+                    for func, value in stats.stats.items()  # type: ignore[attr-defined]
+                    if "pypinball" in func[0] and "log" not in func[0]
+                }
+            )
+        self.assertEqual(call_counts[0], call_counts[1])
+
+
+class TestSamplesToStats(unittest.TestCase):
+    """Test converting stack samples into profile statistics."""
+
+    def setUp(self) -> None:
+        self.stats = profiling.samples_to_stats(
+            samples={(FUNC_A, FUNC_B): 3, (FUNC_A, FUNC_C): 1, (FUNC_A,): 2},
+            interval=0.5,
+        ).stats  # type: ignore[attr-defined]
+
+    def test_cumulative_time(self) -> None:
+        """Test that the cumulative time includes every sample a function is in."""
+        self.assertAlmostEqual(self.stats[FUNC_A][3], 3.0)
+        self.assertAlmostEqual(self.stats[FUNC_B][3], 1.5)
+        self.assertAlmostEqual(self.stats[FUNC_C][3], 0.5)
+
+    def test_self_time(self) -> None:
+        """Test that the self time only includes the samples a function is innermost."""
+        self.assertAlmostEqual(self.stats[FUNC_A][2], 1.0)
+        self.assertAlmostEqual(self.stats[FUNC_B][2], 1.5)
+
+    def test_callers(self) -> None:
+        """Test that the caller of each function is recorded."""
+        self.assertEqual(self.stats[FUNC_A][4], dict())
+        self.assertEqual(self.stats[FUNC_B][4], {FUNC_A: (3, 3, 1.5, 1.5)})
+
+    def test_recursion(self) -> None:
+        """Test that a recursive function is only counted once per sample."""
+        stats = profiling.samples_to_stats(
+            samples={(FUNC_A, FUNC_A): 2}, interval=1.0
+        ).stats  # type: ignore[attr-defined]
+        self.assertAlmostEqual(stats[FUNC_A][3], 2.0)
+        self.assertAlmostEqual(stats[FUNC_A][2], 2.0)
+
+
+class TestStatsToCollapsedStacks(unittest.TestCase):
+    """Test converting profile statistics into collapsed stacks."""
+
+    def test_round_trip(self) -> None:
+        """Test that stacks that each function is only called from once are rebuilt
+        exactly."""
+        samples = {(FUNC_A, FUNC_B): 3, (FUNC_A, FUNC_C): 1, (FUNC_A,): 2}
+        stats = profiling.samples_to_stats(samples=samples, interval=1.0)
+        stacks = profiling.stats_to_collapsed_stacks(stats=stats)
+        self.assertEqual(stacks.keys(), samples.keys())
+        for stack, count in samples.items():
+            self.assertAlmostEqual(stacks[stack], count)
+
+    def test_shared_callee(self) -> None:
+        """Test that the time of a function called from several places is split between
+        the callers."""
+        samples = {(FUNC_A, FUNC_C): 3, (FUNC_B, FUNC_C): 1}
+        stats = profiling.samples_to_stats(samples=samples, interval=1.0)
+        stacks = profiling.stats_to_collapsed_stacks(stats=stats)
+        self.assertAlmostEqual(stacks[(FUNC_A, FUNC_C)], 3.0)
+        self.assertAlmostEqual(stacks[(FUNC_B, FUNC_C)], 1.0)
+
+
+class TestFormatFunction(unittest.TestCase):
+    """Test formatting a function as a frame of a collapsed stack."""
+
+    def test_function(self) -> None:
+        """Test that the file name is included without the directory."""
+        label = profiling.format_function(func=("/path/to/mod.py", 12, "method"))
+        self.assertEqual(label, "method (mod.py:12)")
+
+    def test_built_in(self) -> None:
+        """Test that a built-in function is just its name."""
+        label = profiling.format_function(func=("~", 0, "<built-in method len>"))
+        self.assertEqual(label, "<built-in method len>")
+
+    def test_semicolon(self) -> None:
+        """Test that semicolons are replaced, as they separate frames."""
+        label = profiling.format_function(func=("~", 0, "a;b"))
+        self.assertNotIn(";", label)
+
+
+class TestProfileSession(unittest.TestCase):
+    """Test profiling a session and writing the output files."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.mkdtemp()
+        self.prefix = os.path.join(self.tmp_dir, "profile")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp_dir)
+
+    def _check_outputs(self) -> None:
+        """Check that the pstats file can be loaded and the collapsed stacks file is
+        in the expected format."""
+        stats = pstats.Stats(f"{self.prefix}.prof")
+        self.assertTrue(stats.stats)  # type: ignore[attr-defined]
+
+        with open(f"{self.prefix}.collapsed", encoding="utf-8") as file:
+            lines = file.read().splitlines()
+        self.assertTrue(lines)
+        for line in lines:
+            stack, count = line.rsplit(" ", maxsplit=1)
+            self.assertTrue(stack)
+            self.assertGreater(int(count), 0)
+
+    def test_cprofile(self) -> None:
+        """Test profiling a session with cProfile."""
+        session = profiling.create_scripted_session(config=CONFIG, num_ticks=60)
+        profiling.profile_session(
+            session=session, output_prefix=self.prefix, mode="cprofile"
+        )
+        self._check_outputs()
+        with open(f"{self.prefix}.collapsed", encoding="utf-8") as file:
+            self.assertIn("tick (controller.py:", file.read())
+
+    def test_sample(self) -> None:
+        """Test profiling a method by sampling the stack."""
+        profiling.profile_session(
+            session=lambda: _busy_wait(duration=0.2),
+            output_prefix=self.prefix,
+            mode="sample",
+            interval=0.001,
+        )
+        self._check_outputs()
+        with open(f"{self.prefix}.collapsed", encoding="utf-8") as file:
+            self.assertIn("_busy_wait (test_profiling.py:", file.read())
+
+    def test_sample_restores_switch_interval(self) -> None:
+        """Test that the thread switch interval is restored after sampling."""
+        switch_interval = sys.getswitchinterval()
+        profiling.profile_sampling(fn=lambda: _busy_wait(duration=0.05), interval=1e-4)
+        self.assertEqual(sys.getswitchinterval(), switch_interval)
+
+    def test_unknown_mode(self) -> None:
+        """Test that an unknown mode raises an exception."""
+        with self.assertRaises(ValueError):
+            profiling.profile_session(
+                session=lambda: None, output_prefix=self.prefix, mode="unknown"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
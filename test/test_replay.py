@@ -0,0 +1,165 @@
+import collections
+import os
+import tempfile
+import time
+import typing
+import unittest
+
+import pypinball
+
+CONFIG = pypinball.config.DEFAULT_GAME_CONFIG
+
+
+class Session(typing.NamedTuple):
+    """Result of a recorded (or played back) session."""
+
+    recording: pypinball.replay.Recording
+    counts: typing.Counter
+    physics: pypinball.physics.PymunkPhysics
+    scorer: pypinball.scoring.Scoring
+
+
+def record_session(num_ticks: int, real_time: bool = False) -> Session:
+    """Record a headless session where the inputs are emitted via an
+    InputEventPublisher. If ``real_time`` is set the physics is advanced by the elapsed
+    time, and each frame is made to take a varying amount of time."""
+    event_pub = pypinball.events.GameEventPublisher()
+    counts = collections.Counter()
+    event_pub.subscribe(callback=lambda e: counts.update([e]))
+    scorer = pypinball.scoring.get_scorer(event_pub=event_pub)
+
+    physics = pypinball.physics.PymunkPhysics(
+        event_pub=event_pub,
+        fps=CONFIG.fames_per_second,
+        physics_hz=CONFIG.physics_hz,
+        max_steps_per_update=CONFIG.max_physics_steps_per_update,
+        real_time=real_time,
+        min_sub_steps=CONFIG.min_physics_sub_steps,
+        max_sub_steps=CONFIG.max_physics_sub_steps,
+        seed=9,
+    )
+    controller = pypinball.simulation.create_headless_controller(
+        config=CONFIG, event_pub=event_pub, physics=physics
+    )
+    recorder = pypinball.replay.InputRecorder(physics=physics, config=CONFIG)
+    input_pub = pypinball.inputs.InputEventPublisher()
+    input_pub.subscribe(callback=recorder.callback)
+    input_pub.subscribe(callback=controller.handle_input_event)
+
+    def _on_tick(tick: int) -> None:
+        recorder.on_tick(tick)
+        if real_time:
+            time.sleep(0.005 * (tick % 4))
+        if tick % 40 == 0:
+            input_pub.emit(event=pypinball.inputs.InputEvents.CENTER_BUTTON_PRESSED)
+        if tick % 25 == 0:
+            input_pub.emit(event=pypinball.inputs.InputEvents.LEFT_BUTTON_PRESSED)
+
+    controller.run(max_ticks=num_ticks, on_tick=_on_tick)
+    return Session(
+        recording=recorder.finish(), counts=counts, physics=physics, scorer=scorer
+    )
+
+
+def play_session(recording: pypinball.replay.Recording) -> Session:
+    """Play a recording back, counting the game events."""
+    event_pub = pypinball.events.GameEventPublisher()
+    counts = collections.Counter()
+    event_pub.subscribe(callback=lambda e: counts.update([e]))
+    scorer = pypinball.scoring.get_scorer(event_pub=event_pub)
+
+    physics = pypinball.replay.ReplayPhysics(recording=recording, event_pub=event_pub)
+    pypinball.replay.play_recording(
+        recording=recording, config=CONFIG, event_pub=event_pub, physics=physics
+    )
+    return Session(recording=recording, counts=counts, physics=physics, scorer=scorer)
+
+
+class TestInputRecorder(unittest.TestCase):
+    """Test recording input events stamped with the frame they took effect at."""
+
+    def test_events_stamped_with_frame(self) -> None:
+        """Test that each event is stamped with the frame it arrived at, and the steps
+        of each frame are recorded."""
+        recording = record_session(num_ticks=50).recording
+        self.assertEqual(recording.frame_steps, [5] * 50)
+        self.assertEqual(recording.num_steps, 250)
+        self.assertEqual(recording.header.seed, 9)
+        self.assertEqual(
+            recording.events[:3],
+            [
+                (0, pypinball.inputs.InputEvents.CENTER_BUTTON_PRESSED),
+                (0, pypinball.inputs.InputEvents.LEFT_BUTTON_PRESSED),
+                (25, pypinball.inputs.InputEvents.LEFT_BUTTON_PRESSED),
+            ],
+        )
+
+    def test_event_after_update(self) -> None:
+        """Test that an event that arrives after the physics update of a frame is
+        stamped with the next frame."""
+        event_pub = pypinball.events.GameEventPublisher()
+        physics = pypinball.simulation.create_headless_physics(
+            config=CONFIG, event_pub=event_pub
+        )
+        recorder = pypinball.replay.InputRecorder(physics=physics, config=CONFIG)
+        recorder.on_tick(0)
+        physics.update()
+        recorder.callback(event=pypinball.inputs.InputEvents.LEFT_BUTTON_PRESSED)
+        recording = recorder.finish()
+        self.assertEqual(
+            recording.events, [(1, pypinball.inputs.InputEvents.LEFT_BUTTON_PRESSED)]
+        )
+        self.assertEqual(recording.frame_steps, [5])
+
+    def test_save_and_load(self) -> None:
+        """Test that a recording is unchanged after saving and loading it."""
+        recording = record_session(num_ticks=50).recording
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "recording.json")
+            pypinball.replay.save_recording(recording=recording, path=path)
+            loaded = pypinball.replay.load_recording(path=path)
+        self.assertEqual(loaded, recording)
+
+
+class TestPlayRecording(unittest.TestCase):
+    """Test playing a recording back headless."""
+
+    def assertSameSession(self, session: Session, expected: Session) -> None:
+        """Assert that two sessions ended in the same state."""
+        self.assertEqual(session.counts, expected.counts)
+        self.assertEqual(session.scorer.current_score, expected.scorer.current_score)
+        self.assertEqual(session.physics.step_count, expected.physics.step_count)
+        self.assertEqual(
+            session.physics.get_ball_states(), expected.physics.get_ball_states()
+        )
+
+    def test_playback_reproduces_session(self) -> None:
+        """Test that playing back a recording gives the same game events."""
+        expected = record_session(num_ticks=300)
+        session = play_session(recording=expected.recording)
+        self.assertSameSession(session=session, expected=expected)
+        self.assertAlmostEqual(
+            session.physics.step_count * session.physics.step_time, 5.0
+        )
+
+    def test_playback_reproduces_real_time_session(self) -> None:
+        """Test that playing back a session recorded with real time physics, which runs
+        a varying number of physics steps per frame, reaches the same final state."""
+        expected = record_session(num_ticks=120, real_time=True)
+        self.assertGreater(len(set(expected.recording.frame_steps)), 1)
+
+        session = play_session(recording=expected.recording)
+        self.assertSameSession(session=session, expected=expected)
+
+    def test_playback_frame_cadence(self) -> None:
+        """Test that the controller is ticked once per recorded frame rather than once
+        per physics step."""
+        recording = record_session(num_ticks=30).recording
+        self.assertEqual(recording.header.fps, CONFIG.fames_per_second)
+        self.assertEqual(
+            recording.header.max_steps_per_update,
+            CONFIG.max_physics_steps_per_update,
+        )
+
+        stats = pypinball.replay.play_recording(recording=recording, config=CONFIG)
+        self.assertEqual(stats.ticks, 30)
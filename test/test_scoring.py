@@ -81,3 +81,33 @@ class TestResetScore(unittest.TestCase):
         self.score.set_score(10)
         self.score.reset()
         self.assertEqual(self.score.current_score, 0)
+
+
+class TestBatchScoring(unittest.TestCase):
+    """Test the ``Scoring.batch_callback()`` method with a batch subscription."""
+
+    def setUp(self) -> None:
+        self.event_pub = pypinball.events.GameEventPublisher()
+        self.scorer = pypinball.scoring.Scoring()
+        self.event_pub.subscribe_batch(callback=self.scorer.batch_callback)
+
+    def test_score_updated_at_end_of_batch(self) -> None:
+        """Test that the score is updated once the batch of events is delivered."""
+        self.scorer.set_multiplier(value=2.0)
+        with self.event_pub.batch():
+            for _ in range(3):
+                self.event_pub.emit(
+                    event=pypinball.events.GameEvents.COLLISION_BALL_BUMPER
+                )
+            self.event_pub.emit(event=pypinball.events.GameEvents.COLLISION_BALL_WALL)
+            self.assertEqual(self.scorer.current_score, 0)
+        self.assertEqual(self.scorer.current_score, 6)
+
+    def test_matches_event_callback(self) -> None:
+        """Test that a batch gives the same score as delivering each event."""
+        events = [random.choice(list(pypinball.events.GameEvents)) for _ in range(50)]
+        expected = pypinball.scoring.Scoring()
+        for event in events:
+            expected.event_callback(event=event)
+        self.scorer.batch_callback(events=events)
+        self.assertEqual(self.scorer.current_score, expected.current_score)
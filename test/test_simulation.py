@@ -0,0 +1,192 @@
+import unittest
+import unittest.mock
+
+import pypinball
+
+CONFIG = pypinball.GameConfig(
+    playing_area=(450, 650),
+    walls=[
+        pypinball.domain.Wall(
+            uid=0,
+            points=[
+                (0.0, 600.0),
+                (0.0, 10.0),
+                (440.0, 10.0),
+                (440.0, 600.0),
+                (0.0, 600.0),
+            ],
+        )
+    ],
+)
+
+
+class TestSimulationStats(unittest.TestCase):
+    """Test the SimulationStats dataclass."""
+
+    def test_realtime_factor(self) -> None:
+        """Test the simulated seconds per wall second calculation."""
+        stats = pypinball.simulation.SimulationStats(
+            ticks=600, simulated_seconds=10.0, wall_seconds=0.5
+        )
+        self.assertAlmostEqual(stats.realtime_factor, 20.0)
+
+    def test_realtime_factor_zero_wall_time(self) -> None:
+        """Test that a zero wall time does not raise an exception."""
+        stats = pypinball.simulation.SimulationStats(
+            ticks=0, simulated_seconds=0.0, wall_seconds=0.0
+        )
+        self.assertEqual(stats.realtime_factor, float("inf"))
+
+
+class TestRunHeadless(unittest.TestCase):
+    """Test running a headless simulation with an automatically launched ball."""
+
+    def setUp(self) -> None:
+        self.event_pub = pypinball.events.GameEventPublisher()
+        self.controller = pypinball.simulation.create_headless_controller(
+            config=CONFIG, event_pub=self.event_pub
+        )
+        pypinball.simulation.enable_auto_launch(
+            controller=self.controller, event_pub=self.event_pub
+        )
+        self.stats = pypinball.simulation.run_headless(
+            controller=self.controller, num_ticks=120, fps=60.0
+        )
+
+    def test_num_ticks(self) -> None:
+        """Test that the requested number of ticks were run."""
+        self.assertEqual(self.stats.ticks, 120)
+        self.assertEqual(self.controller.tick_count, 120)
+
+    def test_simulated_seconds(self) -> None:
+        """Test that the simulated time is calculated from the frame rate."""
+        self.assertAlmostEqual(self.stats.simulated_seconds, 2.0)
+
+    def test_faster_than_real_time(self) -> None:
+        """Test that the simulation is not limited by the frame rate."""
+        self.assertGreater(self.stats.realtime_factor, 1.0)
+
+
+class TestScriptPlayer(unittest.TestCase):
+    """Test passing scripted input events to a controller."""
+
+    def test_events_delivered_on_tick(self) -> None:
+        """Test that each event is passed to the controller on its scheduled tick."""
+        controller = unittest.mock.MagicMock()
+        on_tick = pypinball.simulation.make_script_player(
+            controller=controller,
+            script=[
+                (0, pypinball.inputs.InputEvents.LEFT_BUTTON_PRESSED),
+                (2, pypinball.inputs.InputEvents.RIGHT_BUTTON_PRESSED),
+            ],
+        )
+
+        on_tick(1)
+        controller.handle_input_event.assert_not_called()
+        on_tick(2)
+        controller.handle_input_event.assert_called_once_with(
+            event=pypinball.inputs.InputEvents.RIGHT_BUTTON_PRESSED
+        )
+
+    def test_flipper_script(self) -> None:
+        """Test that both flippers are actuated once per period."""
+        script = pypinball.simulation.make_flipper_script(num_ticks=100, period=50)
+        self.assertEqual([tick for tick, _ in script], [0, 0, 50, 50])
+
+
+class TestSimulateTable(unittest.TestCase):
+    """Test simulating a single table."""
+
+    def test_deterministic(self) -> None:
+        """Test that simulating a table twice with the same seed gives the same result."""
+        script = pypinball.simulation.make_flipper_script(num_ticks=120)
+        results = [
+            pypinball.simulation.simulate_table(
+                config=CONFIG, seed=3, num_ticks=120, script=script
+            )
+            for _ in range(2)
+        ]
+        self.assertEqual(results[0].score, results[1].score)
+        self.assertEqual(results[0].lives_lost, results[1].lives_lost)
+        self.assertEqual(results[0].collisions, results[1].collisions)
+        self.assertEqual(results[0].stats.ticks, 120)
+
+
+class TestRunTables(unittest.TestCase):
+    """Test simulating multiple tables in parallel."""
+
+    def test_all_tables_returned(self) -> None:
+        """Test that a result is yielded for each table with the expected seed."""
+        results = list(
+            pypinball.simulation.run_tables(
+                config=CONFIG, num_tables=2, num_ticks=60, base_seed=10, max_workers=2
+            )
+        )
+        results.sort(key=lambda r: r.table_index)
+        self.assertEqual([r.table_index for r in results], [0, 1])
+        self.assertEqual([r.seed for r in results], [10, 11])
+
+
+class TestSummariseResults(unittest.TestCase):
+    """Test aggregating the results of multiple tables."""
+
+    def test_summary(self) -> None:
+        """Test the totals and means of the aggregated results."""
+        stats = pypinball.simulation.SimulationStats(
+            ticks=1, simulated_seconds=1.0, wall_seconds=1.0
+        )
+        results = [
+            pypinball.simulation.TableResult(
+                table_index=0,
+                seed=0,
+                score=10,
+                lives_lost=1,
+                collisions={"COLLISION_BALL_BUMPER": 10},
+                stats=stats,
+            ),
+            pypinball.simulation.TableResult(
+                table_index=1,
+                seed=1,
+                score=20,
+                lives_lost=2,
+                collisions={"COLLISION_BALL_BUMPER": 20, "COLLISION_BALL_BALL": 1},
+                stats=stats,
+            ),
+        ]
+        summary = pypinball.simulation.summarise_results(results=results)
+        self.assertEqual(summary.num_tables, 2)
+        self.assertAlmostEqual(summary.mean_score, 15.0)
+        self.assertEqual(summary.max_score, 20)
+        self.assertEqual(summary.lives_lost, 3)
+        self.assertEqual(
+            summary.collisions,
+            {"COLLISION_BALL_BUMPER": 30, "COLLISION_BALL_BALL": 1},
+        )
+
+    def test_empty(self) -> None:
+        """Test that summarising no results does not raise an exception."""
+        summary = pypinball.simulation.summarise_results(results=[])
+        self.assertEqual(summary.num_tables, 0)
+
+
+class TestRunHeader(unittest.TestCase):
+    """Test recording the settings of a run in a header."""
+
+    def test_seed_from_config(self) -> None:
+        """Test that the seed in the GameConfig is used by the physics and recorded."""
+        config = pypinball.GameConfig(playing_area=(450, 650), seed=123)
+        physics = pypinball.simulation.create_headless_physics(
+            config=config, event_pub=pypinball.events.GameEventPublisher()
+        )
+        header = pypinball.simulation.create_run_header(config=config, physics=physics)
+        self.assertEqual(header.seed, 123)
+        self.assertEqual(header.to_dict()["seed"], 123)
+        self.assertEqual(header.physics_hz, config.physics_hz)
+
+    def test_seed_override(self) -> None:
+        """Test that an explicit seed takes priority over the GameConfig."""
+        config = pypinball.GameConfig(playing_area=(450, 650), seed=123)
+        physics = pypinball.simulation.create_headless_physics(
+            config=config, event_pub=pypinball.events.GameEventPublisher(), seed=5
+        )
+        self.assertEqual(physics.seed, 5)
@@ -2,6 +2,8 @@ import random
 import unittest
 import unittest.mock
 
+import numpy
+
 import pypinball
 
 
@@ -9,6 +11,9 @@ class MockDisplay(pypinball.DisplayInterface):
     """Mock DisplayInterface class to be used to unit-testing purposes."""
 
     def __init__(self) -> None:
+        self.begin_static_layer = unittest.mock.MagicMock(return_value=True)
+        self.end_static_layer = unittest.mock.MagicMock()
+        self.draw_static_layer = unittest.mock.MagicMock()
         self.draw_background = unittest.mock.MagicMock()
         self.draw_ball = unittest.mock.MagicMock()
         self.draw_flipper = unittest.mock.MagicMock()
@@ -21,7 +26,10 @@ class MockPhysics(pypinball.PhysicsInterface):
 
     def __init__(self) -> None:
         self.get_ball_states = unittest.mock.MagicMock()
+        self.get_ball_state_arrays = unittest.mock.MagicMock()
+        self.get_interpolation_alpha = unittest.mock.MagicMock(return_value=1.0)
         self.get_bumper_states = unittest.mock.MagicMock()
+        self.get_bumper_revision = unittest.mock.MagicMock(return_value=0)
         self.get_flipper_states = unittest.mock.MagicMock()
 
 
@@ -126,6 +134,86 @@ class TestRenderPhysicsBalls(unittest.TestCase):
         self.assertEqual(self.display.draw_ball.call_count, n)
 
 
+class TestFindBallsOutsideArea(unittest.TestCase):
+    """Test the utils.find_balls_outside_area() method."""
+
+    def setUp(self) -> None:
+        self.balls = pypinball.domain.BallStateArrays(
+            uids=numpy.array([0, 1, 2, 3, 4]),
+            positions=numpy.array(
+                [[10.0, 10.0], [10.0, -10.0], [110.0, 10.0], [50.0, 50.0], [-1, 200]]
+            ),
+            velocities=numpy.zeros(shape=(5, 2)),
+            radii=numpy.full(shape=(5,), fill_value=10.0),
+        )
+
+    def test_balls_outside_area(self) -> None:
+        """Test that only the UIDs of the balls outside of the area are returned."""
+        res = pypinball.utils.find_balls_outside_area(
+            balls=self.balls, width=100, height=100
+        )
+        self.assertListEqual(res.tolist(), [1, 2, 4])
+
+    def test_no_balls(self) -> None:
+        """Test that an empty snapshot returns an empty array."""
+        balls = pypinball.domain.BallStateArrays(
+            uids=numpy.zeros(shape=(0,)),
+            positions=numpy.zeros(shape=(0, 2)),
+            velocities=numpy.zeros(shape=(0, 2)),
+            radii=numpy.zeros(shape=(0,)),
+        )
+        res = pypinball.utils.find_balls_outside_area(
+            balls=balls, width=100, height=100
+        )
+        self.assertEqual(len(res), 0)
+
+
+class TestInterpolateBallPositions(unittest.TestCase):
+    """Test the utils.interpolate_ball_positions() method."""
+
+    def setUp(self) -> None:
+        self.balls = pypinball.domain.BallStateArrays(
+            uids=numpy.array([0]),
+            positions=numpy.array([[10.0, 20.0]]),
+            velocities=numpy.zeros(shape=(1, 2)),
+            radii=numpy.array([5.0]),
+            previous_positions=numpy.array([[0.0, 10.0]]),
+        )
+
+    def test_interpolate_half_way(self) -> None:
+        """Test interpolating half way between the previous and current positions."""
+        res = pypinball.utils.interpolate_ball_positions(balls=self.balls, alpha=0.5)
+        self.assertListEqual(res.tolist(), [[5.0, 15.0]])
+
+    def test_no_previous_positions(self) -> None:
+        """Test that the current positions are used if there are no previous ones."""
+        self.balls.previous_positions = None
+        res = pypinball.utils.interpolate_ball_positions(balls=self.balls, alpha=0.5)
+        self.assertListEqual(res.tolist(), [[10.0, 20.0]])
+
+
+class TestRenderPhysicsBallArrays(unittest.TestCase):
+    """Test the utils.render_physics_ball_arrays() method."""
+
+    def setUp(self) -> None:
+        self.display = MockDisplay()
+
+    def test_render_multiple_balls(self) -> None:
+        """Test that the display is called once for each ball with the diameter."""
+        n = random.randint(1, 100)
+        balls = pypinball.domain.BallStateArrays(
+            uids=numpy.arange(n),
+            positions=numpy.zeros(shape=(n, 2)),
+            velocities=numpy.zeros(shape=(n, 2)),
+            radii=numpy.full(shape=(n,), fill_value=10.0),
+        )
+        pypinball.utils.render_physics_ball_arrays(balls, self.display)
+        self.assertEqual(self.display.draw_ball.call_count, n)
+        self.display.draw_ball.assert_called_with(
+            pos=(0.0, 0.0), diameter=20.0, alpha=1.0
+        )
+
+
 class TestRenderPhysicsBumpers(unittest.TestCase):
     """Test the utils.render_physics_bumpers() method."""
 
@@ -198,7 +286,12 @@ class TestRenderPhysicsState(unittest.TestCase):
     """Test the pypinball.utils.render_phyiscs_state() method."""
 
     def setUp(self) -> None:
-        ball = pypinball.domain.BallState(uid=0, position=(10, 10), radius=20)
+        balls = pypinball.domain.BallStateArrays(
+            uids=numpy.array([0]),
+            positions=numpy.array([[10.0, 10.0]]),
+            velocities=numpy.array([[0.0, 0.0]]),
+            radii=numpy.array([20.0]),
+        )
         flipper = pypinball.domain.FlipperState(
             uid=1, angle=0.0, position=(10, 20), length=10
         )
@@ -208,7 +301,7 @@ class TestRenderPhysicsState(unittest.TestCase):
         )
 
         self.physics = MockPhysics()
-        self.physics.get_ball_states.return_value = [ball]
+        self.physics.get_ball_state_arrays.return_value = balls
         self.physics.get_bumper_states.return_value = [round_bumper, rect_bumper]
         self.physics.get_flipper_states.return_value = [flipper]
 
@@ -223,6 +316,61 @@ class TestRenderPhysicsState(unittest.TestCase):
         self.display.draw_flipper.assert_called_once()
         self.display.draw_rectangle_bumper.assert_called_once()
         self.display.draw_round_bumper.assert_called_once()
+        self.display.draw_static_layer.assert_called_once()
+
+
+class TestPreloadFlippers(unittest.TestCase):
+    """Test the pypinball.utils.preload_flippers() method."""
+
+    def test_range_of_motion(self) -> None:
+        """Test that each flipper is preloaded between its rest and actuated angles."""
+        display = unittest.mock.MagicMock(spec=pypinball.DisplayInterface)
+        flippers = pypinball.config.DEFAULT_GAME_CONFIG.flippers
+        pypinball.utils.preload_flippers(flippers=flippers, display=display)
+
+        self.assertEqual(display.preload_flipper.call_count, len(flippers))
+        for flipper, call in zip(flippers, display.preload_flipper.call_args_list):
+            config = flipper.config
+            self.assertEqual(call.kwargs["uid"], flipper.uid)
+            self.assertEqual(
+                call.kwargs["size"],
+                (config.length, config.length * pypinball.utils.FLIPPER_HEIGHT_RATIO),
+            )
+            self.assertAlmostEqual(
+                call.kwargs["max_angle"] - call.kwargs["min_angle"],
+                abs(config.actuation_angle),
+            )
+
+
+class TestRenderStaticLayer(unittest.TestCase):
+    """Test the pypinball.utils.render_static_layer() method."""
+
+    def setUp(self) -> None:
+        self.physics = MockPhysics()
+        self.physics.get_bumper_revision.return_value = 3
+        self.physics.get_bumper_states.return_value = [
+            pypinball.domain.RoundBumper(uid=2, position=(20, 20), radius=15)
+        ]
+        self.display = MockDisplay()
+
+    def test_layer_rendered(self) -> None:
+        """Test that the background and bumpers are drawn into the static layer when
+        the display needs it rendering."""
+        pypinball.utils.render_static_layer(physics=self.physics, display=self.display)
+        self.display.begin_static_layer.assert_called_once_with(revision=3)
+        self.display.draw_background.assert_called_once()
+        self.display.draw_round_bumper.assert_called_once()
+        self.display.end_static_layer.assert_called_once()
+        self.display.draw_static_layer.assert_called_once()
+
+    def test_layer_reused(self) -> None:
+        """Test that the bumpers are not queried when the static layer is up to date."""
+        self.display.begin_static_layer.return_value = False
+        pypinball.utils.render_static_layer(physics=self.physics, display=self.display)
+        self.physics.get_bumper_states.assert_not_called()
+        self.display.draw_background.assert_not_called()
+        self.display.end_static_layer.assert_not_called()
+        self.display.draw_static_layer.assert_called_once()
 
 
 class TestRenderScoreAndLives(unittest.TestCase):